@@ -23,6 +23,7 @@ from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.middleware import (
     AuthAwareWSGIMiddleware,
     AuthMiddleware,
+    HealthCheckMiddleware,
     ProxyHeadersMiddleware,
     WorkspaceContextMiddleware,
     add_fastapi_permission_middleware,
@@ -171,17 +172,20 @@ def create_app() -> Any:
     # ---------------------------------------------------------------------------
     # Middleware ordering (Starlette executes LAST-added as OUTERMOST):
     #
-    #   Request → Session → WorkspaceContext → Auth → ProxyHeaders
+    #   Request → HealthCheck → Session → WorkspaceContext → Auth → ProxyHeaders
     #             → PermissionMiddleware → route handler
     #
     # PermissionMiddleware MUST be added FIRST (innermost) so it runs AFTER
     # AuthMiddleware has set request.state.username / is_admin.
+    # HealthCheckMiddleware is added LAST (outermost) so Kubernetes probes are
+    # answered before any of the other middleware runs.
     # ---------------------------------------------------------------------------
     add_fastapi_permission_middleware(oidc_app)
     oidc_app.add_middleware(ProxyHeadersMiddleware)
     oidc_app.add_middleware(AuthMiddleware)
     oidc_app.add_middleware(WorkspaceContextMiddleware)
     oidc_app.add_middleware(StarletteSessionMiddleware, secret_key=config.SECRET_KEY)
+    oidc_app.add_middleware(HealthCheckMiddleware)
 
     for router in get_all_routers():
         oidc_app.include_router(router)
@@ -96,6 +96,9 @@ class AppConfig:
         # Permission cache settings
         self.PERMISSION_CACHE_TTL_SECONDS = config_manager.get_int("PERMISSION_CACHE_TTL_SECONDS", default=30)
 
+        # Readiness probe cache settings
+        self.HEALTH_READY_CACHE_TTL_SECONDS = config_manager.get_int("HEALTH_READY_CACHE_TTL_SECONDS", default=5)
+
         # Group settings
         self.OIDC_GROUP_NAME = config_manager.get_list("OIDC_GROUP_NAME", default=["mlflow"])
         self.OIDC_ADMIN_GROUP_NAME = config_manager.get_list("OIDC_ADMIN_GROUP_NAME", default=["mlflow-admin"])
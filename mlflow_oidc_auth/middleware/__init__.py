@@ -12,6 +12,7 @@ from mlflow_oidc_auth.middleware.auth_aware_wsgi_middleware import (
 from mlflow_oidc_auth.middleware.fastapi_permission_middleware import (
     add_fastapi_permission_middleware,
 )
+from mlflow_oidc_auth.middleware.health_check_middleware import HealthCheckMiddleware
 from mlflow_oidc_auth.middleware.proxy_headers_middleware import ProxyHeadersMiddleware
 from mlflow_oidc_auth.middleware.workspace_context_middleware import (
     WorkspaceContextMiddleware,
@@ -20,6 +21,7 @@ from mlflow_oidc_auth.middleware.workspace_context_middleware import (
 __all__ = [
     "AuthMiddleware",
     "AuthAwareWSGIMiddleware",
+    "HealthCheckMiddleware",
     "ProxyHeadersMiddleware",
     "WorkspaceContextMiddleware",
     "add_fastapi_permission_middleware",
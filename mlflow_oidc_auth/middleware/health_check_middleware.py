@@ -0,0 +1,82 @@
+"""
+Health Check Middleware for FastAPI.
+
+Kubernetes fires liveness, readiness and startup probes every few seconds per
+replica. Routing them through the session, workspace, auth and proxy-header
+middleware stack costs a task group and a request/response wrap per layer for
+endpoints that need none of it. This pure ASGI middleware sits outermost and
+answers the probe paths directly using the handlers from the health router.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from mlflow_oidc_auth.routers import health
+from mlflow_oidc_auth.routers._prefix import HEALTH_CHECK_ROUTER_PREFIX
+
+_METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+
+_LIVE_PATH = f"{HEALTH_CHECK_ROUTER_PREFIX}/live"
+_LIVE_ETAG = health.LIVE_ETAG.encode()
+
+# Probe paths are fixed, so an exact-match lookup replaces regex route matching.
+_HANDLERS = {
+    HEALTH_CHECK_ROUTER_PREFIX: health.health_check_root,
+    _LIVE_PATH: health.health_check_live,
+    f"{HEALTH_CHECK_ROUTER_PREFIX}/ready": health.health_check_ready,
+    f"{HEALTH_CHECK_ROUTER_PREFIX}/startup": health.health_check_startup,
+}
+
+
+class HealthCheckMiddleware:
+    """
+    Pure ASGI middleware that short-circuits health probe requests.
+
+    GET requests to the health endpoints are served by the health router
+    handlers without entering the rest of the middleware stack. Other methods
+    receive a 405 with ``Allow: GET``, matching the router's behaviour. A
+    liveness probe revalidating with a matching ``If-None-Match`` gets an empty
+    304. All other requests, and non-HTTP scopes, are passed through unchanged.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        handler = _HANDLERS.get(scope["path"])
+        if handler is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] != "GET":
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 405,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(_METHOD_NOT_ALLOWED_BODY)).encode()),
+                        (b"allow", b"GET"),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": _METHOD_NOT_ALLOWED_BODY})
+            return
+
+        if scope["path"] == _LIVE_PATH and _if_none_match(scope) == _LIVE_ETAG:
+            await send({"type": "http.response.start", "status": 304, "headers": [(b"etag", _LIVE_ETAG)]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        response = await handler()
+        await response(scope, receive, send)
+
+
+def _if_none_match(scope: Scope) -> bytes | None:
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            return value
+    return None
@@ -77,6 +77,21 @@ class ScorerPermissionRepository(BaseUserPermissionRepository[SqlScorerPermissio
             perm = self._get_permission(session, experiment_id, scorer_name, username)
             return perm.to_mlflow_entity()
 
+    def list_users_for_scorer(self, experiment_id: str, scorer_name: str) -> List[tuple[str, str, bool]]:
+        """List users that have explicit permissions for a scorer.
+
+        Returns tuples of (username, permission, is_service_account).
+        """
+        with self._Session() as session:
+            rows = (
+                session.query(SqlUser.username, SqlScorerPermission.permission, SqlUser.is_service_account)
+                .join(SqlScorerPermission, SqlScorerPermission.user_id == SqlUser.id)
+                .filter(SqlScorerPermission.experiment_id == experiment_id)
+                .filter(SqlScorerPermission.scorer_name == scorer_name)
+                .all()
+            )
+            return [(str(username), str(permission), bool(is_service_account)) for username, permission, is_service_account in rows]
+
     def update_permission(self, experiment_id: str, scorer_name: str, username: str, permission: str) -> ScorerPermission:  # type: ignore[override]
         _validate_permission(permission)
         with self._Session() as session:
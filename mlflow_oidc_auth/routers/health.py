@@ -4,9 +4,16 @@ This module provides health check endpoints suitable for Kubernetes liveness,
 readiness, and startup probes in multi-replica deployments.
 """
 
+import asyncio
+import json
+import threading
+import time
+
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.oauth import is_oidc_configured
 from mlflow_oidc_auth.store import store
 
@@ -18,9 +25,66 @@ health_check_router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+logger = get_logger()
+
+
+def _json_body(content: dict) -> bytes:
+    """Serialize content the way JSONResponse renders it."""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+# Bodies for the probes whose payload never changes are serialized once at
+# import time instead of on every request.
+_ROOT_BODY = _json_body({"status": "ok"})
+_LIVE_BODY = _json_body({"status": "live"})
+# The live payload never changes, so it carries a fixed ETag that lets probes
+# revalidate with If-None-Match (answered with a 304 by HealthCheckMiddleware).
+LIVE_ETAG = '"live-v1"'
+_STARTED_BODY = _json_body({"status": "started", "oidc_initialized": True})
+_INITIALIZING_BODY = _json_body(
+    {
+        "status": "initializing",
+        "oidc_initialized": False,
+        "message": "OIDC client not yet initialized. Check OIDC configuration.",
+    }
+)
+
+
+def _ready_body(oidc: bool, database: bool) -> bytes:
+    """Serialize the readiness payload for one combination of check results."""
+    ready = oidc and database
+    return _json_body({"status": "ready" if ready else "not_ready", "checks": {"oidc": oidc, "database": database}})
+
+
+# Every readiness outcome is one of four check combinations, keyed by
+# (oidc, database), plus the stale variant of the ready payload.
+_READY_BODIES = {(oidc, database): _ready_body(oidc, database) for oidc in (True, False) for database in (True, False)}
+_READY_STALE_BODY = _json_body({"status": "ready", "checks": {"oidc": True, "database": True}, "stale": True})
+
+# Readiness probes fire every few seconds per replica; reuse the last result
+# for a short window so the database is not pinged on every probe. The entry is
+# an immutable (expires_at, status_code, body) tuple replaced wholesale, so
+# probes read it without locking; the lock only elects a single refresher.
+_ready_entry: tuple[float, int, bytes] | None = None
+_ready_refresh_lock = threading.Lock()
+
+# A wedged database connection must not hang the probe. When the ping times
+# out, a successful result from the last _READY_STALE_TTL_SECONDS is served
+# instead so a slow database does not immediately pull the pod from service.
+_READY_PING_TIMEOUT_SECONDS = 0.5
+_READY_STALE_TTL_SECONDS = 30
+_last_ready_at: float | None = None
+
+
+def _reset_ready_cache() -> None:
+    """Drop the cached and last-known-good readiness results (used by tests)."""
+    global _ready_entry, _last_ready_at
+    _ready_entry = None
+    _last_ready_at = None
+
 
 @health_check_router.get("")
-async def health_check_root() -> JSONResponse:
+async def health_check_root() -> Response:
     """Health check endpoint root.
 
     Many deployment environments probe `/health` by default. We serve it here
@@ -29,11 +93,11 @@ async def health_check_root() -> JSONResponse:
     Returns:
         JSON response with basic status.
     """
-    return JSONResponse(content={"status": "ok"})
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @health_check_router.get("/ready")
-async def health_check_ready() -> JSONResponse:
+async def health_check_ready() -> Response:
     """Readiness probe endpoint for Kubernetes.
 
     Verifies that the application is ready to accept traffic by checking:
@@ -44,44 +108,78 @@ async def health_check_ready() -> JSONResponse:
     should receive traffic. A pod that fails readiness will be removed from
     the service load balancer until it passes.
 
+    The result is cached for ``HEALTH_READY_CACHE_TTL_SECONDS``. Once it
+    expires a single probe refreshes it while concurrent probes keep serving
+    the previous result instead of each pinging the database.
+
     Returns:
         200 with status if ready, 503 if not ready.
     """
-    checks = {
-        "oidc": False,
-        "database": False,
-    }
-    all_ready = True
+    global _ready_entry
 
-    # Check OIDC client registration
+    entry = _ready_entry
+    if entry is not None and time.monotonic() < entry[0]:
+        return _ready_response(entry[1], entry[2])
+
+    # Never block here: the refresher awaits while holding the lock, and a
+    # blocking acquire on the same event loop would deadlock.
+    if not _ready_refresh_lock.acquire(blocking=False):
+        if entry is not None:
+            return _ready_response(entry[1], entry[2])
+        return _ready_response(*await _run_ready_checks())
+
+    try:
+        status_code, body = await _run_ready_checks()
+        _ready_entry = (time.monotonic() + config.HEALTH_READY_CACHE_TTL_SECONDS, status_code, body)
+    finally:
+        _ready_refresh_lock.release()
+    return _ready_response(status_code, body)
+
+
+def _ready_response(status_code: int, body: bytes) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+async def _run_ready_checks() -> tuple[int, bytes]:
+    """Run the OIDC and database readiness checks.
+
+    The database ping runs in a worker thread bounded by
+    ``_READY_PING_TIMEOUT_SECONDS``. On timeout the last successful result is
+    returned with ``"stale": true`` if it is recent enough, otherwise the
+    database check fails.
+
+    Returns:
+        Tuple of HTTP status code and pre-serialized response body.
+    """
+    global _last_ready_at
+
+    # Check OIDC client registration. Once registered this is a flag read; it is
+    # deliberately not cached at startup because until then each call retries
+    # registration, which lets a pod whose IdP was unreachable at boot recover.
     try:
-        checks["oidc"] = is_oidc_configured()
-        if not checks["oidc"]:
-            all_ready = False
+        oidc = bool(is_oidc_configured())
     except Exception:
-        all_ready = False
+        oidc = False
 
     # Check database connectivity
     try:
-        checks["database"] = store.ping()
-        if not checks["database"]:
-            all_ready = False
+        database = bool(await asyncio.wait_for(asyncio.to_thread(store.ping), timeout=_READY_PING_TIMEOUT_SECONDS))
+    except asyncio.TimeoutError:
+        logger.warning(f"Readiness database ping timed out after {_READY_PING_TIMEOUT_SECONDS}s")
+        if oidc and _last_ready_at is not None and time.monotonic() - _last_ready_at < _READY_STALE_TTL_SECONDS:
+            return 200, _READY_STALE_BODY
+        database = False
     except Exception:
-        checks["database"] = False
-        all_ready = False
+        database = False
 
-    status_code = 200 if all_ready else 503
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "status": "ready" if all_ready else "not_ready",
-            "checks": checks,
-        },
-    )
+    if oidc and database:
+        _last_ready_at = time.monotonic()
+        return 200, _READY_BODIES[(True, True)]
+    return 503, _READY_BODIES[(oidc, database)]
 
 
 @health_check_router.get("/live")
-async def health_check_live() -> JSONResponse:
+async def health_check_live() -> Response:
     """Liveness probe endpoint for Kubernetes.
 
     Verifies that the application process is running and not deadlocked.
@@ -93,11 +191,22 @@ async def health_check_live() -> JSONResponse:
     Returns:
         200 with live status. Should never fail unless the process is hung.
     """
-    return JSONResponse(content={"status": "live"})
+    return Response(content=_LIVE_BODY, media_type="application/json", headers={"ETag": LIVE_ETAG})
+
+
+def is_oidc_ready() -> bool:
+    """Return whether the OIDC client was registered during app startup.
+
+    ``mlflow_oidc_auth.app`` imports this router, so it is imported here on
+    first call rather than at module import time.
+    """
+    from mlflow_oidc_auth.app import is_oidc_ready as app_is_oidc_ready
+
+    return app_is_oidc_ready()
 
 
 @health_check_router.get("/startup")
-async def health_check_startup() -> JSONResponse:
+async def health_check_startup() -> Response:
     """Startup probe endpoint for Kubernetes.
 
     Verifies that the application has completed its initialization.
@@ -110,20 +219,11 @@ async def health_check_startup() -> JSONResponse:
     Returns:
         200 if startup complete, 503 if still initializing or failed.
     """
-    from mlflow_oidc_auth.app import is_oidc_ready
-
     oidc_ready = is_oidc_ready()
 
     if oidc_ready:
-        return JSONResponse(content={"status": "started", "oidc_initialized": True})
+        return Response(content=_STARTED_BODY, media_type="application/json")
     else:
         # OIDC not initialized - might be missing config or startup in progress
         # Return 503 so Kubernetes knows startup is not complete
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "initializing",
-                "oidc_initialized": False,
-                "message": "OIDC client not yet initialized. Check OIDC configuration.",
-            },
-        )
+        return Response(content=_INITIALIZING_BODY, status_code=503, media_type="application/json")
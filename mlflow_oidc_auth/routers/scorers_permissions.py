@@ -7,6 +7,7 @@ versions under `/api/3.0/mlflow/permissions/scorers/*`.
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Path
+from mlflow.exceptions import MlflowException
 from mlflow.server.handlers import _get_tracking_store
 
 from mlflow_oidc_auth.dependencies import check_scorer_manage_permission
@@ -14,7 +15,7 @@ from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.models import GroupPermissionEntry, ScorerSummary, UserPermission
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils import get_is_admin, get_username
-from mlflow_oidc_auth.utils.permissions import can_manage_scorer
+from mlflow_oidc_auth.utils.batch_permissions import filter_manageable_scorers
 
 from ._prefix import SCORERS_ROUTER_PREFIX
 
@@ -36,6 +37,7 @@ SCORER_GROUP_PERMISSIONS = "/{experiment_id}/{scorer_name:path}/groups"
 
 @scorers_permissions_router.get(
     LIST_SCORERS,
+    response_model=List[ScorerSummary],
     summary="List accessible scorers",
     description="Retrieves scorers for an experiment that the requester can manage.",
 )
@@ -43,33 +45,36 @@ async def list_scorers(
     experiment_id: str = Path(..., description="The experiment ID owning the scorers"),
     username: str = Depends(get_username),
     is_admin: bool = Depends(get_is_admin),
-) -> List[ScorerSummary]:
+) -> List[dict]:
     """List scorers for an experiment filtered by permissions.
 
     Administrators see every scorer in the experiment. Non-admins only see scorers
     they can manage according to effective scorer permissions.
+
+    Plain dicts are returned so the response model validates and serializes the
+    whole list in one pass instead of constructing each ScorerSummary here.
     """
 
     try:
         tracking_store = _get_tracking_store()
         all_scorers = tracking_store.list_scorers(experiment_id)
-    except Exception as exc:  # noqa: BLE001
+    except (MlflowException, TimeoutError) as exc:
         logger.error(f"Failed to list scorers for experiment {experiment_id}: {exc}")
         raise HTTPException(status_code=500, detail="Failed to retrieve scorers") from exc
 
     if is_admin:
         visible_scorers = all_scorers
     else:
-        visible_scorers = [scorer for scorer in all_scorers if can_manage_scorer(str(experiment_id), scorer.scorer_name, username)]
+        visible_scorers = filter_manageable_scorers(username, str(experiment_id), all_scorers)
 
     return [
-        ScorerSummary(
-            experiment_id=scorer.experiment_id,
-            name=scorer.scorer_name,
-            version=scorer.scorer_version,
-            creation_time=scorer.creation_time,
-            scorer_id=scorer.scorer_id,
-        )
+        {
+            "experiment_id": scorer.experiment_id,
+            "name": scorer.scorer_name,
+            "version": scorer.scorer_version,
+            "creation_time": scorer.creation_time,
+            "scorer_id": scorer.scorer_id,
+        }
         for scorer in visible_scorers
     ]
 
@@ -92,28 +97,19 @@ async def get_scorer_users(
     """
 
     try:
-        users = store.list_users(all=True)
+        users = store.scorer_repo.list_users_for_scorer(str(experiment_id), str(scorer_name))
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to list scorer users for {experiment_id}/{scorer_name}: {exc}")
         raise HTTPException(status_code=500, detail="Failed to retrieve scorer user permissions") from exc
 
-    scorer_users: List[UserPermission] = []
-    for user in users:
-        scorer_permissions = {
-            (str(permission.experiment_id), str(permission.scorer_name)): str(permission.permission)
-            for permission in getattr(user, "scorer_permissions", []) or []
-        }
-
-        if (str(experiment_id), str(scorer_name)) in scorer_permissions:
-            scorer_users.append(
-                UserPermission(
-                    name=user.username,
-                    permission=scorer_permissions[(str(experiment_id), str(scorer_name))],
-                    kind="service-account" if user.is_service_account else "user",
-                )
-            )
-
-    return scorer_users
+    return [
+        UserPermission(
+            name=username,
+            permission=permission,
+            kind="service-account" if is_service_account else "user",
+        )
+        for username, permission, is_service_account in users
+    ]
 
 
 @scorers_permissions_router.get(
@@ -1,16 +1,19 @@
+import asyncio
+import json
 import re
 import warnings
 from datetime import timedelta
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from mlflow.entities import ViewType
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.exceptions import InvalidUrlException, MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.server.handlers import _get_tracking_store
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
-from mlflow.tracking import _get_store
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.time import get_current_time_millis
 
 from mlflow_oidc_auth.audit import emit_audit_event
@@ -38,6 +41,16 @@ CLEANUP = "/cleanup"
 RESTORE_EXPERIMENT = f"{EXPERIMENTS}/{{experiment_id}}/restore"
 RESTORE_RUN = f"{RUNS}/{{run_id}}/restore"
 
+# Run ids looked up per search_runs call when listing deleted runs.
+_RUN_BATCH_SIZE = 500
+
+# Runs hard-deleted in parallel by a cleanup; each holds a database connection
+# and usually an artifact store request while it runs.
+_CLEANUP_CONCURRENCY = 8
+
+# Duration strings accepted by older_than, e.g. '2d8h5m20s'; each unit is optional.
+_TIME_DELTA_RE = re.compile(r"^((?P<days>[\.\d]+?)d)?((?P<hours>[\.\d]+?)h)?((?P<minutes>[\.\d]+?)m)" r"?((?P<seconds>[\.\d]+?)s)?$")
+
 
 @trash_router.get(
     EXPERIMENTS,
@@ -105,10 +118,21 @@ async def list_deleted_runs(
         None,
         description="Only include runs deleted more than this duration ago (e.g., '1d2h', '7d').",
     ),
+    max_results: Optional[int] = Query(
+        None,
+        description="Maximum number of deleted runs to examine per page. Omit to list all deleted runs.",
+        ge=1,
+        le=1000,
+    ),
+    page_token: Optional[str] = Query(None, description="Token for pagination"),
 ) -> JSONResponse:
     """
     List deleted runs with optional experiment and age filters.
 
+    When ``max_results`` is set, a single page is returned together with a
+    ``next_page_token`` (``null`` on the last page). Filters are applied after
+    paging, so a page may hold fewer than ``max_results`` runs.
+
     Parameters
     ----------
     admin_username : str
@@ -118,9 +142,14 @@ async def list_deleted_runs(
     older_than : Optional[str]
         Time window threshold; runs deleted more recently than this are excluded when the backend
         supports `_get_deleted_runs`.
+    max_results : Optional[int]
+        Page size; when omitted every deleted run is returned in one response.
+    page_token : Optional[str]
+        Token from a previous page's ``next_page_token``.
     """
-    backend_store = _get_store()
+    backend_store = _get_tracking_store()
     experiment_filter = _split_csv(experiment_ids)
+    experiment_filter_set = set(experiment_filter)
 
     try:
         time_delta = _parse_time_delta(older_than) if older_than else 0
@@ -129,39 +158,75 @@ async def list_deleted_runs(
         return JSONResponse(status_code=400, content={"error": "Invalid time format"})
 
     try:
-        run_ids: List[str] = []
+        runs = []
+        next_page_token: Optional[str] = None
 
         if hasattr(backend_store, "_get_deleted_runs"):
-            run_ids = backend_store._get_deleted_runs(older_than=time_delta)
+            run_ids: List[str] = backend_store._get_deleted_runs(older_than=time_delta)
+            if max_results is not None:
+                # The store query has no ORDER BY; sort so offsets address the same sequence on every request.
+                run_ids = sorted(run_ids)
+                try:
+                    offset = SearchUtils.parse_start_offset_from_page_token(page_token) if page_token else 0
+                except MlflowException:
+                    return JSONResponse(status_code=400, content={"error": "Invalid page token"})
+                if offset + max_results < len(run_ids):
+                    next_page_token = SearchUtils.create_page_token(offset + max_results).decode()
+                run_ids = run_ids[offset : offset + max_results]
+            if run_ids:
+                if experiment_filter:
+                    scope_experiment_ids = experiment_filter
+                elif max_results is None:
+                    scope_experiment_ids = [exp.experiment_id for exp in fetch_all_experiments(view_type=ViewType.ALL)]
+                else:
+                    # A page holds at most max_results ids; fetching them by id is cheaper
+                    # than listing every experiment on each page to scope a batched search.
+                    scope_experiment_ids = None
+                runs = _get_runs(backend_store, run_ids, scope_experiment_ids)
         else:
-            # Fallback to search without age filtering when the backend lacks _get_deleted_runs
+            # Fallback to search without age filtering when the backend lacks _get_deleted_runs.
+            # search_runs needs explicit experiment ids, so an unfiltered listing has to scope
+            # each request to every experiment.
             target_experiment_ids = experiment_filter if experiment_filter else [exp.experiment_id for exp in fetch_all_experiments(view_type=ViewType.ALL)]
 
-            def fetch_runs(token=None):
+            if max_results is not None:
+                # The store's own page token is passed through unchanged.
                 try:
                     page = backend_store.search_runs(
                         experiment_ids=target_experiment_ids,
                         filter_string="",
                         run_view_type=ViewType.DELETED_ONLY,
-                        page_token=token,
+                        max_results=max_results,
+                        page_token=page_token,
                     )
-                    return (page + fetch_runs(page.token)) if page.token else page
-                except Exception:
-                    return []
+                except MlflowException as exc:
+                    # Only a rejected token is the client's fault; other store errors fall through to the 500.
+                    if page_token and exc.error_code == "INVALID_PARAMETER_VALUE":
+                        return JSONResponse(status_code=400, content={"error": "Invalid page token"})
+                    raise
+                next_page_token = page.token or None
+                runs = list(page)
+            else:
+
+                def fetch_runs(token=None):
+                    try:
+                        page = backend_store.search_runs(
+                            experiment_ids=target_experiment_ids,
+                            filter_string="",
+                            run_view_type=ViewType.DELETED_ONLY,
+                            page_token=token,
+                        )
+                        return (page + fetch_runs(page.token)) if page.token else page
+                    except Exception:
+                        return []
 
-            run_ids = [run.info.run_id for run in fetch_runs()]
+                runs = fetch_runs()
 
         runs_payload = []
-        for run_id in run_ids:
-            try:
-                run = backend_store.get_run(run_id)
-            except Exception as exc:  # pragma: no cover - defensive log path
-                logger.warning(f"Could not fetch run {run_id}: {str(exc)}")
-                continue
-
+        for run in runs:
             if run.info.lifecycle_stage != LifecycleStage.DELETED:
                 continue
-            if experiment_filter and run.info.experiment_id not in experiment_filter:
+            if experiment_filter and run.info.experiment_id not in experiment_filter_set:
                 continue
 
             runs_payload.append(
@@ -180,7 +245,10 @@ async def list_deleted_runs(
             f"Admin user '{admin_username}' listed {len(runs_payload)} deleted runs"
             f" (experiments filter: {experiment_filter or 'all'}, older_than: {older_than or 'not set'})."
         )
-        return JSONResponse(content={"deleted_runs": runs_payload})
+        content = {"deleted_runs": runs_payload}
+        if max_results is not None:
+            content["next_page_token"] = next_page_token
+        return JSONResponse(content=content)
 
     except Exception:
         logger.exception("Error listing deleted runs for admin %s", admin_username)
@@ -206,7 +274,8 @@ async def permanently_delete_all_trashed_entities(
         None,
         description="Comma-separated list of specific experiment IDs to permanently delete (including all their runs)",
     ),
-) -> JSONResponse:
+    stream: bool = Query(False, description="Stream one NDJSON line per processed entity instead of a single JSON summary"),
+) -> Response:
     """
     Permanently delete entities in the trash.
 
@@ -224,11 +293,16 @@ async def permanently_delete_all_trashed_entities(
         Comma-separated list of specific run IDs to delete.
     experiment_ids : Optional[str]
         Comma-separated list of specific experiment IDs to delete.
+    stream : bool
+        Emit ``application/x-ndjson`` as entities are deleted: one
+        ``deleted_run``/``failed_run``/``deleted_experiment``/``failed_experiment``
+        object per line, followed by a line with the totals.
 
     Returns:
     --------
-    JSONResponse
-        A JSON response indicating the result of the cleanup operation.
+    Response
+        A JSON response indicating the result of the cleanup operation, or a
+        streaming NDJSON response when ``stream`` is set.
 
     Raises:
     -------
@@ -237,7 +311,7 @@ async def permanently_delete_all_trashed_entities(
         500 - If the cleanup operation fails.
     """
     try:
-        backend_store = _get_store()
+        backend_store = _get_tracking_store()
 
         if not hasattr(backend_store, "_hard_delete_run"):
             logger.error("Backend store does not support hard deletion of runs")
@@ -347,51 +421,58 @@ async def permanently_delete_all_trashed_entities(
                 runs_from_experiments = fetch_runs()
                 target_run_ids.extend([run.info.run_id for run in runs_from_experiments])
 
-        # Delete runs
+        # Built after the experiments' runs were added: without run_ids,
+        # target_run_ids is this same list, so those runs pass the age check.
+        older_run_ids = set(deleted_run_ids_older_than)
+
+        if stream:
+
+            def stream_results():
+                deleted_runs_count = 0
+                deleted_experiments_count = 0
+                # A client disconnect closes the generator mid-way; entities deleted
+                # up to that point must still be logged and audited.
+                try:
+                    for run_id in set(target_run_ids):
+                        error = _hard_delete_trashed_run(backend_store, run_id, older_than, older_run_ids)
+                        if error is None:
+                            deleted_runs_count += 1
+                            yield _ndjson_line({"deleted_run": run_id})
+                        else:
+                            yield _ndjson_line({"failed_run": {"run_id": run_id, "error": error}})
+                    if not skip_experiments:
+                        for experiment_id in target_experiment_ids:
+                            error = _hard_delete_trashed_experiment(backend_store, experiment_id)
+                            if error is None:
+                                deleted_experiments_count += 1
+                                yield _ndjson_line({"deleted_experiment": experiment_id})
+                            else:
+                                yield _ndjson_line({"failed_experiment": {"experiment_id": experiment_id, "error": error}})
+                finally:
+                    _log_cleanup(admin_username, deleted_runs_count, deleted_experiments_count, older_than)
+                yield _ndjson_line({"total_deleted_runs": deleted_runs_count, "total_deleted_experiments": deleted_experiments_count})
+
+            # A plain generator is iterated in the threadpool, keeping the
+            # blocking store calls off the event loop while results stream out.
+            return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+        # Delete runs. Runs are independent, so their artifact and store deletes
+        # run in worker threads, at most _CLEANUP_CONCURRENCY at a time.
         deleted_runs = []
         failed_runs = []
+        semaphore = asyncio.Semaphore(_CLEANUP_CONCURRENCY)
 
-        for run_id in set(target_run_ids):
-            try:
-                run = backend_store.get_run(run_id)
-
-                # Validate run is deleted
-                if run.info.lifecycle_stage != LifecycleStage.DELETED:
-                    failed_runs.append(
-                        {
-                            "run_id": run_id,
-                            "error": "Run is not in deleted lifecycle stage",
-                        }
-                    )
-                    continue
-
-                # Check age requirement
-                if older_than and run_id not in deleted_run_ids_older_than:
-                    failed_runs.append(
-                        {
-                            "run_id": run_id,
-                            "error": f"Run is not older than {older_than}",
-                        }
-                    )
-                    continue
+        async def delete_run(run_id: str) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(_hard_delete_trashed_run, backend_store, run_id, older_than, older_run_ids)
 
-                # Delete artifacts
-                try:
-                    artifact_repo = get_artifact_repository(run.info.artifact_uri)
-                    artifact_repo.delete_artifacts()
-                except InvalidUrlException as e:
-                    logger.warning(f"Could not delete artifacts for run {run_id}: {str(e)}")
-                except Exception as e:
-                    logger.warning(f"Error deleting artifacts for run {run_id}: {str(e)}")
-
-                # Hard delete the run
-                backend_store._hard_delete_run(run_id)
+        unique_run_ids = list(set(target_run_ids))
+        errors = await asyncio.gather(*(delete_run(run_id) for run_id in unique_run_ids))
+        for run_id, error in zip(unique_run_ids, errors):
+            if error is None:
                 deleted_runs.append(run_id)
-                logger.info(f"Permanently deleted run {run_id}")
-
-            except Exception as e:
-                logger.error(f"Error deleting run {run_id}: {str(e)}")
-                failed_runs.append({"run_id": run_id, "error": str(e)})
+            else:
+                failed_runs.append({"run_id": run_id, "error": error})
 
         # Delete experiments
         deleted_experiments = []
@@ -399,13 +480,11 @@ async def permanently_delete_all_trashed_entities(
 
         if not skip_experiments:
             for experiment_id in target_experiment_ids:
-                try:
-                    backend_store._hard_delete_experiment(experiment_id)
+                error = _hard_delete_trashed_experiment(backend_store, experiment_id)
+                if error is None:
                     deleted_experiments.append(experiment_id)
-                    logger.info(f"Permanently deleted experiment {experiment_id}")
-                except Exception as e:
-                    logger.error(f"Error deleting experiment {experiment_id}: {str(e)}")
-                    failed_experiments.append({"experiment_id": experiment_id, "error": str(e)})
+                else:
+                    failed_experiments.append({"experiment_id": experiment_id, "error": error})
 
         # Prepare response
         response_data = {
@@ -421,18 +500,7 @@ async def permanently_delete_all_trashed_entities(
         if failed_experiments:
             response_data["failed_experiments"] = failed_experiments
 
-        logger.info(f"Admin user '{admin_username}' completed cleanup: " f"{len(deleted_runs)} runs, {len(deleted_experiments)} experiments deleted")
-
-        emit_audit_event(
-            "trash.cleanup",
-            admin_username,
-            resource_type="trash",
-            detail={
-                "deleted_runs_count": len(deleted_runs),
-                "deleted_experiments_count": len(deleted_experiments),
-                "older_than": older_than,
-            },
-        )
+        _log_cleanup(admin_username, len(deleted_runs), len(deleted_experiments), older_than)
 
         return JSONResponse(content=response_data)
 
@@ -460,7 +528,7 @@ async def restore_experiment(
     admin_username : str
         The authenticated admin username (injected by dependency).
     """
-    backend_store = _get_store()
+    backend_store = _get_tracking_store()
 
     try:
         experiment = backend_store.get_experiment(experiment_id)
@@ -515,7 +583,7 @@ async def restore_run(
     admin_username : str
         The authenticated admin username (injected by dependency).
     """
-    backend_store = _get_store()
+    backend_store = _get_tracking_store()
 
     try:
         run = backend_store.get_run(run_id)
@@ -552,6 +620,114 @@ async def restore_run(
         raise HTTPException(status_code=500, detail="Failed to restore run")
 
 
+def _get_runs(backend_store, run_ids: List[str], experiment_ids: Optional[List[str]]) -> list:
+    """
+    Fetch runs by id with one ``search_runs`` call per batch of ids.
+
+    Without ``experiment_ids`` to scope the search, and for stores that reject
+    the ``run_id IN`` filter, runs are fetched with one ``get_run`` call per id.
+    Runs that cannot be found are skipped; the rest keep the order of ``run_ids``.
+    """
+    if experiment_ids is not None:
+        try:
+            found = []
+            for start in range(0, len(run_ids), _RUN_BATCH_SIZE):
+                batch = run_ids[start : start + _RUN_BATCH_SIZE]
+                quoted_ids = ", ".join(f"'{run_id}'" for run_id in batch)
+                found.extend(
+                    backend_store.search_runs(
+                        experiment_ids=experiment_ids,
+                        filter_string=f"attributes.run_id IN ({quoted_ids})",
+                        run_view_type=ViewType.ALL,
+                        max_results=len(batch),
+                    )
+                )
+            runs_by_id = {run.info.run_id: run for run in found}
+            return [runs_by_id[run_id] for run_id in run_ids if run_id in runs_by_id]
+        except MlflowException as exc:
+            logger.warning(f"Batched run lookup failed, fetching runs one by one: {str(exc)}")
+
+    runs = []
+    for run_id in run_ids:
+        try:
+            runs.append(backend_store.get_run(run_id))
+        except Exception as exc:
+            logger.warning(f"Could not fetch run {run_id}: {str(exc)}")
+    return runs
+
+
+def _hard_delete_trashed_run(backend_store, run_id: str, older_than: Optional[str], older_run_ids: Set[str]) -> Optional[str]:
+    """
+    Permanently delete a trashed run and its artifacts.
+
+    Returns ``None`` when the run was deleted, otherwise the reason it was not.
+    """
+    try:
+        run = backend_store.get_run(run_id)
+
+        # Validate run is deleted
+        if run.info.lifecycle_stage != LifecycleStage.DELETED:
+            return "Run is not in deleted lifecycle stage"
+
+        # Check age requirement
+        if older_than and run_id not in older_run_ids:
+            return f"Run is not older than {older_than}"
+
+        # Delete artifacts
+        try:
+            artifact_repo = get_artifact_repository(run.info.artifact_uri)
+            artifact_repo.delete_artifacts()
+        except InvalidUrlException as e:
+            logger.warning(f"Could not delete artifacts for run {run_id}: {str(e)}")
+        except Exception as e:
+            logger.warning(f"Error deleting artifacts for run {run_id}: {str(e)}")
+
+        # Hard delete the run
+        backend_store._hard_delete_run(run_id)
+        logger.info(f"Permanently deleted run {run_id}")
+        return None
+
+    except Exception as e:
+        logger.error(f"Error deleting run {run_id}: {str(e)}")
+        return str(e)
+
+
+def _hard_delete_trashed_experiment(backend_store, experiment_id: str) -> Optional[str]:
+    """
+    Permanently delete a trashed experiment.
+
+    Returns ``None`` when the experiment was deleted, otherwise the error message.
+    """
+    try:
+        backend_store._hard_delete_experiment(experiment_id)
+        logger.info(f"Permanently deleted experiment {experiment_id}")
+        return None
+    except Exception as e:
+        logger.error(f"Error deleting experiment {experiment_id}: {str(e)}")
+        return str(e)
+
+
+def _log_cleanup(admin_username: str, deleted_runs_count: int, deleted_experiments_count: int, older_than: Optional[str]) -> None:
+    """Log and audit a completed cleanup."""
+    logger.info(f"Admin user '{admin_username}' completed cleanup: " f"{deleted_runs_count} runs, {deleted_experiments_count} experiments deleted")
+
+    emit_audit_event(
+        "trash.cleanup",
+        admin_username,
+        resource_type="trash",
+        detail={
+            "deleted_runs_count": deleted_runs_count,
+            "deleted_experiments_count": deleted_experiments_count,
+            "older_than": older_than,
+        },
+    )
+
+
+def _ndjson_line(content: dict) -> bytes:
+    """Serialize one line of a streamed cleanup response."""
+    return json.dumps(content, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
 def _parse_time_delta(older_than: str) -> int:
     """
     Parse time delta string (e.g., '1d2h3m4s') and return milliseconds.
@@ -571,8 +747,7 @@ def _parse_time_delta(older_than: str) -> int:
     MlflowException
         If the time format is invalid
     """
-    regex = re.compile(r"^((?P<days>[\.\d]+?)d)?((?P<hours>[\.\d]+?)h)?((?P<minutes>[\.\d]+?)m)" r"?((?P<seconds>[\.\d]+?)s)?$")
-    parts = regex.match(older_than)
+    parts = _TIME_DELTA_RE.match(older_than)
     if parts is None:
         raise MlflowException(
             f"Could not parse any time information from '{older_than}'. " "Examples of valid strings: '8h', '2d8h5m20s', '2m4s'",
@@ -587,4 +762,4 @@ def _split_csv(raw: Optional[str]) -> List[str]:
     """Split a comma-separated query parameter into trimmed, non-empty values."""
     if not raw:
         return []
-    return [value.strip() for value in raw.split(",") if value.strip()]
+    return [value for value in map(str.strip, raw.split(",")) if value]
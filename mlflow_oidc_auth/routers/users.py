@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter, Body, Depends, HTTPException
 from fastapi.responses import JSONResponse
@@ -144,10 +144,11 @@ async def create_access_token(
 
 @users_router.get(
     USERS_ROOT,
+    response_model=List[str],
     summary="List users",
     description="Retrieves a list of users in the system.",
 )
-async def list_users(service: bool = False, username: str = Depends(get_username)) -> JSONResponse:
+async def list_users(service: bool = False, username: str = Depends(get_username)) -> List[str]:
     """
     List users in the system.
 
@@ -164,8 +165,8 @@ async def list_users(service: bool = False, username: str = Depends(get_username
 
     Returns:
     --------
-    JSONResponse
-        A JSON response containing the list of users.
+    List[str]
+        The usernames, serialized by FastAPI through the response model.
 
     Raises:
     -------
@@ -179,7 +180,7 @@ async def list_users(service: bool = False, username: str = Depends(get_username
         # avoiding eager loading of all permission relationships per user.
         users = store.list_usernames(is_service_account=service)
 
-        return JSONResponse(content=users)
+        return users
 
     except Exception as e:
         logger.error(f"Error listing users: {str(e)}")
@@ -257,6 +257,9 @@ class SqlAlchemyStore:
     def get_user_groups_scorer_permission(self, experiment_id: str, scorer_name: str, username: str):
         return self.scorer_group_repo.get_group_permission_for_user_scorer(experiment_id, scorer_name, username)
 
+    def list_user_groups_scorer_permissions(self, username: str) -> List[ScorerPermission]:
+        return self.scorer_group_repo.list_permissions_for_user_groups(username)
+
     # Scorer regex (user-scoped)
     def create_scorer_regex_permission(self, regex: str, priority: int, permission: str, username: str) -> ScorerRegexPermission:
         return self.scorer_regex_repo.grant(regex=regex, priority=priority, permission=permission, username=username)
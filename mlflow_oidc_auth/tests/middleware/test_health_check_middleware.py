@@ -0,0 +1,136 @@
+"""
+Tests for HealthCheckMiddleware.
+
+Verifies that health probe requests are answered by the middleware without
+reaching the wrapped application, that non-GET methods are rejected with 405,
+and that every other request is passed through untouched.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mlflow_oidc_auth.middleware.health_check_middleware import HealthCheckMiddleware
+from mlflow_oidc_auth.routers.health import _reset_ready_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_ready_cache():
+    """Ensure readiness probes run against the patched checks."""
+    _reset_ready_cache()
+    yield
+    _reset_ready_cache()
+
+
+@pytest.fixture
+def inner_app():
+    """Inner ASGI app that records whether it was reached."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def client():
+    """TestClient for a FastAPI app whose only middleware is HealthCheckMiddleware."""
+    app = FastAPI()
+
+    @app.get("/other")
+    async def other():
+        return {"status": "other"}
+
+    app.add_middleware(HealthCheckMiddleware)
+    return TestClient(app)
+
+
+class TestHealthCheckMiddleware:
+    """Test health probe interception."""
+
+    def test_live_is_served(self, client):
+        """GET /health/live is answered with the live payload."""
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"status": "live"}
+        assert response.headers["etag"] == '"live-v1"'
+
+    def test_live_revalidation_returns_304(self, client):
+        """A matching If-None-Match on /health/live gets an empty 304."""
+        response = client.get("/health/live", headers={"If-None-Match": '"live-v1"'})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"live-v1"'
+        assert response.content == b""
+
+    def test_live_stale_etag_returns_body(self, client):
+        """A non-matching If-None-Match still receives the full payload."""
+        response = client.get("/health/live", headers={"If-None-Match": '"live-v0"'})
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "live"}
+
+    def test_root_is_served(self, client):
+        """GET /health is answered with the root payload."""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    def test_ready_uses_router_checks(self, client):
+        """GET /health/ready runs the readiness checks from the health router."""
+        with (
+            patch("mlflow_oidc_auth.routers.health.is_oidc_configured", return_value=True),
+            patch("mlflow_oidc_auth.routers.health.store") as mock_store,
+        ):
+            mock_store.ping.return_value = False
+            response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "not_ready"
+
+    def test_startup_uses_router_checks(self, client):
+        """GET /health/startup reports OIDC initialization state."""
+        with patch("mlflow_oidc_auth.routers.health.is_oidc_ready", return_value=True):
+            response = client.get("/health/startup")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "started"
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "DELETE", "PATCH"])
+    def test_non_get_returns_405(self, client, method):
+        """Non-GET methods on probe paths are rejected like the router does."""
+        response = client.request(method, "/health/live")
+
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET"
+        assert response.json() == {"detail": "Method Not Allowed"}
+
+    def test_other_paths_pass_through(self, client):
+        """Requests outside the probe paths reach the application."""
+        response = client.get("/other")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "other"}
+
+    @pytest.mark.asyncio
+    async def test_probe_does_not_reach_inner_app(self, inner_app):
+        """Probe requests never call the wrapped application."""
+        middleware = HealthCheckMiddleware(inner_app)
+        send = AsyncMock()
+
+        await middleware({"type": "http", "method": "GET", "path": "/health/live", "headers": []}, AsyncMock(), send)
+
+        inner_app.assert_not_called()
+        assert send.await_args_list[0].args[0]["status"] == 200
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self, inner_app):
+        """Lifespan and websocket scopes are forwarded unchanged."""
+        middleware = HealthCheckMiddleware(inner_app)
+        scope = {"type": "lifespan"}
+        receive, send = AsyncMock(), AsyncMock()
+
+        await middleware(scope, receive, send)
+
+        inner_app.assert_awaited_once_with(scope, receive, send)
@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from mlflow_oidc_auth.db.models import SqlScorerPermission, SqlUser
+from mlflow_oidc_auth.db.models._base import Base
+from mlflow_oidc_auth.repository.scorer_permission import ScorerPermissionRepository
+
+
+@pytest.fixture
+def repo():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    @contextmanager
+    def managed_session():
+        session = Session()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    with managed_session() as session:
+        users = [
+            SqlUser(username="alice", display_name="Alice", password_hash="x", is_service_account=False),
+            SqlUser(username="bob", display_name="Bob", password_hash="x", is_service_account=False),
+            SqlUser(username="svc", display_name="Service", password_hash="x", is_service_account=True),
+        ]
+        session.add_all(users)
+        session.flush()
+        alice, bob, svc = users
+        session.add_all(
+            [
+                SqlScorerPermission(experiment_id="exp1", scorer_name="scorer1", user_id=alice.id, permission="READ"),
+                SqlScorerPermission(experiment_id="exp1", scorer_name="scorer1", user_id=svc.id, permission="MANAGE"),
+                SqlScorerPermission(experiment_id="exp1", scorer_name="scorer2", user_id=bob.id, permission="EDIT"),
+                SqlScorerPermission(experiment_id="exp2", scorer_name="scorer1", user_id=bob.id, permission="READ"),
+            ]
+        )
+
+    return ScorerPermissionRepository(session_maker=managed_session)
+
+
+def test_list_users_for_scorer_returns_only_permission_holders(repo):
+    result = repo.list_users_for_scorer("exp1", "scorer1")
+
+    assert sorted(result) == [("alice", "READ", False), ("svc", "MANAGE", True)]
+
+
+def test_list_users_for_scorer_no_permissions(repo):
+    assert repo.list_users_for_scorer("exp3", "scorer1") == []
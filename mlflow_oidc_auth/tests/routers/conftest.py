@@ -5,6 +5,7 @@ This module provides comprehensive fixtures for testing FastAPI routers includin
 authentication mocking, database setup, and test client configuration.
 """
 
+import base64
 import os
 import tempfile
 from typing import Any, Dict, Optional
@@ -407,9 +408,9 @@ def _patch_router_stores(mock_store):
             pass
 
 
-@pytest.fixture
-def authenticated_session():
-    """Mock authenticated session data."""
+@pytest.fixture(scope="session")
+def _authenticated_session_data():
+    """Authenticated session payload, built once per test session."""
     return {
         "username": "test@example.com",
         "authenticated": True,
@@ -417,6 +418,21 @@ def authenticated_session():
     }
 
 
+@pytest.fixture(scope="session")
+def _basic_auth_headers():
+    """Basic auth headers for the regular and admin test users, encoded once per test session."""
+    return {
+        "user": {"Authorization": "Basic " + base64.b64encode(b"user@example.com:password").decode()},
+        "admin": {"Authorization": "Basic " + base64.b64encode(b"admin@example.com:password").decode()},
+    }
+
+
+@pytest.fixture
+def authenticated_session(_authenticated_session_data):
+    """Mock authenticated session data."""
+    return dict(_authenticated_session_data)
+
+
 @pytest.fixture
 def unauthenticated_session():
     """Mock unauthenticated session data."""
@@ -429,11 +445,53 @@ def admin_session():
     return {"username": "admin@example.com", "authenticated": True, "is_admin": True}
 
 
+def _build_router_app():
+    """Build a FastAPI app similar to production but without mounting the real Flask app.
+
+    Handlers and middleware resolve the patched module attributes at request
+    time, so the app itself does not depend on any per-test mock and can be
+    shared across the whole session.
+    """
+    from fastapi import FastAPI
+    from starlette.middleware.sessions import (
+        SessionMiddleware as StarletteSessionMiddleware,
+    )
+
+    from mlflow_oidc_auth.middleware.auth_middleware import AuthMiddleware
+    from mlflow_oidc_auth.middleware.health_check_middleware import (
+        HealthCheckMiddleware,
+    )
+    from mlflow_oidc_auth.routers import get_all_routers
+
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware)
+    app.add_middleware(StarletteSessionMiddleware, secret_key="test-secret-key")
+    app.add_middleware(HealthCheckMiddleware)
+
+    for router in get_all_routers():
+        app.include_router(router)
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def _router_app():
+    """FastAPI application with all routers, built once per session."""
+    return _build_router_app()
+
+
+@pytest.fixture(scope="session")
+def _router_app_admin():
+    """Separate session-wide application for admin tests."""
+    return _build_router_app()
+
+
 @pytest.fixture
-def test_app(mock_store, mock_oauth, mock_config, mock_tracking_store, mock_permissions):
-    """Create a test FastAPI application with all routers."""
-    # Build test app using the production factory so mounts/middleware match prod
+def test_app(_router_app, mock_store, mock_oauth, mock_config, mock_tracking_store, mock_permissions):
+    """Patch runtime dependencies and return the shared test application.
 
+    Dependency overrides set by a test are cleared on teardown.
+    """
     # Patch runtime dependencies used by middleware, routers and Flask mount
     # Ensure submodules are importable so patch() can resolve dotted names
     try:
@@ -521,57 +579,62 @@ def test_app(mock_store, mock_oauth, mock_config, mock_tracking_store, mock_perm
             continue
 
     try:
-        # Build a local FastAPI app similar to production but avoid mounting the real Flask app
-        from fastapi import FastAPI
-        from starlette.middleware.sessions import (
-            SessionMiddleware as StarletteSessionMiddleware,
-        )
+        yield _router_app
+    finally:
+        _router_app.dependency_overrides.clear()
+        for p in patches:
+            p.stop()
 
-        from mlflow_oidc_auth.middleware.auth_middleware import AuthMiddleware
-        from mlflow_oidc_auth.routers import get_all_routers
 
-        app = FastAPI()
-        app.add_middleware(AuthMiddleware)
-        app.add_middleware(StarletteSessionMiddleware, secret_key=mock_config.SECRET_KEY)
+# Clients are opened once per session so every request shares one blocking
+# portal and event loop; the per-test fixtures apply the patches through
+# test_app/test_app_admin and drop any cookies a previous test left behind.
 
-        for router in get_all_routers():
-            app.include_router(router)
 
-        yield app
-    finally:
-        for p in patches:
-            p.stop()
+@pytest.fixture(scope="session")
+def _session_client(_router_app):
+    with TestClient(_router_app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def _session_authenticated_client(_router_app, _basic_auth_headers):
+    with TestClient(_router_app) as client:
+        client.headers.update(_basic_auth_headers["user"])
+        yield client
+
+
+@pytest.fixture(scope="session")
+def _session_admin_client(_router_app_admin, _basic_auth_headers):
+    with TestClient(_router_app_admin) as client:
+        client.headers.update(_basic_auth_headers["admin"])
+        yield client
 
 
 @pytest.fixture
-def client(test_app):
+def client(test_app, _session_client):
     """Create a test client for the FastAPI application."""
-    return TestClientWrapper(TestClient(test_app))
+    _session_client.cookies.clear()
+    return TestClientWrapper(_session_client)
 
 
 @pytest.fixture
-def authenticated_client(test_app, authenticated_session):
+def authenticated_client(test_app, authenticated_session, _session_authenticated_client):
     """Create a test client with authenticated user."""
-    import base64
-
-    client = TestClient(test_app)
-    client.headers["Authorization"] = "Basic " + base64.b64encode(b"user@example.com:password").decode()
-    return TestClientWrapper(client)
+    _session_authenticated_client.cookies.clear()
+    return TestClientWrapper(_session_authenticated_client)
 
 
 @pytest.fixture
-def admin_client(test_app_admin):
+def admin_client(test_app_admin, _session_admin_client):
     """Create a test client with admin authentication."""
-    import base64
-
-    client = TestClient(test_app_admin)
-    client.headers["Authorization"] = "Basic " + base64.b64encode(b"admin@example.com:password").decode()
-    return TestClientWrapper(client)
+    _session_admin_client.cookies.clear()
+    return TestClientWrapper(_session_admin_client)
 
 
 @pytest.fixture
-def test_app_admin(mock_store, mock_oauth, mock_config, mock_tracking_store, admin_permissions):
-    """Create a test FastAPI application with all routers for admin tests."""
+def test_app_admin(_router_app_admin, mock_store, mock_oauth, mock_config, mock_tracking_store, admin_permissions):
+    """Patch runtime dependencies for admin tests and return the shared admin application."""
 
     # Ensure middleware submodule exists on package for patch resolution
     try:
@@ -663,23 +726,9 @@ def test_app_admin(mock_store, mock_oauth, mock_config, mock_tracking_store, adm
             continue
 
     try:
-        from fastapi import FastAPI
-        from starlette.middleware.sessions import (
-            SessionMiddleware as StarletteSessionMiddleware,
-        )
-
-        from mlflow_oidc_auth.middleware.auth_middleware import AuthMiddleware
-        from mlflow_oidc_auth.routers import get_all_routers
-
-        app = FastAPI()
-        app.add_middleware(AuthMiddleware)
-        app.add_middleware(StarletteSessionMiddleware, secret_key=mock_config.SECRET_KEY)
-
-        for router in get_all_routers():
-            app.include_router(router)
-
-        yield app
+        yield _router_app_admin
     finally:
+        _router_app_admin.dependency_overrides.clear()
         for p in patches:
             p.stop()
 
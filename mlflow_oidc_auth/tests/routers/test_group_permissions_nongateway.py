@@ -4,10 +4,12 @@ Covers experiments, registered models, prompts, and their pattern variants,
 plus group listing and group-user listing.
 """
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+import mlflow_oidc_auth.routers.group_permissions as _GP_MOD
 from mlflow_oidc_auth.dependencies import (
     check_admin_permission,
     check_experiment_manage_permission,
@@ -15,8 +17,8 @@ from mlflow_oidc_auth.dependencies import (
 
 GROUP_BASE = "/api/2.0/mlflow/permissions/groups"
 
-# Module path where effective_* functions are imported in the router
-_GP = "mlflow_oidc_auth.routers.group_permissions"
+# Read-only tracking store stub; every experiment resolves to the same name.
+_TRACKING = SimpleNamespace(get_experiment=lambda *_args, **_kwargs: SimpleNamespace(name="Test Experiment"))
 
 
 def _mock_eff_perm():
@@ -26,28 +28,23 @@ def _mock_eff_perm():
     return result
 
 
+# Permission-check override installed by the fixtures below (removed by test_app).
+
+
+async def _always_admin():
+    return "admin@example.com"
+
+
 @pytest.fixture
 def override_admin(test_app):
     """Override admin permission check to always pass."""
-
-    async def always_admin():
-        return "admin@example.com"
-
-    test_app.dependency_overrides[check_admin_permission] = always_admin
-    yield
-    test_app.dependency_overrides.pop(check_admin_permission, None)
+    test_app.dependency_overrides[check_admin_permission] = _always_admin
 
 
 @pytest.fixture
 def override_experiment_manage(test_app):
     """Override experiment manage permission check."""
-
-    async def always_manage():
-        return "admin@example.com"
-
-    test_app.dependency_overrides[check_experiment_manage_permission] = always_manage
-    yield
-    test_app.dependency_overrides.pop(check_experiment_manage_permission, None)
+    test_app.dependency_overrides[check_experiment_manage_permission] = _always_admin
 
 
 def _make_regex_pattern():
@@ -100,18 +97,18 @@ def _make_prompt_regex_pattern():
 class TestListGroups:
     """Tests for list_groups endpoint."""
 
-    def test_list_groups_success(self, authenticated_client, mock_store):
+    def test_list_groups_success(self, authenticated_client, mock_store, monkeypatch):
         """Test listing all groups."""
         mock_store.get_groups.return_value = ["devs", "admins"]
-        with patch(f"{_GP}.store", mock_store):
-            resp = authenticated_client.get(GROUP_BASE)
+        monkeypatch.setattr(_GP_MOD, "store", mock_store)
+        resp = authenticated_client.get(GROUP_BASE)
         assert resp.status_code == 200
 
-    def test_list_groups_error(self, authenticated_client, mock_store):
+    def test_list_groups_error(self, authenticated_client, mock_store, monkeypatch):
         """Test error handling when listing groups fails."""
         mock_store.get_groups.side_effect = Exception("DB error")
-        with patch(f"{_GP}.store", mock_store):
-            resp = authenticated_client.get(GROUP_BASE)
+        monkeypatch.setattr(_GP_MOD, "store", mock_store)
+        resp = authenticated_client.get(GROUP_BASE)
         assert resp.status_code == 500
 
 
@@ -152,20 +149,15 @@ class TestGroupUsers:
 class TestGroupExperimentList:
     """Tests for get_group_experiments (list) endpoint."""
 
-    def test_list_experiments_as_admin(self, admin_client, mock_store):
+    def test_list_experiments_as_admin(self, admin_client, mock_store, monkeypatch):
         """Admin sees all group experiments."""
         exp_perm = MagicMock()
         exp_perm.experiment_id = "123"
         exp_perm.permission = "MANAGE"
         mock_store.get_group_experiments.return_value = [exp_perm]
 
-        mock_tracking = MagicMock()
-        mock_experiment = MagicMock()
-        mock_experiment.name = "Test Experiment"
-        mock_tracking.get_experiment.return_value = mock_experiment
-
-        with patch(f"{_GP}._get_tracking_store", return_value=mock_tracking):
-            resp = admin_client.get(f"{GROUP_BASE}/devs/experiments")
+        monkeypatch.setattr(_GP_MOD, "_get_tracking_store", lambda: _TRACKING)
+        resp = admin_client.get(f"{GROUP_BASE}/devs/experiments")
         assert resp.status_code == 200
         body = resp.json()
         assert len(body) == 1
@@ -173,11 +165,11 @@ class TestGroupExperimentList:
         assert body[0]["name"] == "Test Experiment"
         assert body[0]["permission"] == "MANAGE"
 
-    def test_list_experiments_error(self, admin_client, mock_store):
+    def test_list_experiments_error(self, admin_client, mock_store, monkeypatch):
         """Test error handling."""
         mock_store.get_group_experiments.side_effect = Exception("DB error")
-        with patch(f"{_GP}._get_tracking_store", return_value=MagicMock()):
-            resp = admin_client.get(f"{GROUP_BASE}/devs/experiments")
+        monkeypatch.setattr(_GP_MOD, "_get_tracking_store", lambda: MagicMock())
+        resp = admin_client.get(f"{GROUP_BASE}/devs/experiments")
         assert resp.status_code == 500
 
 
@@ -192,36 +184,18 @@ class TestGroupExperimentCRUD:
         assert "created" in resp.json()["message"].lower()
         mock_store.create_group_experiment_permission.assert_called_once()
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_group_experiment_permission.side_effect = Exception("Duplicate")
-        resp = authenticated_client.post(f"{GROUP_BASE}/devs/experiments/exp-1", json={"permission": "READ"})
-        assert resp.status_code == 500
-
     def test_update(self, authenticated_client, mock_store):
         """Test updating experiment permission for a group."""
         resp = authenticated_client.patch(f"{GROUP_BASE}/devs/experiments/exp-1", json={"permission": "EDIT"})
         assert resp.status_code == 200
         assert "updated" in resp.json()["message"].lower()
 
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_group_experiment_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.patch(f"{GROUP_BASE}/devs/experiments/exp-1", json={"permission": "EDIT"})
-        assert resp.status_code == 500
-
     def test_delete(self, authenticated_client, mock_store):
         """Test deleting experiment permission for a group."""
         resp = authenticated_client.delete(f"{GROUP_BASE}/devs/experiments/exp-1")
         assert resp.status_code == 200
         assert "deleted" in resp.json()["message"].lower()
 
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_group_experiment_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.delete(f"{GROUP_BASE}/devs/experiments/exp-1")
-        assert resp.status_code == 500
-
 
 # ========================================================================================
 # GROUP REGISTERED MODEL PERMISSIONS (LIST / CRUD)
@@ -245,18 +219,15 @@ class TestGroupRegisteredModelList:
         assert len(body) == 1
         assert body[0]["name"] == "my-model"
 
-    def test_list_models_non_admin_with_manage(self, authenticated_client, mock_store):
+    def test_list_models_non_admin_with_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin user with manage permission can see models."""
         model_perm = MagicMock()
         model_perm.name = "my-model"
         model_perm.permission = "READ"
         mock_store.get_group_models.return_value = [model_perm]
 
-        with patch(
-            f"{_GP}.effective_registered_model_permission",
-            return_value=_mock_eff_perm(),
-        ):
-            resp = authenticated_client.get(f"{GROUP_BASE}/devs/registered-models")
+        monkeypatch.setattr(_GP_MOD, "effective_registered_model_permission", lambda *args, **kwargs: _mock_eff_perm())
+        resp = authenticated_client.get(f"{GROUP_BASE}/devs/registered-models")
         assert resp.status_code == 200
 
     def test_list_models_error(self, admin_client, mock_store):
@@ -276,65 +247,44 @@ class TestGroupRegisteredModelCRUD:
         assert resp.status_code == 201
         mock_store.create_group_model_permission.assert_called_once()
 
-    def test_create_non_admin_with_manage(self, authenticated_client, mock_store):
+    def test_create_non_admin_with_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin with manage permission can create."""
-        with patch(
-            f"{_GP}.effective_registered_model_permission",
-            return_value=_mock_eff_perm(),
-        ):
-            resp = authenticated_client.post(
-                f"{GROUP_BASE}/devs/registered-models/my-model",
-                json={"permission": "READ"},
-            )
+        monkeypatch.setattr(_GP_MOD, "effective_registered_model_permission", lambda *args, **kwargs: _mock_eff_perm())
+        resp = authenticated_client.post(
+            f"{GROUP_BASE}/devs/registered-models/my-model",
+            json={"permission": "READ"},
+        )
         assert resp.status_code == 201
 
-    def test_create_non_admin_no_manage(self, authenticated_client, mock_store):
+    def test_create_non_admin_no_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin without manage permission gets 403."""
         no_perm = MagicMock()
         no_perm.permission.can_manage = False
-        with patch(f"{_GP}.effective_registered_model_permission", return_value=no_perm):
-            resp = authenticated_client.post(
-                f"{GROUP_BASE}/devs/registered-models/my-model",
-                json={"permission": "READ"},
-            )
+        monkeypatch.setattr(_GP_MOD, "effective_registered_model_permission", lambda *args, **kwargs: no_perm)
+        resp = authenticated_client.post(
+            f"{GROUP_BASE}/devs/registered-models/my-model",
+            json={"permission": "READ"},
+        )
         assert resp.status_code == 403
 
-    def test_create_error(self, admin_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_group_model_permission.side_effect = Exception("DB error")
-        resp = admin_client.post(f"{GROUP_BASE}/devs/registered-models/my-model", json={"permission": "READ"})
-        assert resp.status_code == 500
-
     def test_update_as_admin(self, admin_client, mock_store):
         """Admin can update registered model permission."""
         resp = admin_client.patch(f"{GROUP_BASE}/devs/registered-models/my-model", json={"permission": "EDIT"})
         assert resp.status_code == 200
 
-    def test_update_error(self, admin_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_group_model_permission.side_effect = Exception("DB error")
-        resp = admin_client.patch(f"{GROUP_BASE}/devs/registered-models/my-model", json={"permission": "EDIT"})
-        assert resp.status_code == 500
-
     def test_delete_as_admin(self, admin_client, mock_store):
         """Admin can delete registered model permission."""
         resp = admin_client.delete(f"{GROUP_BASE}/devs/registered-models/my-model")
         assert resp.status_code == 200
 
-    def test_delete_non_admin_no_manage(self, authenticated_client, mock_store):
+    def test_delete_non_admin_no_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin without manage permission gets 403."""
         no_perm = MagicMock()
         no_perm.permission.can_manage = False
-        with patch(f"{_GP}.effective_registered_model_permission", return_value=no_perm):
-            resp = authenticated_client.delete(f"{GROUP_BASE}/devs/registered-models/my-model")
+        monkeypatch.setattr(_GP_MOD, "effective_registered_model_permission", lambda *args, **kwargs: no_perm)
+        resp = authenticated_client.delete(f"{GROUP_BASE}/devs/registered-models/my-model")
         assert resp.status_code == 403
 
-    def test_delete_error(self, admin_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_group_model_permission.side_effect = Exception("DB error")
-        resp = admin_client.delete(f"{GROUP_BASE}/devs/registered-models/my-model")
-        assert resp.status_code == 500
-
 
 # ========================================================================================
 # GROUP PROMPT PERMISSIONS (LIST / CRUD)
@@ -358,15 +308,15 @@ class TestGroupPromptList:
         assert len(body) == 1
         assert body[0]["name"] == "my-prompt"
 
-    def test_list_prompts_non_admin_with_manage(self, authenticated_client, mock_store):
+    def test_list_prompts_non_admin_with_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin with manage permission can see prompts."""
         prompt_perm = MagicMock()
         prompt_perm.name = "my-prompt"
         prompt_perm.permission = "READ"
         mock_store.get_group_prompts.return_value = [prompt_perm]
 
-        with patch(f"{_GP}.effective_prompt_permission", return_value=_mock_eff_perm()):
-            resp = authenticated_client.get(f"{GROUP_BASE}/devs/prompts")
+        monkeypatch.setattr(_GP_MOD, "effective_prompt_permission", lambda *args, **kwargs: _mock_eff_perm())
+        resp = authenticated_client.get(f"{GROUP_BASE}/devs/prompts")
         assert resp.status_code == 200
 
     def test_list_prompts_error(self, admin_client, mock_store):
@@ -386,64 +336,46 @@ class TestGroupPromptCRUD:
         assert resp.status_code == 201
         mock_store.create_group_prompt_permission.assert_called_once()
 
-    def test_create_non_admin_with_manage(self, authenticated_client, mock_store):
+    def test_create_non_admin_with_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin with manage permission can create."""
-        with patch(f"{_GP}.effective_prompt_permission", return_value=_mock_eff_perm()):
-            resp = authenticated_client.post(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "READ"})
+        monkeypatch.setattr(_GP_MOD, "effective_prompt_permission", lambda *args, **kwargs: _mock_eff_perm())
+        resp = authenticated_client.post(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "READ"})
         assert resp.status_code == 201
 
-    def test_create_non_admin_no_manage(self, authenticated_client, mock_store):
+    def test_create_non_admin_no_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin without manage permission gets 403."""
         no_perm = MagicMock()
         no_perm.permission.can_manage = False
-        with patch(f"{_GP}.effective_prompt_permission", return_value=no_perm):
-            resp = authenticated_client.post(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "READ"})
+        monkeypatch.setattr(_GP_MOD, "effective_prompt_permission", lambda *args, **kwargs: no_perm)
+        resp = authenticated_client.post(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "READ"})
         assert resp.status_code == 403
 
-    def test_create_error(self, admin_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_group_prompt_permission.side_effect = Exception("DB error")
-        resp = admin_client.post(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "READ"})
-        assert resp.status_code == 500
-
     def test_update_as_admin(self, admin_client, mock_store):
         """Admin can update prompt permission."""
         resp = admin_client.patch(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "EDIT"})
         assert resp.status_code == 200
 
-    def test_update_non_admin_no_manage(self, authenticated_client, mock_store):
+    def test_update_non_admin_no_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin without manage permission gets 403."""
         no_perm = MagicMock()
         no_perm.permission.can_manage = False
-        with patch(f"{_GP}.effective_prompt_permission", return_value=no_perm):
-            resp = authenticated_client.patch(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "EDIT"})
+        monkeypatch.setattr(_GP_MOD, "effective_prompt_permission", lambda *args, **kwargs: no_perm)
+        resp = authenticated_client.patch(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "EDIT"})
         assert resp.status_code == 403
 
-    def test_update_error(self, admin_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_group_prompt_permission.side_effect = Exception("DB error")
-        resp = admin_client.patch(f"{GROUP_BASE}/devs/prompts/my-prompt", json={"permission": "EDIT"})
-        assert resp.status_code == 500
-
     def test_delete_as_admin(self, admin_client, mock_store):
         """Admin can delete prompt permission."""
         resp = admin_client.delete(f"{GROUP_BASE}/devs/prompts/my-prompt")
         assert resp.status_code == 200
 
-    def test_delete_non_admin_no_manage(self, authenticated_client, mock_store):
+    def test_delete_non_admin_no_manage(self, authenticated_client, mock_store, monkeypatch):
         """Non-admin without manage permission gets 403."""
         no_perm = MagicMock()
         no_perm.permission.can_manage = False
-        with patch(f"{_GP}.effective_prompt_permission", return_value=no_perm):
-            resp = authenticated_client.delete(f"{GROUP_BASE}/devs/prompts/my-prompt")
+        monkeypatch.setattr(_GP_MOD, "effective_prompt_permission", lambda *args, **kwargs: no_perm)
+        resp = authenticated_client.delete(f"{GROUP_BASE}/devs/prompts/my-prompt")
         assert resp.status_code == 403
 
-    def test_delete_error(self, admin_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_group_prompt_permission.side_effect = Exception("DB error")
-        resp = admin_client.delete(f"{GROUP_BASE}/devs/prompts/my-prompt")
-        assert resp.status_code == 500
-
 
 # ========================================================================================
 # GROUP EXPERIMENT PATTERN PERMISSIONS
@@ -475,12 +407,6 @@ class TestGroupExperimentPatterns:
         resp = authenticated_client.get(f"{GROUP_BASE}/devs/experiment-patterns")
         assert resp.status_code == 200
 
-    def test_list_error(self, authenticated_client, mock_store):
-        """Test error handling for list."""
-        mock_store.list_group_experiment_regex_permissions.side_effect = Exception("DB error")
-        resp = authenticated_client.get(f"{GROUP_BASE}/devs/experiment-patterns")
-        assert resp.status_code == 500
-
     def test_create(self, authenticated_client, mock_store):
         """Test creating experiment regex permission."""
         resp = authenticated_client.post(
@@ -490,15 +416,6 @@ class TestGroupExperimentPatterns:
         assert resp.status_code == 201
         mock_store.create_group_experiment_regex_permission.assert_called_once()
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_group_experiment_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{GROUP_BASE}/devs/experiment-patterns",
-            json={"regex": "exp-.*", "priority": 1, "permission": "READ"},
-        )
-        assert resp.status_code == 500
-
     def test_get(self, authenticated_client, mock_store):
         """Test getting a specific experiment regex permission."""
         mock_store.get_group_experiment_regex_permission.return_value = _make_regex_pattern()
@@ -517,12 +434,6 @@ class TestGroupExperimentPatterns:
         resp = authenticated_client.get(f"{GROUP_BASE}/devs/experiment-patterns/1")
         assert resp.status_code == 200
 
-    def test_get_error(self, authenticated_client, mock_store):
-        """Test error handling for get."""
-        mock_store.get_group_experiment_regex_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{GROUP_BASE}/devs/experiment-patterns/1")
-        assert resp.status_code == 500
-
     def test_update(self, authenticated_client, mock_store):
         """Test updating experiment regex permission."""
         resp = authenticated_client.patch(
@@ -532,27 +443,12 @@ class TestGroupExperimentPatterns:
         assert resp.status_code == 200
         mock_store.update_group_experiment_regex_permission.assert_called_once()
 
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_group_experiment_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(
-            f"{GROUP_BASE}/devs/experiment-patterns/1",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 500
-
     def test_delete(self, authenticated_client, mock_store):
         """Test deleting experiment regex permission."""
         resp = authenticated_client.delete(f"{GROUP_BASE}/devs/experiment-patterns/1")
         assert resp.status_code == 200
         mock_store.delete_group_experiment_regex_permission.assert_called_once()
 
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_group_experiment_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{GROUP_BASE}/devs/experiment-patterns/1")
-        assert resp.status_code == 500
-
 
 # ========================================================================================
 # GROUP REGISTERED MODEL PATTERN PERMISSIONS
@@ -584,12 +480,6 @@ class TestGroupRegisteredModelPatterns:
         resp = authenticated_client.get(f"{GROUP_BASE}/devs/registered-models-patterns")
         assert resp.status_code == 200
 
-    def test_list_error(self, authenticated_client, mock_store):
-        """Test error handling for list."""
-        mock_store.list_group_registered_model_regex_permissions.side_effect = Exception("DB error")
-        resp = authenticated_client.get(f"{GROUP_BASE}/devs/registered-models-patterns")
-        assert resp.status_code == 500
-
     def test_create(self, authenticated_client, mock_store):
         """Test creating registered model regex permission."""
         resp = authenticated_client.post(
@@ -598,15 +488,6 @@ class TestGroupRegisteredModelPatterns:
         )
         assert resp.status_code == 201
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_group_registered_model_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{GROUP_BASE}/devs/registered-models-patterns",
-            json={"regex": "model-.*", "priority": 1, "permission": "READ"},
-        )
-        assert resp.status_code == 500
-
     def test_get(self, authenticated_client, mock_store):
         """Test getting a specific registered model regex permission."""
         mock_store.get_group_registered_model_regex_permission.return_value = _make_model_regex_pattern()
@@ -626,12 +507,6 @@ class TestGroupRegisteredModelPatterns:
         resp = authenticated_client.get(f"{GROUP_BASE}/devs/registered-models-patterns/1")
         assert resp.status_code == 200
 
-    def test_get_error(self, authenticated_client, mock_store):
-        """Test error handling for get."""
-        mock_store.get_group_registered_model_regex_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{GROUP_BASE}/devs/registered-models-patterns/1")
-        assert resp.status_code == 500
-
     def test_update(self, authenticated_client, mock_store):
         """Test updating registered model regex permission."""
         resp = authenticated_client.patch(
@@ -640,26 +515,11 @@ class TestGroupRegisteredModelPatterns:
         )
         assert resp.status_code == 200
 
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_group_registered_model_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(
-            f"{GROUP_BASE}/devs/registered-models-patterns/1",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 500
-
     def test_delete(self, authenticated_client, mock_store):
         """Test deleting registered model regex permission."""
         resp = authenticated_client.delete(f"{GROUP_BASE}/devs/registered-models-patterns/1")
         assert resp.status_code == 200
 
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_group_registered_model_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{GROUP_BASE}/devs/registered-models-patterns/1")
-        assert resp.status_code == 500
-
 
 # ========================================================================================
 # GROUP PROMPT PATTERN PERMISSIONS
@@ -691,12 +551,6 @@ class TestGroupPromptPatterns:
         resp = authenticated_client.get(f"{GROUP_BASE}/devs/prompts-patterns")
         assert resp.status_code == 200
 
-    def test_list_error(self, authenticated_client, mock_store):
-        """Test error handling for list."""
-        mock_store.list_group_prompt_regex_permissions.side_effect = Exception("DB error")
-        resp = authenticated_client.get(f"{GROUP_BASE}/devs/prompts-patterns")
-        assert resp.status_code == 500
-
     def test_create(self, authenticated_client, mock_store):
         """Test creating prompt regex permission."""
         resp = authenticated_client.post(
@@ -705,27 +559,12 @@ class TestGroupPromptPatterns:
         )
         assert resp.status_code == 201
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_group_prompt_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{GROUP_BASE}/devs/prompts-patterns",
-            json={"regex": "prompt-.*", "priority": 1, "permission": "READ"},
-        )
-        assert resp.status_code == 500
-
     def test_get(self, authenticated_client, mock_store):
         """Test getting a specific prompt regex permission."""
         mock_store.get_group_prompt_regex_permission.return_value = _make_prompt_regex_pattern()
         resp = authenticated_client.get(f"{GROUP_BASE}/devs/prompts-patterns/1")
         assert resp.status_code == 200
 
-    def test_get_error(self, authenticated_client, mock_store):
-        """Test error handling for get."""
-        mock_store.get_group_prompt_regex_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{GROUP_BASE}/devs/prompts-patterns/1")
-        assert resp.status_code == 500
-
     def test_update(self, authenticated_client, mock_store):
         """Test updating prompt regex permission."""
         resp = authenticated_client.patch(
@@ -734,22 +573,71 @@ class TestGroupPromptPatterns:
         )
         assert resp.status_code == 200
 
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_group_prompt_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(
-            f"{GROUP_BASE}/devs/prompts-patterns/1",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 500
-
     def test_delete(self, authenticated_client, mock_store):
         """Test deleting prompt regex permission."""
         resp = authenticated_client.delete(f"{GROUP_BASE}/devs/prompts-patterns/1")
         assert resp.status_code == 200
 
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_group_prompt_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{GROUP_BASE}/devs/prompts-patterns/1")
-        assert resp.status_code == 500
+
+# ========================================================================================
+# STORE FAILURES
+# ========================================================================================
+
+
+_STORE_ERROR_CASES = [
+    # experiments
+    ("post", f"{GROUP_BASE}/devs/experiments/exp-1", {"permission": "READ"}, "create_group_experiment_permission"),
+    ("patch", f"{GROUP_BASE}/devs/experiments/exp-1", {"permission": "EDIT"}, "update_group_experiment_permission"),
+    ("delete", f"{GROUP_BASE}/devs/experiments/exp-1", None, "delete_group_experiment_permission"),
+    # registered models
+    ("post", f"{GROUP_BASE}/devs/registered-models/my-model", {"permission": "READ"}, "create_group_model_permission"),
+    ("patch", f"{GROUP_BASE}/devs/registered-models/my-model", {"permission": "EDIT"}, "update_group_model_permission"),
+    ("delete", f"{GROUP_BASE}/devs/registered-models/my-model", None, "delete_group_model_permission"),
+    # prompts
+    ("post", f"{GROUP_BASE}/devs/prompts/my-prompt", {"permission": "READ"}, "create_group_prompt_permission"),
+    ("patch", f"{GROUP_BASE}/devs/prompts/my-prompt", {"permission": "EDIT"}, "update_group_prompt_permission"),
+    ("delete", f"{GROUP_BASE}/devs/prompts/my-prompt", None, "delete_group_prompt_permission"),
+    # experiment patterns
+    ("get", f"{GROUP_BASE}/devs/experiment-patterns", None, "list_group_experiment_regex_permissions"),
+    ("post", f"{GROUP_BASE}/devs/experiment-patterns", {"regex": "exp-.*", "priority": 1, "permission": "READ"}, "create_group_experiment_regex_permission"),
+    ("get", f"{GROUP_BASE}/devs/experiment-patterns/1", None, "get_group_experiment_regex_permission"),
+    (
+        "patch",
+        f"{GROUP_BASE}/devs/experiment-patterns/1",
+        {"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
+        "update_group_experiment_regex_permission",
+    ),
+    ("delete", f"{GROUP_BASE}/devs/experiment-patterns/1", None, "delete_group_experiment_regex_permission"),
+    # registered model patterns
+    ("get", f"{GROUP_BASE}/devs/registered-models-patterns", None, "list_group_registered_model_regex_permissions"),
+    (
+        "post",
+        f"{GROUP_BASE}/devs/registered-models-patterns",
+        {"regex": "model-.*", "priority": 1, "permission": "READ"},
+        "create_group_registered_model_regex_permission",
+    ),
+    ("get", f"{GROUP_BASE}/devs/registered-models-patterns/1", None, "get_group_registered_model_regex_permission"),
+    (
+        "patch",
+        f"{GROUP_BASE}/devs/registered-models-patterns/1",
+        {"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
+        "update_group_registered_model_regex_permission",
+    ),
+    ("delete", f"{GROUP_BASE}/devs/registered-models-patterns/1", None, "delete_group_registered_model_regex_permission"),
+    # prompt patterns
+    ("get", f"{GROUP_BASE}/devs/prompts-patterns", None, "list_group_prompt_regex_permissions"),
+    ("post", f"{GROUP_BASE}/devs/prompts-patterns", {"regex": "prompt-.*", "priority": 1, "permission": "READ"}, "create_group_prompt_regex_permission"),
+    ("get", f"{GROUP_BASE}/devs/prompts-patterns/1", None, "get_group_prompt_regex_permission"),
+    ("patch", f"{GROUP_BASE}/devs/prompts-patterns/1", {"regex": "new-.*", "priority": 2, "permission": "MANAGE"}, "update_group_prompt_regex_permission"),
+    ("delete", f"{GROUP_BASE}/devs/prompts-patterns/1", None, "delete_group_prompt_regex_permission"),
+]
+
+
+@pytest.mark.usefixtures("authenticated_session")
+@pytest.mark.parametrize("verb,url,body,store_attr", _STORE_ERROR_CASES)
+def test_store_error_returns_500(admin_client, mock_store, verb, url, body, store_attr):
+    """Store failures surface as 500 for every CRUD operation."""
+    getattr(mock_store, store_attr).side_effect = Exception("DB error")
+    kwargs = {"json": body} if body is not None else {}
+    resp = getattr(admin_client, verb)(url, **kwargs)
+    assert resp.status_code == 500
@@ -1,8 +1,9 @@
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
+from mlflow.exceptions import MlflowException
 
-from mlflow_oidc_auth.entities import ScorerPermission
 from mlflow_oidc_auth.utils import get_is_admin, get_username
 
 
@@ -20,14 +21,14 @@ class TestScorerPermissionRoutes:
         test_app.dependency_overrides[get_username] = override_get_username
 
         try:
-            scorer_one = MagicMock(
+            scorer_one = SimpleNamespace(
                 experiment_id="exp-1",
                 scorer_name="alpha",
                 scorer_version=1,
                 creation_time=111,
                 scorer_id="s-1",
             )
-            scorer_two = MagicMock(
+            scorer_two = SimpleNamespace(
                 experiment_id="exp-1",
                 scorer_name="beta",
                 scorer_version=2,
@@ -68,15 +69,15 @@ class TestScorerPermissionRoutes:
             test_app.dependency_overrides.pop(get_is_admin, None)
             test_app.dependency_overrides.pop(get_username, None)
 
-    def test_list_scorers_filters_by_permission(self, authenticated_client, monkeypatch):
-        scorer_one = MagicMock(
+    def test_list_scorers_filters_by_permission(self, test_app, authenticated_client, monkeypatch):
+        scorer_one = SimpleNamespace(
             experiment_id="exp-1",
             scorer_name="alpha",
             scorer_version=1,
             creation_time=111,
             scorer_id="s-1",
         )
-        scorer_two = MagicMock(
+        scorer_two = SimpleNamespace(
             experiment_id="exp-1",
             scorer_name="beta",
             scorer_version=2,
@@ -91,54 +92,83 @@ class TestScorerPermissionRoutes:
             "mlflow_oidc_auth.routers.scorers_permissions._get_tracking_store",
             MagicMock(return_value=tracking_store),
         )
-        monkeypatch.setattr(
-            "mlflow_oidc_auth.routers.scorers_permissions.get_username",
-            AsyncMock(return_value="user@example.com"),
-        )
-        monkeypatch.setattr(
-            "mlflow_oidc_auth.routers.scorers_permissions.get_is_admin",
-            AsyncMock(return_value=False),
-        )
 
-        def _can_manage(experiment_id: str, scorer_name: str, username: str) -> bool:
-            return scorer_name == "alpha"
+        async def override_get_username():
+            return "user@example.com"
+
+        async def override_get_is_admin():
+            return False
+
+        test_app.dependency_overrides[get_username] = override_get_username
+        test_app.dependency_overrides[get_is_admin] = override_get_is_admin
+
+        manageable = {"alpha"}
+
+        def _filter_manageable(username: str, experiment_id: str, scorers):
+            return [scorer for scorer in scorers if scorer.scorer_name in manageable]
 
         monkeypatch.setattr(
-            "mlflow_oidc_auth.routers.scorers_permissions.can_manage_scorer",
-            _can_manage,
+            "mlflow_oidc_auth.routers.scorers_permissions.filter_manageable_scorers",
+            _filter_manageable,
         )
 
-        resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/exp-1")
+        try:
+            resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/exp-1")
 
-        assert resp.status_code == 200
-        assert resp.json() == [
-            {
-                "experiment_id": "exp-1",
-                "name": "alpha",
-                "version": 1,
-                "creation_time": 111,
-                "scorer_id": "s-1",
-            }
-        ]
+            assert resp.status_code == 200
+            assert resp.json() == [
+                {
+                    "experiment_id": "exp-1",
+                    "name": "alpha",
+                    "version": 1,
+                    "creation_time": 111,
+                    "scorer_id": "s-1",
+                }
+            ]
+        finally:
+            test_app.dependency_overrides.pop(get_username, None)
+            test_app.dependency_overrides.pop(get_is_admin, None)
 
-    def test_list_scorers_handles_backend_error(self, authenticated_client, monkeypatch):
+    def test_list_scorers_handles_backend_error(self, test_app, authenticated_client, monkeypatch):
         monkeypatch.setattr(
             "mlflow_oidc_auth.routers.scorers_permissions._get_tracking_store",
-            MagicMock(side_effect=Exception("boom")),
-        )
-        monkeypatch.setattr(
-            "mlflow_oidc_auth.routers.scorers_permissions.get_username",
-            AsyncMock(return_value="user@example.com"),
+            MagicMock(side_effect=MlflowException("boom")),
         )
+
+        async def override_get_username():
+            return "user@example.com"
+
+        async def override_get_is_admin():
+            return False
+
+        test_app.dependency_overrides[get_username] = override_get_username
+        test_app.dependency_overrides[get_is_admin] = override_get_is_admin
+
+        try:
+            resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/exp-1")
+
+            assert resp.status_code == 500
+            assert resp.json()["detail"] == "Failed to retrieve scorers"
+        finally:
+            test_app.dependency_overrides.pop(get_username, None)
+            test_app.dependency_overrides.pop(get_is_admin, None)
+
+    def test_list_scorers_propagates_programming_errors(self, test_app, authenticated_client, monkeypatch):
         monkeypatch.setattr(
-            "mlflow_oidc_auth.routers.scorers_permissions.get_is_admin",
-            AsyncMock(return_value=False),
+            "mlflow_oidc_auth.routers.scorers_permissions._get_tracking_store",
+            MagicMock(side_effect=AttributeError("bug")),
         )
 
-        resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/exp-1")
+        async def override_get_is_admin():
+            return True
+
+        test_app.dependency_overrides[get_is_admin] = override_get_is_admin
 
-        assert resp.status_code == 500
-        assert resp.json()["detail"] == "Failed to retrieve scorers"
+        try:
+            with pytest.raises(AttributeError):
+                authenticated_client.get("/api/3.0/mlflow/permissions/scorers/exp-1")
+        finally:
+            test_app.dependency_overrides.pop(get_is_admin, None)
 
     def test_list_scorer_groups(self, authenticated_client, mock_store):
         mock_store.scorer_group_repo.list_groups_for_scorer.return_value = [
@@ -165,9 +195,10 @@ class TestScorerPermissionRoutes:
         assert resp.json()["detail"] == "Failed to retrieve scorer group permissions"
 
     def test_list_scorer_users(self, authenticated_client, mock_store):
-        _admin_user, regular_user, service_user = mock_store.list_users.return_value
-        regular_user.scorer_permissions = [ScorerPermission("123", "my_scorer", "READ", user_id=regular_user.id)]
-        service_user.scorer_permissions = [ScorerPermission("123", "my_scorer", "MANAGE", user_id=service_user.id)]
+        mock_store.scorer_repo.list_users_for_scorer.return_value = [
+            ("user@example.com", "READ", False),
+            ("service@example.com", "MANAGE", True),
+        ]
 
         resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/123/my_scorer/users")
 
@@ -180,10 +211,10 @@ class TestScorerPermissionRoutes:
                 "kind": "service-account",
             },
         ]
-        mock_store.list_users.assert_called_once_with(all=True)
+        mock_store.scorer_repo.list_users_for_scorer.assert_called_once_with("123", "my_scorer")
 
     def test_list_scorer_users_handles_backend_error(self, authenticated_client, mock_store):
-        mock_store.list_users.side_effect = Exception("db offline")
+        mock_store.scorer_repo.list_users_for_scorer.side_effect = Exception("db offline")
 
         resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/123/my_scorer/users")
 
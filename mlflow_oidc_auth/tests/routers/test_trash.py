@@ -2,11 +2,17 @@
 Tests for the trash router.
 """
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
 from mlflow.entities import ViewType
+from mlflow.exceptions import InvalidUrlException, MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
 
 from mlflow_oidc_auth.routers.trash import (
     list_deleted_experiments,
@@ -17,22 +23,131 @@ from mlflow_oidc_auth.routers.trash import (
 )
 
 
+# 2025-01-01T00:00:00Z; the trash router's clock is pinned here for every test.
+FROZEN_NOW_MILLIS = 1735689600000
+
+
+@pytest.fixture(autouse=True)
+def _frozen_now(mocker):
+    mocker.patch("mlflow_oidc_auth.routers.trash.get_current_time_millis", return_value=FROZEN_NOW_MILLIS)
+
+
+# A deleted run's info fields, which are also exactly what list_deleted_runs reports for it.
+DELETED_RUN_PAYLOAD = {
+    "run_id": "run-1",
+    "experiment_id": "exp-1",
+    "run_name": "name-1",
+    "status": "FINISHED",
+    "start_time": 1,
+    "end_time": 2,
+    "lifecycle_stage": "deleted",
+}
+
+
+class Page(list):
+    """Paged search result as returned by the tracking store search methods."""
+
+    def __init__(self, items, token=None):
+        super().__init__(items)
+        self.token = token
+
+    def __add__(self, other):
+        return Page(list(self) + list(other), token=None)
+
+
+@pytest.fixture
+def make_run():
+    """Build a run whose info defaults to a deleted, finished run; keyword arguments override info fields."""
+
+    def _make_run(**info):
+        return SimpleNamespace(
+            info=SimpleNamespace(
+                **{
+                    "run_id": "run-1",
+                    "experiment_id": "exp-1",
+                    "run_name": "n",
+                    "status": "FINISHED",
+                    "start_time": 0,
+                    "end_time": 1,
+                    "lifecycle_stage": "deleted",
+                    "artifact_uri": "invalid://",
+                    **info,
+                }
+            )
+        )
+
+    return _make_run
+
+
+@pytest.fixture
+def all_experiments(mocker):
+    """Experiments the router scopes run lookups to when no experiment filter is given."""
+    return mocker.patch(
+        "mlflow_oidc_auth.routers.trash.fetch_all_experiments",
+        return_value=[SimpleNamespace(experiment_id="exp-1"), SimpleNamespace(experiment_id="exp-2")],
+    )
+
+
+@pytest.fixture
+def backend_store(mocker):
+    """Fresh tracking store mock for a single test, returned by the router's _get_tracking_store.
+
+    Specced on SqlAlchemyStore, the store that provides the private deleted-run
+    and hard-delete methods the trash router relies on, so misspelled store
+    methods fail instead of silently returning child mocks.
+    """
+    store = MagicMock(spec_set=SqlAlchemyStore)
+    mocker.patch("mlflow_oidc_auth.routers.trash._get_tracking_store", return_value=store)
+    return store
+
+
+@pytest.fixture
+def public_api_store(mocker):
+    """Tracking store mock limited to the public AbstractStore API, returned by the router's _get_tracking_store.
+
+    It has none of the private _get_deleted_runs/_hard_delete_* methods, so the
+    router takes its fallback or unsupported-backend branches; tests add back
+    the ones they need.
+    """
+    store = MagicMock(spec=AbstractStore)
+    mocker.patch("mlflow_oidc_auth.routers.trash._get_tracking_store", return_value=store)
+    return store
+
+
+class _RecordingJSONResponse(JSONResponse):
+    """JSONResponse that keeps the content it rendered, so tests need not decode the body."""
+
+    def render(self, content):
+        self.body_dict = content
+        return super().render(content)
+
+
+@pytest.fixture(autouse=True)
+def _record_json_content(mocker):
+    mocker.patch("mlflow_oidc_auth.routers.trash.JSONResponse", _RecordingJSONResponse)
+
+
+def _payload(response):
+    """Return the content a trash handler rendered into its response."""
+    return response.body_dict
+
+
 class TestListDeletedExperimentsEndpoint:
     """Test the list deleted experiments endpoint functionality."""
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
-    async def test_list_deleted_experiments_success(self, mock_fetch_all_experiments):
+    async def test_list_deleted_experiments_success(self, mocker):
         """Test successfully listing deleted experiments as admin."""
+        mock_fetch_all_experiments = mocker.patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
         # Mock deleted experiments
-        mock_deleted_experiment = MagicMock()
-        mock_deleted_experiment.experiment_id = "123"
-        mock_deleted_experiment.name = "Deleted Experiment"
-        mock_deleted_experiment.lifecycle_stage = "deleted"
-        mock_deleted_experiment.artifact_location = "/tmp/artifacts/123"
-        mock_deleted_experiment.tags = {"tag1": "value1"}
-        mock_deleted_experiment.creation_time = 1000000
-        mock_deleted_experiment.last_update_time = 2000000
+        mock_deleted_experiment = SimpleNamespace(
+            experiment_id="123",
+            name="Deleted Experiment",
+            lifecycle_stage="deleted",
+            artifact_location="/tmp/artifacts/123",
+            tags={"tag1": "value1"},
+            creation_time=1000000,
+            last_update_time=2000000,
+        )
 
         mock_fetch_all_experiments.return_value = [mock_deleted_experiment]
 
@@ -45,18 +160,15 @@ class TestListDeletedExperimentsEndpoint:
         # Verify response
         assert result.status_code == 200
         # Access the JSON content from the JSONResponse
-        import json
-
-        response_data = json.loads(result.body)
+        response_data = _payload(result)
         assert "deleted_experiments" in response_data
         assert len(response_data["deleted_experiments"]) == 1
         assert response_data["deleted_experiments"][0]["experiment_id"] == "123"
         assert response_data["deleted_experiments"][0]["name"] == "Deleted Experiment"
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
-    async def test_list_deleted_experiments_empty(self, mock_fetch_all_experiments):
+    async def test_list_deleted_experiments_empty(self, mocker):
         """Test listing deleted experiments when none exist."""
+        mock_fetch_all_experiments = mocker.patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
         mock_fetch_all_experiments.return_value = []
 
         # Call the function
@@ -67,541 +179,411 @@ class TestListDeletedExperimentsEndpoint:
 
         # Verify response
         assert result.status_code == 200
-        import json
-
-        response_data = json.loads(result.body)
+        response_data = _payload(result)
         assert "deleted_experiments" in response_data
         assert len(response_data["deleted_experiments"]) == 0
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
-    async def test_list_deleted_experiments_error(self, mock_fetch_all_experiments):
+    async def test_list_deleted_experiments_error(self, mocker):
         """Test error handling when fetching deleted experiments fails."""
+        mock_fetch_all_experiments = mocker.patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
         mock_fetch_all_experiments.side_effect = Exception("MLflow error")
 
         # Call the function and verify it raises HTTPException
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as excinfo:
             await list_deleted_experiments(admin_username="admin@example.com")
 
         assert excinfo.value.status_code == 500
         assert excinfo.value.detail == "Failed to retrieve deleted experiments"
 
-    def test_list_deleted_experiments_integration_admin(self, admin_client: TestClient):
-        """Test the endpoint through FastAPI test client as admin."""
-        # Mock the fetch function
-        with patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments") as mock_fetch:
-            mock_experiment = MagicMock()
-            mock_experiment.experiment_id = "123"
-            mock_experiment.name = "Deleted Experiment"
-            mock_experiment.lifecycle_stage = "deleted"
-            mock_experiment.artifact_location = "/tmp/artifacts/123"
-            mock_experiment.tags = {"tag1": "value1"}
-            mock_experiment.creation_time = 1000000
-            mock_experiment.last_update_time = 2000000
-            mock_fetch.return_value = [mock_experiment]
-
-            response = admin_client.get("/oidc/trash/experiments")
-
-            assert response.status_code == 200
+    @pytest.mark.slow
+    @pytest.mark.parametrize("client_name, expected_status", [("admin_client", 200), ("client", 403)], ids=["admin", "non_admin"])
+    def test_list_deleted_experiments_integration(self, request, mocker, client_name, expected_status):
+        """Test the endpoint through the FastAPI test client; non-admins are forbidden."""
+        mock_fetch = mocker.patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
+        mock_fetch.return_value = [
+            SimpleNamespace(
+                experiment_id="123",
+                name="Deleted Experiment",
+                lifecycle_stage="deleted",
+                artifact_location="/tmp/artifacts/123",
+                tags={"tag1": "value1"},
+                creation_time=1000000,
+                last_update_time=2000000,
+            )
+        ]
+
+        response = request.getfixturevalue(client_name).get("/oidc/trash/experiments")
+
+        assert response.status_code == expected_status
+        if expected_status == 200:
             data = response.json()
-            assert "deleted_experiments" in data
             assert len(data["deleted_experiments"]) == 1
             assert data["deleted_experiments"][0]["experiment_id"] == "123"
             assert data["deleted_experiments"][0]["name"] == "Deleted Experiment"
             assert data["deleted_experiments"][0]["lifecycle_stage"] == "deleted"
-
-    def test_list_deleted_experiments_integration_non_admin(self, client: TestClient):
-        """Test the endpoint through FastAPI test client as non-admin (should be forbidden)."""
-        response = client.get("/oidc/trash/experiments")
-
-        # Should be forbidden for non-admin users
-        assert response.status_code == 403
+        else:
+            mock_fetch.assert_not_called()
 
 
 class TestListDeletedRunsEndpoint:
     """Tests for listing deleted runs."""
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_list_deleted_runs_success(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_list_deleted_runs_success(self, make_run, backend_store, all_experiments):
         backend_store._get_deleted_runs.return_value = ["run-1", "run-2"]
 
-        run_deleted = MagicMock()
-        run_deleted.info.run_id = "run-1"
-        run_deleted.info.experiment_id = "exp-1"
-        run_deleted.info.run_name = "name-1"
-        run_deleted.info.status = "FINISHED"
-        run_deleted.info.start_time = 1
-        run_deleted.info.end_time = 2
-        run_deleted.info.lifecycle_stage = "deleted"
-
-        run_active = MagicMock()
-        run_active.info.run_id = "run-2"
-        run_active.info.experiment_id = "exp-2"
-        run_active.info.run_name = "name-2"
-        run_active.info.status = "FINISHED"
-        run_active.info.start_time = 3
-        run_active.info.end_time = 4
-        run_active.info.lifecycle_stage = "active"
-
-        backend_store.get_run.side_effect = [run_deleted, run_active]
-        mock_get_store.return_value = backend_store
-
-        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None)
+        run_deleted = make_run(**DELETED_RUN_PAYLOAD)
+
+        run_active = make_run(run_id="run-2", experiment_id="exp-2", run_name="name-2", start_time=3, end_time=4, lifecycle_stage="active")
+
+        backend_store.search_runs.return_value = [run_active, run_deleted]
+
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=None, page_token=None)
 
         backend_store._get_deleted_runs.assert_called_once()
+        backend_store.search_runs.assert_called_once_with(
+            experiment_ids=["exp-1", "exp-2"],
+            filter_string="attributes.run_id IN ('run-1', 'run-2')",
+            run_view_type=ViewType.ALL,
+            max_results=2,
+        )
+        backend_store.get_run.assert_not_called()
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert payload["deleted_runs"] == [
-            {
-                "run_id": "run-1",
-                "experiment_id": "exp-1",
-                "run_name": "name-1",
-                "status": "FINISHED",
-                "start_time": 1,
-                "end_time": 2,
-                "lifecycle_stage": "deleted",
-            }
-        ]
+        payload = _payload(result)
+        assert payload["deleted_runs"] == [DELETED_RUN_PAYLOAD]
 
-    @pytest.mark.asyncio
     async def test_list_deleted_runs_invalid_older_than(self):
-        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than="bad")
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than="bad", max_results=None, page_token=None)
         assert result.status_code == 400
 
-    def test_list_deleted_runs_integration_admin(self, admin_client: TestClient):
-        with patch("mlflow_oidc_auth.routers.trash._get_store") as mock_get_store:
-            backend_store = MagicMock()
-            backend_store._get_deleted_runs.return_value = ["run-1"]
-
-            run_deleted = MagicMock()
-            run_deleted.info.run_id = "run-1"
-            run_deleted.info.experiment_id = "exp-1"
-            run_deleted.info.run_name = "deleted-run"
-            run_deleted.info.status = "FINISHED"
-            run_deleted.info.start_time = 10
-            run_deleted.info.end_time = 20
-            run_deleted.info.lifecycle_stage = "deleted"
-
-            backend_store.get_run.return_value = run_deleted
-            mock_get_store.return_value = backend_store
-
-            response = admin_client.get("/oidc/trash/runs")
-            assert response.status_code == 200
-            assert response.json()["deleted_runs"][0]["run_id"] == "run-1"
+    async def test_list_deleted_runs_paginates_deleted_run_ids(self, make_run, backend_store, all_experiments):
+        backend_store._get_deleted_runs.return_value = ["r1", "r2", "r3"]
+        backend_store.get_run.side_effect = lambda run_id: make_run(run_id=run_id)
 
-    def test_list_deleted_runs_integration_non_admin(self, client: TestClient):
-        response = client.get("/oidc/trash/runs")
-        assert response.status_code == 403
+        first = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=2, page_token=None)
+        first_payload = _payload(first)
+        second = await list_deleted_runs(
+            admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=2, page_token=first_payload["next_page_token"]
+        )
+        second_payload = _payload(second)
+
+        assert [run["run_id"] for run in first_payload["deleted_runs"]] == ["r1", "r2"]
+        assert [run["run_id"] for run in second_payload["deleted_runs"]] == ["r3"]
+        assert second_payload["next_page_token"] is None
+        # Pages look runs up by id instead of listing every experiment per request.
+        all_experiments.assert_not_called()
+        backend_store.search_runs.assert_not_called()
+
+    async def test_list_deleted_runs_pages_are_stable_across_store_order(self, make_run, backend_store):
+        backend_store._get_deleted_runs.side_effect = [["r3", "r1", "r2"], ["r2", "r3", "r1"]]
+        backend_store.get_run.side_effect = lambda run_id: make_run(run_id=run_id)
+
+        first = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=2, page_token=None)
+        first_payload = _payload(first)
+        second = await list_deleted_runs(
+            admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=2, page_token=first_payload["next_page_token"]
+        )
+
+        assert [run["run_id"] for run in first_payload["deleted_runs"]] == ["r1", "r2"]
+        assert [run["run_id"] for run in _payload(second)["deleted_runs"]] == ["r3"]
+
+    async def test_list_deleted_runs_invalid_page_token(self, backend_store):
+        backend_store._get_deleted_runs.return_value = ["r1"]
+
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=1, page_token="not-a-token")
+
+        assert result.status_code == 400
+        assert _payload(result) == {"error": "Invalid page token"}
+
+    async def test_list_deleted_runs_paginates_search_fallback(self, make_run, public_api_store):
+        public_api_store.search_runs.return_value = Page([make_run(run_id="r1")], token="store-token")
+        public_api_store.get_run.side_effect = lambda run_id: make_run(run_id=run_id)
+
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids="exp-1", older_than=None, max_results=1, page_token="prev")
+
+        public_api_store.search_runs.assert_called_once_with(
+            experiment_ids=["exp-1"], filter_string="", run_view_type=ViewType.DELETED_ONLY, max_results=1, page_token="prev"
+        )
+        payload = _payload(result)
+        assert [run["run_id"] for run in payload["deleted_runs"]] == ["r1"]
+        assert payload["next_page_token"] == "store-token"
+
+    async def test_list_deleted_runs_search_fallback_invalid_page_token(self, public_api_store):
+        public_api_store.search_runs.side_effect = MlflowException("Invalid page token", error_code=INVALID_PARAMETER_VALUE)
+
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids="exp-1", older_than=None, max_results=1, page_token="not-a-token")
+
+        assert result.status_code == 400
+        assert _payload(result) == {"error": "Invalid page token"}
+
+    async def test_list_deleted_runs_search_fallback_store_error_without_token(self, public_api_store):
+        public_api_store.search_runs.side_effect = MlflowException("database is down")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await list_deleted_runs(admin_username="admin@example.com", experiment_ids="exp-1", older_than=None, max_results=10, page_token=None)
+
+        assert exc_info.value.status_code == 500
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("client_name, expected_status", [("admin_client", 200), ("client", 403)], ids=["admin", "non_admin"])
+    def test_list_deleted_runs_integration(self, request, make_run, backend_store, all_experiments, client_name, expected_status):
+        backend_store._get_deleted_runs.return_value = ["run-1"]
+        backend_store.search_runs.return_value = [
+            make_run(run_id="run-1", experiment_id="exp-1", run_name="deleted-run", start_time=10, end_time=20, lifecycle_stage="deleted")
+        ]
+
+        response = request.getfixturevalue(client_name).get("/oidc/trash/runs")
+
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            assert response.json()["deleted_runs"][0]["run_id"] == "run-1"
+        else:
+            backend_store._get_deleted_runs.assert_not_called()
 
 
 class TestRestoreExperimentEndpoint:
     """Tests for restoring experiments."""
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_restore_experiment_success(self, mock_get_store):
-        backend_store = MagicMock()
-        deleted = MagicMock()
-        deleted.lifecycle_stage = "deleted"
-        deleted.experiment_id = "123"
-        deleted.name = "exp"
-        deleted.last_update_time = 1
-
-        restored = MagicMock()
-        restored.lifecycle_stage = "active"
-        restored.experiment_id = "123"
-        restored.name = "exp"
-        restored.last_update_time = 2
-
-        backend_store.get_experiment.side_effect = [deleted, restored]
-        mock_get_store.return_value = backend_store
+    async def test_restore_experiment_success(self, backend_store):
+        deleted = SimpleNamespace(lifecycle_stage="deleted", experiment_id="123", name="exp", last_update_time=1)
+
+        restored = SimpleNamespace(lifecycle_stage="active", experiment_id="123", name="exp", last_update_time=2)
+
+        backend_store.get_experiment.side_effect = iter([deleted, restored])
 
         result = await restore_experiment(experiment_id="123", admin_username="admin@example.com")
         backend_store.restore_experiment.assert_called_once_with("123")
         assert result.status_code == 200
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_restore_experiment_not_deleted(self, mock_get_store):
-        backend_store = MagicMock()
-        active = MagicMock()
-        active.lifecycle_stage = "active"
-        backend_store.get_experiment.return_value = active
-        mock_get_store.return_value = backend_store
+    @pytest.mark.parametrize(
+        "lookup, expected_status",
+        [(SimpleNamespace(lifecycle_stage="active"), 400), (Exception("not found"), 404)],
+        ids=["not_deleted", "not_found"],
+    )
+    async def test_restore_experiment_rejected(self, lookup, expected_status, backend_store):
+        backend_store.get_experiment.side_effect = iter([lookup])
 
         result = await restore_experiment(experiment_id="123", admin_username="admin@example.com")
-        assert result.status_code == 400
-
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_restore_experiment_not_found(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store.get_experiment.side_effect = Exception("not found")
-        mock_get_store.return_value = backend_store
-
-        result = await restore_experiment(experiment_id="missing", admin_username="admin@example.com")
-        assert result.status_code == 404
+        assert result.status_code == expected_status
+        backend_store.restore_experiment.assert_not_called()
 
 
 class TestRestoreRunEndpoint:
     """Tests for restoring runs."""
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_restore_run_success(self, mock_get_store):
-        backend_store = MagicMock()
-        deleted = MagicMock()
-        deleted.info.lifecycle_stage = "deleted"
-        deleted.info.run_id = "run-1"
-        deleted.info.experiment_id = "exp-1"
-        deleted.info.run_name = "r"
-        deleted.info.status = "FINISHED"
-
-        restored = MagicMock()
-        restored.info.lifecycle_stage = "active"
-        restored.info.run_id = "run-1"
-        restored.info.experiment_id = "exp-1"
-        restored.info.run_name = "r"
-        restored.info.status = "FINISHED"
-
-        backend_store.get_run.side_effect = [deleted, restored]
-        mock_get_store.return_value = backend_store
+    async def test_restore_run_success(self, make_run, backend_store):
+        deleted = make_run(lifecycle_stage="deleted", run_id="run-1", experiment_id="exp-1", run_name="r")
+
+        restored = make_run(lifecycle_stage="active", run_id="run-1", experiment_id="exp-1", run_name="r")
+
+        backend_store.get_run.side_effect = iter([deleted, restored])
 
         result = await restore_run(run_id="run-1", admin_username="admin@example.com")
         backend_store.restore_run.assert_called_once_with("run-1")
         assert result.status_code == 200
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_restore_run_not_deleted(self, mock_get_store):
-        backend_store = MagicMock()
-        active = MagicMock()
-        active.info.lifecycle_stage = "active"
-        backend_store.get_run.return_value = active
-        mock_get_store.return_value = backend_store
+    @pytest.mark.parametrize(
+        "lookup, expected_status",
+        [(SimpleNamespace(info=SimpleNamespace(lifecycle_stage="active")), 400), (Exception("missing"), 404)],
+        ids=["not_deleted", "not_found"],
+    )
+    async def test_restore_run_rejected(self, lookup, expected_status, backend_store):
+        backend_store.get_run.side_effect = iter([lookup])
 
         result = await restore_run(run_id="run-1", admin_username="admin@example.com")
-        assert result.status_code == 400
-
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_restore_run_not_found(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store.get_run.side_effect = Exception("missing")
-        mock_get_store.return_value = backend_store
-
-        result = await restore_run(run_id="missing", admin_username="admin@example.com")
-        assert result.status_code == 404
+        assert result.status_code == expected_status
+        backend_store.restore_run.assert_not_called()
 
 
 class TestAdditionalTrashBehaviour:
     """Extra tests to improve coverage for edge cases and cleanup logic."""
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
-    async def test_list_deleted_experiments_handles_none_tags(self, mock_fetch_all_experiments):
-        mock_deleted_experiment = MagicMock()
-        mock_deleted_experiment.experiment_id = "321"
-        mock_deleted_experiment.name = "Deleted No Tags"
-        mock_deleted_experiment.lifecycle_stage = "deleted"
-        mock_deleted_experiment.artifact_location = "/tmp/artifacts/321"
-        mock_deleted_experiment.tags = None
-        mock_deleted_experiment.creation_time = 10
-        mock_deleted_experiment.last_update_time = 20
+    async def test_list_deleted_experiments_handles_none_tags(self, mocker):
+        mock_fetch_all_experiments = mocker.patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
+        mock_deleted_experiment = SimpleNamespace(
+            experiment_id="321",
+            name="Deleted No Tags",
+            lifecycle_stage="deleted",
+            artifact_location="/tmp/artifacts/321",
+            tags=None,
+            creation_time=10,
+            last_update_time=20,
+        )
 
         mock_fetch_all_experiments.return_value = [mock_deleted_experiment]
 
         result = await list_deleted_experiments(admin_username="admin@example.com")
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert payload["deleted_experiments"][0]["tags"] == {}
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_list_deleted_runs_fallback_and_empty(self, mock_get_store, mock_fetch_all_experiments):
+    async def test_list_deleted_runs_fallback_and_empty(self, mocker, public_api_store):
+        mock_fetch_all_experiments = mocker.patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
         # Backend lacks _get_deleted_runs and search_runs raises -> fallback yields empty runs
-        backend_store = MagicMock()
-        if hasattr(backend_store, "_get_deleted_runs"):
-            delattr(backend_store, "_get_deleted_runs")
-        backend_store.search_runs.side_effect = Exception("search failed")
-        mock_get_store.return_value = backend_store
+        public_api_store.search_runs.side_effect = Exception("search failed")
 
         # Make fetch_all_experiments return one experiment id
-        exp = MagicMock()
-        exp.experiment_id = "exp-1"
+        exp = SimpleNamespace(experiment_id="exp-1")
         mock_fetch_all_experiments.return_value = [exp]
 
-        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None)
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=None, page_token=None)
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert payload["deleted_runs"] == []
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_list_deleted_runs_skips_unfetchable_run(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_list_deleted_runs_skips_unfetchable_run(self, backend_store, all_experiments):
         backend_store._get_deleted_runs.return_value = ["r-1"]
+        # The batched lookup is rejected, so runs are fetched one by one
+        backend_store.search_runs.side_effect = MlflowException("filter not supported")
         backend_store.get_run.side_effect = Exception("unfetchable")
-        mock_get_store.return_value = backend_store
 
-        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None)
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=None, page_token=None)
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert payload["deleted_runs"] == []
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_backend_without_hard_delete_run(self, mock_get_store):
-        backend_store = MagicMock()
-        # Remove _hard_delete_run capability
-        if hasattr(backend_store, "_hard_delete_run"):
-            delattr(backend_store, "_hard_delete_run")
-        mock_get_store.return_value = backend_store
+    async def test_list_deleted_runs_batches_run_lookups(self, mocker, make_run, backend_store):
+        mocker.patch("mlflow_oidc_auth.routers.trash._RUN_BATCH_SIZE", 2)
+        backend_store._get_deleted_runs.return_value = ["r1", "r2", "r3"]
+        backend_store.search_runs.side_effect = iter([[make_run(run_id="r2"), make_run(run_id="r1")], [make_run(run_id="r3")]])
 
-        result = await permanently_delete_all_trashed_entities(admin_username="admin@example.com", older_than=None)
-        assert result.status_code == 400
-        import json
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids="exp-1", older_than=None, max_results=None, page_token=None)
+
+        assert [call.kwargs["filter_string"] for call in backend_store.search_runs.call_args_list] == [
+            "attributes.run_id IN ('r1', 'r2')",
+            "attributes.run_id IN ('r3')",
+        ]
+        assert [run["run_id"] for run in _payload(result)["deleted_runs"]] == ["r1", "r2", "r3"]
+
+    async def test_cleanup_backend_without_hard_delete_run(self, public_api_store):
 
-        payload = json.loads(result.body)
+        result = await permanently_delete_all_trashed_entities(admin_username="admin@example.com", older_than=None, stream=False)
+        assert result.status_code == 400
+        payload = _payload(result)
         assert "Backend store does not support permanent deletion of runs" in payload["error"]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_experiment_not_found_returns_404(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
+    async def test_cleanup_experiment_not_found_returns_404(self, backend_store):
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock())
         backend_store.get_experiment.side_effect = Exception("missing")
-        mock_get_store.return_value = backend_store
 
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             run_ids=None,
             experiment_ids="nope",
             older_than=None,
+            stream=False,
         )
         assert result.status_code == 404
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert "Experiment nope not found" in payload["error"]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_experiment_active_returns_400(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
+    async def test_cleanup_experiment_active_returns_400(self, backend_store):
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock())
 
-        active = MagicMock()
-        active.lifecycle_stage = "active"
-        active.experiment_id = "a1"
+        active = SimpleNamespace(lifecycle_stage="active", experiment_id="a1")
         backend_store.get_experiment.return_value = active
-        mock_get_store.return_value = backend_store
 
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             run_ids=None,
             experiment_ids="a1",
             older_than=None,
+            stream=False,
         )
         assert result.status_code == 400
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert "are not in deleted lifecycle stage" in payload["error"]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_delete_runs_and_experiments_happy_path(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
+    async def test_cleanup_delete_runs_and_experiments_happy_path(self, mocker, make_run, backend_store):
+        mock_get_artifact_repo = mocker.patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock())
 
         # Setup run to be deleted
-        run = MagicMock()
-        run.info.run_id = "run-1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "invalid://"
-        run.info.experiment_id = "exp-1"
+        run = make_run(run_id="run-1", lifecycle_stage="deleted", experiment_id="exp-1")
         backend_store.get_run.return_value = run
 
         # _get_deleted_runs returns our run id
         backend_store._get_deleted_runs.return_value = ["run-1"]
 
         # Experiment to delete
-        exp = MagicMock()
-        exp.experiment_id = "exp-1"
-        exp.lifecycle_stage = "deleted"
-        exp.last_update_time = 0
+        exp = SimpleNamespace(experiment_id="exp-1", lifecycle_stage="deleted", last_update_time=0)
 
         backend_store.get_experiment.return_value = exp
 
         # Make artifact repo deletion raise InvalidUrlException to exercise that branch
-        from mlflow.exceptions import InvalidUrlException
-
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.side_effect = InvalidUrlException("bad url")
+        mock_repo = MagicMock(**{"delete_artifacts.side_effect": InvalidUrlException("bad url")})
         mock_get_artifact_repo.return_value = mock_repo
 
-        mock_get_store.return_value = backend_store
-
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             run_ids="run-1",
             experiment_ids="exp-1",
             older_than=None,
+            stream=False,
         )
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert payload["deleted_runs"] == ["run-1"]
         assert payload["deleted_experiments"] == ["exp-1"]
 
-    @pytest.mark.asyncio
     @pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_run_not_deleted_and_hard_delete_experiment_failure(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_cleanup_run_not_deleted_and_hard_delete_experiment_failure(self, make_run, backend_store):
         backend_store._hard_delete_run = MagicMock()
 
         # Run exists but is active
-        run = MagicMock()
-        run.info.run_id = "run-2"
-        run.info.lifecycle_stage = "active"
+        run = make_run(run_id="run-2", lifecycle_stage="active")
         backend_store.get_run.return_value = run
 
         # Experiment deletion will raise
-        exp = MagicMock()
-        exp.experiment_id = "e2"
-        exp.lifecycle_stage = "deleted"
+        exp = SimpleNamespace(experiment_id="e2", lifecycle_stage="deleted")
         backend_store.get_experiment.return_value = exp
         backend_store._hard_delete_experiment.side_effect = Exception("boom")
 
-        mock_get_store.return_value = backend_store
-
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             run_ids="run-2",
             experiment_ids="e2",
             older_than=None,
+            stream=False,
         )
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         # run should not be deleted and should appear in failed_runs
         assert any(f["run_id"] == "run-2" for f in payload.get("failed_runs", []))
         # experiment deletion should have failed
         assert any(f["experiment_id"] == "e2" for f in payload.get("failed_experiments", []))
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_list_deleted_runs_filters_by_experiment(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store._get_deleted_runs.return_value = ["r1", "r2"]
+    async def test_list_deleted_runs_filters_by_experiment(self, make_run, backend_store):
+        backend_store._get_deleted_runs.return_value = ["run-1", "r2"]
+
+        run1 = make_run(**DELETED_RUN_PAYLOAD)
+
+        run2 = make_run(run_id="r2", experiment_id="exp-2", lifecycle_stage="deleted", run_name="n2", start_time=3, end_time=4)
+
+        backend_store.search_runs.return_value = [run1, run2]
 
-        run1 = MagicMock()
-        run1.info.run_id = "r1"
-        run1.info.experiment_id = "exp-1"
-        run1.info.lifecycle_stage = "deleted"
-        run1.info.run_name = "n1"
-        run1.info.status = "FINISHED"
-        run1.info.start_time = 1
-        run1.info.end_time = 2
-
-        run2 = MagicMock()
-        run2.info.run_id = "r2"
-        run2.info.experiment_id = "exp-2"
-        run2.info.lifecycle_stage = "deleted"
-        run2.info.run_name = "n2"
-        run2.info.status = "FINISHED"
-        run2.info.start_time = 3
-        run2.info.end_time = 4
-
-        backend_store.get_run.side_effect = [run1, run2]
-        mock_get_store.return_value = backend_store
-
-        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids="exp-1", older_than=None)
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids="exp-1", older_than=None, max_results=None, page_token=None)
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert payload["deleted_runs"] == [
-            {
-                "run_id": "r1",
-                "experiment_id": "exp-1",
-                "run_name": "n1",
-                "status": "FINISHED",
-                "start_time": 1,
-                "end_time": 2,
-                "lifecycle_stage": "deleted",
-            }
-        ]
+        payload = _payload(result)
+        assert payload["deleted_runs"] == [DELETED_RUN_PAYLOAD]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_list_deleted_runs_backend_raises_returns_500(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_list_deleted_runs_backend_raises_returns_500(self, backend_store):
         backend_store._get_deleted_runs.side_effect = Exception("boom")
-        mock_get_store.return_value = backend_store
-
-        from fastapi import HTTPException
 
         with pytest.raises(HTTPException) as excinfo:
-            await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None)
+            await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=None, page_token=None)
 
         assert excinfo.value.status_code == 500
         assert excinfo.value.detail == "Failed to retrieve deleted runs"
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_fetch_experiments_and_runs(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
-
-        # Implement a simple Page class used by backend search methods
-        class Page(list):
-            def __init__(self, items, token=None):
-                super().__init__(items)
-                self.token = token
-
-            def __add__(self, other):
-                return Page(list(self) + list(other), token=None)
+    async def test_cleanup_fetch_experiments_and_runs(self, mocker, make_run, backend_store):
+        mock_get_artifact_repo = mocker.patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock())
 
         # Experiment returned by search_experiments
-        exp = MagicMock()
-        exp.experiment_id = "e1"
-        exp.lifecycle_stage = "deleted"
-        exp.last_update_time = 0
+        exp = SimpleNamespace(experiment_id="e1", lifecycle_stage="deleted", last_update_time=0)
 
         # Run returned by search_runs
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "invalid://"
-        run.info.experiment_id = "e1"
-        run.info.run_name = "rname"
-        run.info.status = "FINISHED"
-        run.info.start_time = 1
-        run.info.end_time = 2
+        run = make_run(run_id="r1", lifecycle_stage="deleted", experiment_id="e1", run_name="rname", start_time=1, end_time=2)
 
         backend_store.search_experiments.return_value = Page([exp], token=None)
         backend_store.search_runs.return_value = Page([run], token=None)
@@ -609,59 +591,71 @@ class TestAdditionalTrashBehaviour:
         backend_store.get_run.return_value = run
 
         # artifact repo raising InvalidUrl triggers warning branch but doesn't fail
-        from mlflow.exceptions import InvalidUrlException
-
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.side_effect = InvalidUrlException("bad url")
+        mock_repo = MagicMock(**{"delete_artifacts.side_effect": InvalidUrlException("bad url")})
         mock_get_artifact_repo.return_value = mock_repo
 
-        mock_get_store.return_value = backend_store
-
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             older_than=None,
             run_ids=None,
             experiment_ids=None,
+            stream=False,
         )
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert payload["deleted_runs"] == ["r1"]
         assert payload["deleted_experiments"] == ["e1"]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_list_deleted_runs_paged_search_runs(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_cleanup_stream_emits_ndjson_per_entity(self, mocker, make_run, backend_store):
+        mocker.patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock(side_effect=Exception("locked")))
+        backend_store.get_experiment.return_value = SimpleNamespace(experiment_id="e1", lifecycle_stage="deleted", last_update_time=0)
+        backend_store.search_runs.return_value = Page([], token=None)
+        backend_store._get_deleted_runs.return_value = ["r1"]
+        backend_store.get_run.return_value = make_run(run_id="r1")
+
+        result = await permanently_delete_all_trashed_entities(
+            admin_username="admin@example.com", older_than=None, run_ids="r1", experiment_ids="e1", stream=True
+        )
 
-        # Implement a Page that supports token and addition
-        class Page(list):
-            def __init__(self, items, token=None):
-                super().__init__(items)
-                self.token = token
+        assert result.media_type == "application/x-ndjson"
+        body = b"".join([chunk async for chunk in result.body_iterator])
+        assert body.splitlines() == [
+            b'{"deleted_run":"r1"}',
+            b'{"failed_experiment":{"experiment_id":"e1","error":"locked"}}',
+            b'{"total_deleted_runs":1,"total_deleted_experiments":0}',
+        ]
+
+    async def test_cleanup_stream_audits_when_closed_early(self, mocker, make_run, backend_store):
+        mocker.patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
+        streaming_response = mocker.patch("mlflow_oidc_auth.routers.trash.StreamingResponse")
+        emit_audit_event = mocker.patch("mlflow_oidc_auth.routers.trash.emit_audit_event")
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock())
+        backend_store.get_experiment.return_value = SimpleNamespace(experiment_id="e1", lifecycle_stage="deleted", last_update_time=0)
+        backend_store.search_runs.return_value = Page([], token=None)
+        backend_store._get_deleted_runs.return_value = ["r1", "r2"]
+        backend_store.get_run.side_effect = lambda run_id: make_run(run_id=run_id)
+
+        await permanently_delete_all_trashed_entities(admin_username="admin@example.com", older_than=None, run_ids="r1,r2", experiment_ids="e1", stream=True)
+        stream = streaming_response.call_args.args[0]
+        next(stream)
+        stream.close()
+
+        assert backend_store._hard_delete_run.call_count == 1
+        backend_store._hard_delete_experiment.assert_not_called()
+        emit_audit_event.assert_called_once_with(
+            "trash.cleanup",
+            "admin@example.com",
+            resource_type="trash",
+            detail={"deleted_runs_count": 1, "deleted_experiments_count": 0, "older_than": None},
+        )
 
-            def __add__(self, other):
-                return Page(list(self) + list(other), token=None)
+    async def test_list_deleted_runs_paged_search_runs(self, mocker, make_run, public_api_store):
 
         # two runs across pages
-        run1 = MagicMock()
-        run1.info.run_id = "r1"
-        run1.info.experiment_id = "exp-1"
-        run1.info.lifecycle_stage = "deleted"
-        run1.info.run_name = "n1"
-        run1.info.status = "FINISHED"
-        run1.info.start_time = 1
-        run1.info.end_time = 2
-
-        run2 = MagicMock()
-        run2.info.run_id = "r2"
-        run2.info.experiment_id = "exp-2"
-        run2.info.lifecycle_stage = "deleted"
-        run2.info.run_name = "n2"
-        run2.info.status = "FINISHED"
-        run2.info.start_time = 3
-        run2.info.end_time = 4
+        run1 = make_run(run_id="r1", experiment_id="exp-1", lifecycle_stage="deleted", run_name="n1", start_time=1, end_time=2)
+
+        run2 = make_run(run_id="r2", experiment_id="exp-2", lifecycle_stage="deleted", run_name="n2", start_time=3, end_time=4)
 
         def search_runs(experiment_ids, filter_string, run_view_type, page_token=None):
             if page_token is None:
@@ -669,130 +663,69 @@ class TestAdditionalTrashBehaviour:
             else:
                 return Page([run2], token=None)
 
-        backend_store.search_runs.side_effect = search_runs
-        # Ensure backend_store has no _get_deleted_runs attribute so fallback path is used
-        if hasattr(backend_store, "_get_deleted_runs"):
-            delattr(backend_store, "_get_deleted_runs")
+        # public_api_store has no _get_deleted_runs, so the search_runs fallback is used
+        public_api_store.search_runs.side_effect = search_runs
         # fetch_all_experiments used when experiment_ids not provided
-        with patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments") as mock_fetch_all_experiments:
-            exp = MagicMock()
-            exp.experiment_id = "exp-1"
-            mock_fetch_all_experiments.return_value = [exp]
-
-            backend_store.get_run.side_effect = [run1, run2]
-            mock_get_store.return_value = backend_store
+        mock_fetch_all_experiments = mocker.patch("mlflow_oidc_auth.routers.trash.fetch_all_experiments")
+        exp = SimpleNamespace(experiment_id="exp-1")
+        mock_fetch_all_experiments.return_value = [exp]
 
-            result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None)
-            assert result.status_code == 200
-            import json
+        public_api_store.get_run.side_effect = iter([run1, run2])
 
-            payload = json.loads(result.body)
-            assert len(payload["deleted_runs"]) == 2
+        result = await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=None, page_token=None)
+        assert result.status_code == 200
+        payload = _payload(result)
+        assert len(payload["deleted_runs"]) == 2
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_run_not_old_returns_failed_run(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_cleanup_run_not_old_returns_failed_run(self, make_run, backend_store):
         backend_store._hard_delete_run = MagicMock()
         # no deleted runs older than
         backend_store._get_deleted_runs.return_value = []
 
         # run exists and is deleted
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "invalid://"
-        run.info.experiment_id = "e1"
-        run.info.run_name = "r"
-        run.info.status = "FINISHED"
-        run.info.start_time = 1
-        run.info.end_time = 2
+        run = make_run(run_id="r1", lifecycle_stage="deleted", experiment_id="e1", run_name="r", start_time=1, end_time=2)
 
         backend_store.get_run.return_value = run
-        mock_get_store.return_value = backend_store
 
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             older_than="1d",
             run_ids="r1",
             experiment_ids=None,
+            stream=False,
         )
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert any(f["run_id"] == "r1" for f in payload.get("failed_runs", []))
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_experiment_age_check_non_old(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
+    async def test_cleanup_experiment_age_check_non_old(self, backend_store):
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock())
 
-        # experiment provided and last_update_time recent
-        active_exp = MagicMock()
-        active_exp.experiment_id = "eX"
-        active_exp.lifecycle_stage = "deleted"
-        # set last_update_time to current to be "non old"
-        from mlflow.utils.time import get_current_time_millis
-
-        active_exp.last_update_time = get_current_time_millis()
+        # experiment provided and last_update_time set to now, so it is "non old"
+        active_exp = SimpleNamespace(experiment_id="eX", lifecycle_stage="deleted", last_update_time=FROZEN_NOW_MILLIS)
 
         backend_store.get_experiment.return_value = active_exp
-        mock_get_store.return_value = backend_store
 
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             older_than="1d",
             run_ids=None,
             experiment_ids="eX",
+            stream=False,
         )
         assert result.status_code == 400
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert "not older than" in payload["error"]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_fetch_experiments_pages_and_runs(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
-
-        class Page(list):
-            def __init__(self, items, token=None):
-                super().__init__(items)
-                self.token = token
-
-            def __add__(self, other):
-                return Page(list(self) + list(other), token=None)
-
-        exp1 = MagicMock()
-        exp1.experiment_id = "e1"
-        exp2 = MagicMock()
-        exp2.experiment_id = "e2"
-
-        run1 = MagicMock()
-        run1.info.run_id = "r1"
-        run1.info.lifecycle_stage = "deleted"
-        run1.info.artifact_uri = "invalid://"
-        run1.info.experiment_id = "e1"
-        run1.info.run_name = "r"
-        run1.info.status = "FINISHED"
-        run1.info.start_time = 1
-        run1.info.end_time = 2
-        run2 = MagicMock()
-        run2.info.run_id = "r2"
-        run2.info.lifecycle_stage = "deleted"
-        run2.info.artifact_uri = "invalid://"
-        run2.info.experiment_id = "e2"
-        run2.info.run_name = "r"
-        run2.info.status = "FINISHED"
-        run2.info.start_time = 1
-        run2.info.end_time = 2
+    async def test_cleanup_fetch_experiments_pages_and_runs(self, mocker, make_run, backend_store):
+        mock_get_artifact_repo = mocker.patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock())
+
+        exp1 = SimpleNamespace(experiment_id="e1")
+        exp2 = SimpleNamespace(experiment_id="e2")
+
+        run1 = make_run(run_id="r1", lifecycle_stage="deleted", experiment_id="e1", run_name="r", start_time=1, end_time=2)
+        run2 = make_run(run_id="r2", lifecycle_stage="deleted", experiment_id="e2", run_name="r", start_time=1, end_time=2)
 
         # make search_experiments return two pages
         def search_experiments(view_type, filter_string, page_token=None):
@@ -811,112 +744,83 @@ class TestAdditionalTrashBehaviour:
         backend_store.search_experiments.side_effect = search_experiments
         backend_store.search_runs.side_effect = search_runs
         backend_store._get_deleted_runs.return_value = []
-        backend_store.get_run.side_effect = [run1, run2]
+        backend_store.get_run.side_effect = iter([run1, run2])
 
-        from mlflow.exceptions import InvalidUrlException
-
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.side_effect = InvalidUrlException("bad url")
+        mock_repo = MagicMock(**{"delete_artifacts.side_effect": InvalidUrlException("bad url")})
         mock_get_artifact_repo.return_value = mock_repo
 
-        mock_get_store.return_value = backend_store
-
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             older_than=None,
             run_ids=None,
             experiment_ids=None,
+            stream=False,
         )
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert set(payload["deleted_experiments"]) == {"e1", "e2"}
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_deleted_runs_fetch_failure_is_handled(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_deleted_runs_fetch_failure_is_handled(self, backend_store):
         backend_store._hard_delete_run = MagicMock()
         # _get_deleted_runs raises
         backend_store._get_deleted_runs.side_effect = Exception("boom-fetch")
-        mock_get_store.return_value = backend_store
 
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             older_than=None,
             run_ids=None,
             experiment_ids=None,
+            stream=False,
         )
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert payload["deleted_runs"] == []
         assert payload["deleted_experiments"] == []
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_older_than_invalid_returns_400(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_cleanup_older_than_invalid_returns_400(self, backend_store):
         backend_store._hard_delete_run = MagicMock()
-        mock_get_store.return_value = backend_store
 
         result = await permanently_delete_all_trashed_entities(
             admin_username="admin@example.com",
             older_than="bad",
             run_ids=None,
             experiment_ids=None,
+            stream=False,
         )
         assert result.status_code == 400
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_list_deleted_runs_json_serialization_error_raises_http_exception(self, mock_get_store):
-        backend_store = MagicMock()
+    async def test_list_deleted_runs_json_serialization_error_raises_http_exception(self, make_run, backend_store, all_experiments):
         backend_store._get_deleted_runs.return_value = ["r1"]
 
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.experiment_id = "exp-1"
-        run.info.lifecycle_stage = "deleted"
-        # Non-serializable field
-        run.info.run_name = MagicMock()
-        run.info.status = MagicMock()
-        run.info.start_time = MagicMock()
-        run.info.end_time = MagicMock()
-
-        backend_store.get_run.return_value = run
-        mock_get_store.return_value = backend_store
+        # Non-serializable fields
+        run = make_run(
+            run_id="r1",
+            experiment_id="exp-1",
+            lifecycle_stage="deleted",
+            run_name=MagicMock(),
+            status=MagicMock(),
+            start_time=MagicMock(),
+            end_time=MagicMock(),
+        )
 
-        from fastapi import HTTPException
+        backend_store.search_runs.return_value = [run]
 
         with pytest.raises(HTTPException) as excinfo:
-            await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None)
+            await list_deleted_runs(admin_username="admin@example.com", experiment_ids=None, older_than=None, max_results=None, page_token=None)
 
         assert excinfo.value.status_code == 500
         assert excinfo.value.detail == "Failed to retrieve deleted runs"
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_artifact_delete_exception_is_handled(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
+    async def test_cleanup_artifact_delete_exception_is_handled(self, mocker, make_run, backend_store):
+        mock_get_artifact_repo = mocker.patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
+        backend_store.configure_mock(_hard_delete_run=MagicMock(), _hard_delete_experiment=MagicMock())
         backend_store._get_deleted_runs.return_value = ["r1"]
 
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "some://"
-        run.info.experiment_id = "e1"
+        run = make_run(run_id="r1", lifecycle_stage="deleted", artifact_uri="some://", experiment_id="e1")
 
         backend_store.get_run.return_value = run
-        mock_get_store.return_value = backend_store
 
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.side_effect = Exception("boom-artifact")
+        mock_repo = MagicMock(**{"delete_artifacts.side_effect": Exception("boom-artifact")})
         mock_get_artifact_repo.return_value = mock_repo
 
         result = await permanently_delete_all_trashed_entities(
@@ -924,33 +828,23 @@ class TestAdditionalTrashBehaviour:
             run_ids="r1",
             experiment_ids=None,
             older_than=None,
+            stream=False,
         )
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert payload["deleted_runs"] == ["r1"]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_hard_delete_run_failure_records_failed_run(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
+    async def test_cleanup_hard_delete_run_failure_records_failed_run(self, mocker, make_run, backend_store):
+        mock_get_artifact_repo = mocker.patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
         # hard delete run will fail
         backend_store._hard_delete_run.side_effect = Exception("boom-delete")
         backend_store._get_deleted_runs.return_value = ["r1"]
 
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "some://"
-        run.info.experiment_id = "e1"
+        run = make_run(run_id="r1", lifecycle_stage="deleted", artifact_uri="some://", experiment_id="e1")
 
         backend_store.get_run.return_value = run
-        mock_get_store.return_value = backend_store
 
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.return_value = None
+        mock_repo = MagicMock(**{"delete_artifacts.return_value": None})
         mock_get_artifact_repo.return_value = mock_repo
 
         result = await permanently_delete_all_trashed_entities(
@@ -958,13 +852,36 @@ class TestAdditionalTrashBehaviour:
             run_ids="r1",
             experiment_ids=None,
             older_than=None,
+            stream=False,
         )
         assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
+        payload = _payload(result)
         assert any(f["run_id"] == "r1" and "boom-delete" in f["error"] for f in payload.get("failed_runs", []))
 
+    async def test_cleanup_parallel_run_deletes_report_per_run(self, mocker, make_run, backend_store):
+        mocker.patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
+        mocker.patch("mlflow_oidc_auth.routers.trash._CLEANUP_CONCURRENCY", 2)
+        backend_store._get_deleted_runs.return_value = []
+        backend_store.get_run.side_effect = lambda run_id: make_run(run_id=run_id)
+
+        def hard_delete_run(run_id):
+            if run_id == "r2":
+                raise Exception("locked")
+
+        backend_store._hard_delete_run.side_effect = hard_delete_run
+
+        result = await permanently_delete_all_trashed_entities(
+            admin_username="admin@example.com",
+            run_ids="r1,r2,r3,r4",
+            experiment_ids=None,
+            older_than=None,
+            stream=False,
+        )
+
+        payload = _payload(result)
+        assert sorted(payload["deleted_runs"]) == ["r1", "r3", "r4"]
+        assert payload["failed_runs"] == [{"run_id": "r2", "error": "locked"}]
+
     def test_parse_time_delta_more_cases(self):
         from mlflow.exceptions import MlflowException
 
@@ -973,17 +890,10 @@ class TestAdditionalTrashBehaviour:
         assert _parse_time_delta("1.5h") == int(1.5 * 3600 * 1000)
         assert _parse_time_delta("2d8h5m20s") == int((2 * 24 * 3600 + 8 * 3600 + 5 * 60 + 20) * 1000)
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_skips_experiments_when_not_supported(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        # remove _hard_delete_experiment if present
-        if hasattr(backend_store, "_hard_delete_experiment"):
-            delattr(backend_store, "_hard_delete_experiment")
-        # No runs or experiments to delete
-        backend_store._get_deleted_runs.return_value = []
-        mock_get_store.return_value = backend_store
+    async def test_cleanup_skips_experiments_when_not_supported(self, public_api_store):
+        # Run deletion is supported but _hard_delete_experiment is not; no runs or experiments to delete
+        public_api_store._hard_delete_run = MagicMock()
+        public_api_store._get_deleted_runs = MagicMock(return_value=[])
 
         import warnings
 
@@ -994,48 +904,35 @@ class TestAdditionalTrashBehaviour:
                 older_than=None,
                 run_ids=None,
                 experiment_ids=None,
+                stream=False,
             )
             assert result.status_code == 200
-            import json
-
-            payload = json.loads(result.body)
+            payload = _payload(result)
             assert payload["deleted_runs"] == []
             assert payload["deleted_experiments"] == []
             # Ensure we warned about experiments not supported
             assert any("does not allow hard-deleting experiments" in str(x.message) for x in w)
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_top_level_exception_raises_http_exception(self, mock_get_store):
+    async def test_cleanup_top_level_exception_raises_http_exception(self, mocker):
+        mock_get_store = mocker.patch("mlflow_oidc_auth.routers.trash._get_tracking_store")
         mock_get_store.side_effect = Exception("boom")
-        from fastapi import HTTPException
-
         with pytest.raises(HTTPException) as excinfo:
             await permanently_delete_all_trashed_entities(
                 admin_username="admin@example.com",
                 older_than=None,
                 run_ids=None,
                 experiment_ids=None,
+                stream=False,
             )
 
         assert excinfo.value.status_code == 500
         assert excinfo.value.detail == "Cleanup operation failed"
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_restore_experiment_fails_raises_500(self, mock_get_store):
-        backend_store = MagicMock()
-        deleted = MagicMock()
-        deleted.lifecycle_stage = "deleted"
-        deleted.experiment_id = "999"
-        deleted.name = "exp"
-        deleted.last_update_time = 1
+    async def test_restore_experiment_fails_raises_500(self, backend_store):
+        deleted = SimpleNamespace(lifecycle_stage="deleted", experiment_id="999", name="exp", last_update_time=1)
 
         backend_store.get_experiment.return_value = deleted
         backend_store.restore_experiment.side_effect = Exception("boom")
-        mock_get_store.return_value = backend_store
-
-        from fastapi import HTTPException
 
         with pytest.raises(HTTPException) as excinfo:
             await restore_experiment(experiment_id="999", admin_username="admin@example.com")
@@ -1043,22 +940,11 @@ class TestAdditionalTrashBehaviour:
         assert excinfo.value.status_code == 500
         assert excinfo.value.detail == "Failed to restore experiment"
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_restore_run_fails_raises_500(self, mock_get_store):
-        backend_store = MagicMock()
-        deleted = MagicMock()
-        deleted.info.lifecycle_stage = "deleted"
-        deleted.info.run_id = "run-9"
-        deleted.info.experiment_id = "exp-9"
-        deleted.info.run_name = "r"
-        deleted.info.status = "FINISHED"
+    async def test_restore_run_fails_raises_500(self, make_run, backend_store):
+        deleted = make_run(lifecycle_stage="deleted", run_id="run-9", experiment_id="exp-9", run_name="r")
 
         backend_store.get_run.return_value = deleted
         backend_store.restore_run.side_effect = Exception("boom")
-        mock_get_store.return_value = backend_store
-
-        from fastapi import HTTPException
 
         with pytest.raises(HTTPException) as excinfo:
             await restore_run(run_id="run-9", admin_username="admin@example.com")
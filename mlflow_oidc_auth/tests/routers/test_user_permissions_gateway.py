@@ -1,15 +1,16 @@
 """Tests for gateway CRUD endpoints in user_permissions router.
 
-This module tests all 30 gateway-related endpoints in the user_permissions router:
-- 5 for gateway endpoint permissions (list, create, get, update, delete)
-- 5 for gateway endpoint pattern permissions
-- 5 for gateway model definition permissions
-- 5 for gateway model definition pattern permissions
-- 5 for gateway secret permissions
-- 5 for gateway secret pattern permissions
+This module tests all 30 gateway-related endpoints in the user_permissions router.
+Endpoints, model definitions and secrets each expose the same routes, so the
+CRUD tests are parametrized over the three resource types:
+- 5 for gateway resource permissions (list, create, get, update, delete)
+- 5 for gateway resource pattern permissions
+- the role-filtered list of each resource type
 """
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import NamedTuple
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -19,410 +20,238 @@ from mlflow_oidc_auth.utils import get_is_admin, get_username
 USER_BASE = "/api/2.0/mlflow/permissions/users"
 _UP = "mlflow_oidc_auth.routers.user_permissions"
 
+# Every test in this module runs with an authenticated session.
+pytestmark = pytest.mark.usefixtures("authenticated_session")
 
-def _make_perm_result(permission_name: str, kind: str = "user") -> MagicMock:
-    """Create a mock PermissionResult for effective_gateway_*_permission."""
-    result = MagicMock()
-    result.permission.name = permission_name
-    result.permission.can_manage = permission_name == "MANAGE"
-    result.kind = kind
-    return result
 
-
-@pytest.fixture
-def override_admin(test_app):
-    """Override admin permission check to always pass."""
-
-    async def always_admin():
-        return "admin@example.com"
-
-    test_app.dependency_overrides[check_admin_permission] = always_admin
-    yield
-    test_app.dependency_overrides.pop(check_admin_permission, None)
-
-
-@pytest.fixture
-def override_user_non_admin(test_app):
-    """Override get_username and get_is_admin for non-admin user tests."""
-
-    async def _username():
-        return "test@example.com"
-
-    async def _is_admin():
-        return False
-
-    test_app.dependency_overrides[get_username] = _username
-    test_app.dependency_overrides[get_is_admin] = _is_admin
-    yield
-    test_app.dependency_overrides.pop(get_username, None)
-    test_app.dependency_overrides.pop(get_is_admin, None)
+def _make_perm_result(permission_name: str, kind: str = "user") -> SimpleNamespace:
+    """Create a stand-in PermissionResult for effective_gateway_*_permission."""
+    return SimpleNamespace(permission=SimpleNamespace(name=permission_name, can_manage=permission_name == "MANAGE"), kind=kind)
 
 
-def _make_direct_perm(attr_name: str, value: str, permission: str = "READ") -> MagicMock:
-    """Create a mock direct permission entity."""
-    perm = MagicMock()
-    setattr(perm, attr_name, value)
-    perm.permission = permission
-    return perm
+# The list handlers only read these results, so the tests share one instance of each.
+PERM_MANAGE_USER = _make_perm_result("MANAGE", "user")
+PERM_READ_USER = _make_perm_result("READ", "user")
+PERM_READ_REGEX = _make_perm_result("READ", "regex")
+PERM_NO_PERMISSIONS_DEFAULT = _make_perm_result("NO_PERMISSIONS", "default")
 
 
-def _make_regex_perm(
-    perm_id: int = 1,
-    regex: str = ".*",
-    priority: int = 1,
-    user_id: int = 5,
-    permission: str = "READ",
-) -> MagicMock:
-    """Create a mock regex permission entity."""
-    perm = MagicMock()
-    perm.id = perm_id
-    perm.regex = regex
-    perm.priority = priority
-    perm.user_id = user_id
-    perm.permission = permission
-    return perm
+def _in_order(*results):
+    """Stand-in that returns ``results`` one per call, like a ``side_effect`` list."""
+    remaining = iter(results)
+    return lambda *args, **kwargs: next(remaining)
 
 
-# ========================================================================================
-# GATEWAY ENDPOINT PERMISSIONS
-# ========================================================================================
+def _raises(exc: Exception):
+    """Stand-in that raises ``exc`` whenever it is called."""
 
+    def _raise(*args, **kwargs):
+        raise exc
 
-@pytest.mark.usefixtures("authenticated_session", "override_admin")
-class TestUserGatewayEndpointPermissions:
-    """Tests for user gateway endpoint CRUD endpoints (create/get/update/delete)."""
+    return _raise
 
-    def test_create(self, authenticated_client, mock_store):
-        """Test creating a user gateway endpoint permission."""
-        mock_store.create_gateway_endpoint_permission.return_value = _make_direct_perm("endpoint_id", "ep-1", "MANAGE")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.post(
-                f"{USER_BASE}/user@example.com/gateways/endpoints/ep-1",
-                json={"permission": "MANAGE"},
-            )
-        assert resp.status_code == 201
-        assert resp.json()["name"] == "ep-1"
-        assert resp.json()["kind"] == "user"
 
-    def test_get(self, authenticated_client, mock_store):
-        """Test getting a specific user gateway endpoint permission."""
-        mock_store.get_gateway_endpoint_permission.return_value = _make_direct_perm("endpoint_id", "ep-1", "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/endpoints/ep-1")
-        assert resp.status_code == 200
-        assert resp.json()["name"] == "ep-1"
-
-    def test_update(self, authenticated_client, mock_store):
-        """Test updating a user gateway endpoint permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.patch(
-                f"{USER_BASE}/user@example.com/gateways/endpoints/ep-1",
-                json={"permission": "EDIT"},
-            )
-        assert resp.status_code == 200
-        assert "updated" in resp.json()["message"].lower()
-        mock_store.update_gateway_endpoint_permission.assert_called_once()
+# Dependency overrides are plain module-level coroutines; test_app clears
+# dependency_overrides on teardown, so the fixtures below only install them.
 
-    def test_delete(self, authenticated_client, mock_store):
-        """Test deleting a user gateway endpoint permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/gateways/endpoints/ep-1")
-        assert resp.status_code == 200
-        assert "deleted" in resp.json()["message"].lower()
-        mock_store.delete_gateway_endpoint_permission.assert_called_once()
 
-    def test_get_not_found(self, authenticated_client, mock_store):
-        """Test 404 for missing permission."""
-        mock_store.get_gateway_endpoint_permission.side_effect = Exception("Not found")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/endpoints/missing")
-        assert resp.status_code == 404
+async def _always_admin():
+    return "admin@example.com"
 
 
-# ========================================================================================
-# GATEWAY ENDPOINT PATTERN PERMISSIONS
-# ========================================================================================
+async def _non_admin_username():
+    return "test@example.com"
 
 
-@pytest.mark.usefixtures("authenticated_session", "override_admin")
-class TestUserGatewayEndpointPatternPermissions:
-    """Tests for user gateway endpoint pattern CRUD endpoints."""
+async def _never_admin():
+    return False
 
-    def test_list(self, authenticated_client, mock_store):
-        """Test listing user gateway endpoint regex permissions."""
-        mock_store.list_gateway_endpoint_regex_permissions.return_value = [
-            _make_regex_perm(1, "ep-.*", 1, 5, "READ"),
-        ]
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/endpoints-patterns")
-        assert resp.status_code == 200
-        assert resp.json()[0]["regex"] == "ep-.*"
-
-    def test_create(self, authenticated_client, mock_store):
-        """Test creating a user gateway endpoint regex permission."""
-        mock_store.create_gateway_endpoint_regex_permission.return_value = _make_regex_perm(1, "ep-.*", 1, 5, "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.post(
-                f"{USER_BASE}/user@example.com/gateways/endpoints-patterns",
-                json={"regex": "ep-.*", "priority": 1, "permission": "READ"},
-            )
-        assert resp.status_code == 201
 
-    def test_get(self, authenticated_client, mock_store):
-        """Test getting a specific user gateway endpoint regex permission."""
-        mock_store.get_gateway_endpoint_regex_permission.return_value = _make_regex_perm(1, "ep-.*", 1, 5, "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/endpoints-patterns/1")
-        assert resp.status_code == 200
+@pytest.fixture
+def override_admin(test_app):
+    """Override admin permission check to always pass."""
+    test_app.dependency_overrides[check_admin_permission] = _always_admin
 
-    def test_update(self, authenticated_client, mock_store):
-        """Test updating a user gateway endpoint regex permission."""
-        mock_store.update_gateway_endpoint_regex_permission.return_value = _make_regex_perm(1, "new-.*", 2, 5, "MANAGE")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.patch(
-                f"{USER_BASE}/user@example.com/gateways/endpoints-patterns/1",
-                json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-            )
-        assert resp.status_code == 200
 
-    def test_delete(self, authenticated_client, mock_store):
-        """Test deleting a user gateway endpoint regex permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/gateways/endpoints-patterns/1")
-        assert resp.status_code == 200
-        mock_store.delete_gateway_endpoint_regex_permission.assert_called_once()
+@pytest.fixture
+def override_user_non_admin(test_app):
+    """Override get_username and get_is_admin for non-admin user tests."""
+    test_app.dependency_overrides[get_username] = _non_admin_username
+    test_app.dependency_overrides[get_is_admin] = _never_admin
 
-    def test_get_not_found(self, authenticated_client, mock_store):
-        """Test 404 for missing regex permission."""
-        mock_store.get_gateway_endpoint_regex_permission.side_effect = Exception("Not found")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/endpoints-patterns/999")
-        assert resp.status_code == 404
 
+def _make_direct_perm(attr_name: str, value: str, permission: str = "READ") -> SimpleNamespace:
+    """Create a stand-in direct permission entity."""
+    return SimpleNamespace(**{attr_name: value, "permission": permission})
 
-# ========================================================================================
-# GATEWAY MODEL DEFINITION PERMISSIONS
-# ========================================================================================
 
+def _make_regex_perm(
+    perm_id: int = 1,
+    regex: str = ".*",
+    priority: int = 1,
+    user_id: int = 5,
+    permission: str = "READ",
+) -> SimpleNamespace:
+    """Create a stand-in regex permission entity."""
+    return SimpleNamespace(id=perm_id, regex=regex, priority=priority, user_id=user_id, permission=permission)
 
-@pytest.mark.usefixtures("authenticated_session", "override_admin")
-class TestUserGatewayModelDefinitionPermissions:
-    """Tests for user gateway model definition CRUD endpoints (create/get/update/delete)."""
 
-    def test_create(self, authenticated_client, mock_store):
-        """Test creating a user gateway model definition permission."""
-        mock_store.create_gateway_model_definition_permission.return_value = _make_direct_perm("model_definition_id", "gpt-4", "MANAGE")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.post(
-                f"{USER_BASE}/user@example.com/gateways/model-definitions/gpt-4",
-                json={"permission": "MANAGE"},
-            )
-        assert resp.status_code == 201
-        assert resp.json()["name"] == "gpt-4"
+class GatewayResource(NamedTuple):
+    """A gateway resource type whose user permission CRUD routes share one shape."""
 
-    def test_get(self, authenticated_client, mock_store):
-        """Test getting a specific user gateway model definition permission."""
-        mock_store.get_gateway_model_definition_permission.return_value = _make_direct_perm("model_definition_id", "gpt-4", "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/model-definitions/gpt-4")
-        assert resp.status_code == 200
+    path: str  # URL segment under /gateways
+    store_name: str  # infix of the store methods, e.g. create_gateway_<store_name>_permission
+    id_attr: str  # attribute holding the resource name on a direct permission
+    name: str
+    regex: str
+    item_key: str  # key holding the resource name in fetch_all_gateway_* rows
 
-    def test_update(self, authenticated_client, mock_store):
-        """Test updating a user gateway model definition permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.patch(
-                f"{USER_BASE}/user@example.com/gateways/model-definitions/gpt-4",
-                json={"permission": "EDIT"},
-            )
-        assert resp.status_code == 200
-        mock_store.update_gateway_model_definition_permission.assert_called_once()
+    @property
+    def url(self) -> str:
+        """Permission routes for this resource type on user@example.com."""
+        return f"{USER_BASE}/user@example.com/gateways/{self.path}"
 
-    def test_delete(self, authenticated_client, mock_store):
-        """Test deleting a user gateway model definition permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/gateways/model-definitions/gpt-4")
-        assert resp.status_code == 200
-        mock_store.delete_gateway_model_definition_permission.assert_called_once()
+    @property
+    def pattern_url(self) -> str:
+        """Pattern permission routes for this resource type on user@example.com."""
+        return f"{self.url}-patterns"
 
-    def test_get_not_found(self, authenticated_client, mock_store):
-        """Test 404 for missing permission."""
-        mock_store.get_gateway_model_definition_permission.side_effect = Exception("Not found")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/model-definitions/missing")
-        assert resp.status_code == 404
+    @property
+    def fetch_all(self) -> str:
+        """Name of the user_permissions helper that lists every resource of this type."""
+        return f"fetch_all_gateway_{self.path.replace('-', '_')}"
 
+    @property
+    def effective(self) -> str:
+        """Name of the user_permissions helper that resolves a user's permission."""
+        return f"effective_gateway_{self.store_name}_permission"
 
-# ========================================================================================
-# GATEWAY MODEL DEFINITION PATTERN PERMISSIONS
-# ========================================================================================
 
+GATEWAY_RESOURCES = [
+    GatewayResource("endpoints", "endpoint", "endpoint_id", "ep-1", "ep-.*", "name"),
+    GatewayResource("model-definitions", "model_definition", "model_definition_id", "gpt-4", "gpt-.*", "name"),
+    GatewayResource("secrets", "secret", "secret_id", "api-key", "api-.*", "secret_name"),
+]
 
-@pytest.mark.usefixtures("authenticated_session", "override_admin")
-class TestUserGatewayModelDefinitionPatternPermissions:
-    """Tests for user gateway model definition pattern CRUD endpoints."""
 
-    def test_list(self, authenticated_client, mock_store):
-        """Test listing user gateway model definition regex permissions."""
-        mock_store.list_gateway_model_definition_regex_permissions.return_value = [
-            _make_regex_perm(1, "gpt-.*", 1, 5, "READ"),
-        ]
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/model-definitions-patterns")
-        assert resp.status_code == 200
-        assert resp.json()[0]["regex"] == "gpt-.*"
-
-    def test_create(self, authenticated_client, mock_store):
-        """Test creating a user gateway model definition regex permission."""
-        mock_store.create_gateway_model_definition_regex_permission.return_value = _make_regex_perm(2, "gpt-.*", 1, 5, "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.post(
-                f"{USER_BASE}/user@example.com/gateways/model-definitions-patterns",
-                json={"regex": "gpt-.*", "priority": 1, "permission": "READ"},
-            )
-        assert resp.status_code == 201
+@pytest.fixture(params=GATEWAY_RESOURCES, ids=lambda resource: resource.path)
+def resource(request):
+    """Each gateway resource type in turn."""
+    return request.param
 
-    def test_get(self, authenticated_client, mock_store):
-        """Test getting a specific user gateway model definition regex permission."""
-        mock_store.get_gateway_model_definition_regex_permission.return_value = _make_regex_perm(1, "gpt-.*", 1, 5, "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/model-definitions-patterns/1")
-        assert resp.status_code == 200
 
-    def test_update(self, authenticated_client, mock_store):
-        """Test updating a user gateway model definition regex permission."""
-        mock_store.update_gateway_model_definition_regex_permission.return_value = _make_regex_perm(1, "claude-.*", 2, 5, "MANAGE")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.patch(
-                f"{USER_BASE}/user@example.com/gateways/model-definitions-patterns/1",
-                json={"regex": "claude-.*", "priority": 2, "permission": "MANAGE"},
-            )
-        assert resp.status_code == 200
+def _store_method_name(action: str, resource: GatewayResource, pattern: bool = False) -> str:
+    """Return the store method name for an action, e.g. create_gateway_endpoint_regex_permission."""
+    suffix = "regex_permission" if pattern else "permission"
+    return f"{action}_gateway_{resource.store_name}_{suffix}"
 
-    def test_delete(self, authenticated_client, mock_store):
-        """Test deleting a user gateway model definition regex permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/gateways/model-definitions-patterns/1")
-        assert resp.status_code == 200
-        mock_store.delete_gateway_model_definition_regex_permission.assert_called_once()
 
-    def test_get_not_found(self, authenticated_client, mock_store):
-        """Test 404 for missing regex permission."""
-        mock_store.get_gateway_model_definition_regex_permission.side_effect = Exception("Not found")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/model-definitions-patterns/999")
-        assert resp.status_code == 404
+def _store_method(mock_store, action: str, resource: GatewayResource, pattern: bool = False) -> MagicMock:
+    """Return the mock_store method for an action."""
+    return getattr(mock_store, _store_method_name(action, resource, pattern))
 
 
 # ========================================================================================
-# GATEWAY SECRET PERMISSIONS
+# GATEWAY RESOURCE PERMISSIONS
 # ========================================================================================
 
 
-@pytest.mark.usefixtures("authenticated_session", "override_admin")
-class TestUserGatewaySecretPermissions:
-    """Tests for user gateway secret CRUD endpoints (create/get/update/delete)."""
+@pytest.mark.usefixtures("override_admin")
+class TestUserGatewayResourcePermissions:
+    """Tests for user gateway endpoint, model definition and secret CRUD endpoints (create/get/update/delete)."""
 
-    def test_create(self, authenticated_client, mock_store):
-        """Test creating a user gateway secret permission."""
-        mock_store.create_gateway_secret_permission.return_value = _make_direct_perm("secret_id", "api-key", "MANAGE")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.post(
-                f"{USER_BASE}/user@example.com/gateways/secrets/api-key",
-                json={"permission": "MANAGE"},
-            )
+    def test_create(self, authenticated_client, mock_store, resource):
+        """Test creating a user gateway resource permission."""
+        _store_method(mock_store, "create", resource).return_value = _make_direct_perm(resource.id_attr, resource.name, "MANAGE")
+        resp = authenticated_client.post(
+            f"{resource.url}/{resource.name}",
+            json={"permission": "MANAGE"},
+        )
         assert resp.status_code == 201
-        assert resp.json()["name"] == "api-key"
+        assert resp.json()["name"] == resource.name
+        assert resp.json()["kind"] == "user"
 
-    def test_get(self, authenticated_client, mock_store):
-        """Test getting a specific user gateway secret permission."""
-        mock_store.get_gateway_secret_permission.return_value = _make_direct_perm("secret_id", "api-key", "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/secrets/api-key")
+    def test_get(self, authenticated_client, mock_store, resource):
+        """Test getting a specific user gateway resource permission."""
+        _store_method(mock_store, "get", resource).return_value = _make_direct_perm(resource.id_attr, resource.name, "READ")
+        resp = authenticated_client.get(f"{resource.url}/{resource.name}")
         assert resp.status_code == 200
-
-    def test_update(self, authenticated_client, mock_store):
-        """Test updating a user gateway secret permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.patch(
-                f"{USER_BASE}/user@example.com/gateways/secrets/api-key",
-                json={"permission": "EDIT"},
-            )
+        assert resp.json()["name"] == resource.name
+
+    def test_update(self, authenticated_client, mock_store, resource):
+        """Test updating a user gateway resource permission."""
+        resp = authenticated_client.patch(
+            f"{resource.url}/{resource.name}",
+            json={"permission": "EDIT"},
+        )
         assert resp.status_code == 200
-        mock_store.update_gateway_secret_permission.assert_called_once()
+        assert "updated" in resp.json()["message"].lower()
+        _store_method(mock_store, "update", resource).assert_called_once()
 
-    def test_delete(self, authenticated_client, mock_store):
-        """Test deleting a user gateway secret permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/gateways/secrets/api-key")
+    def test_delete(self, authenticated_client, mock_store, resource):
+        """Test deleting a user gateway resource permission."""
+        resp = authenticated_client.delete(f"{resource.url}/{resource.name}")
         assert resp.status_code == 200
-        mock_store.delete_gateway_secret_permission.assert_called_once()
+        assert "deleted" in resp.json()["message"].lower()
+        _store_method(mock_store, "delete", resource).assert_called_once()
 
-    def test_get_not_found(self, authenticated_client, mock_store):
+    def test_get_not_found(self, authenticated_client, mock_store, monkeypatch, resource):
         """Test 404 for missing permission."""
-        mock_store.get_gateway_secret_permission.side_effect = Exception("Not found")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/secrets/missing")
+        monkeypatch.setattr(mock_store, _store_method_name("get", resource), _raises(Exception("Not found")))
+        resp = authenticated_client.get(f"{resource.url}/missing")
         assert resp.status_code == 404
 
 
 # ========================================================================================
-# GATEWAY SECRET PATTERN PERMISSIONS
+# GATEWAY RESOURCE PATTERN PERMISSIONS
 # ========================================================================================
 
 
-@pytest.mark.usefixtures("authenticated_session", "override_admin")
-class TestUserGatewaySecretPatternPermissions:
-    """Tests for user gateway secret pattern CRUD endpoints."""
+@pytest.mark.usefixtures("override_admin")
+class TestUserGatewayResourcePatternPermissions:
+    """Tests for user gateway endpoint, model definition and secret pattern CRUD endpoints."""
 
-    def test_list(self, authenticated_client, mock_store):
-        """Test listing user gateway secret regex permissions."""
-        mock_store.list_gateway_secret_regex_permissions.return_value = [
-            _make_regex_perm(1, "api-.*", 1, 5, "READ"),
-        ]
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/secrets-patterns")
+    def test_list(self, authenticated_client, mock_store, resource):
+        """Test listing user gateway resource regex permissions."""
+        mock_store.configure_mock(**{f"list_gateway_{resource.store_name}_regex_permissions.return_value": [_make_regex_perm(1, resource.regex, 1, 5, "READ")]})
+        resp = authenticated_client.get(resource.pattern_url)
         assert resp.status_code == 200
-        assert resp.json()[0]["regex"] == "api-.*"
-
-    def test_create(self, authenticated_client, mock_store):
-        """Test creating a user gateway secret regex permission."""
-        mock_store.create_gateway_secret_regex_permission.return_value = _make_regex_perm(2, "api-.*", 1, 5, "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.post(
-                f"{USER_BASE}/user@example.com/gateways/secrets-patterns",
-                json={"regex": "api-.*", "priority": 1, "permission": "READ"},
-            )
+        assert resp.json()[0]["regex"] == resource.regex
+
+    def test_create(self, authenticated_client, mock_store, resource):
+        """Test creating a user gateway resource regex permission."""
+        _store_method(mock_store, "create", resource, pattern=True).return_value = _make_regex_perm(1, resource.regex, 1, 5, "READ")
+        resp = authenticated_client.post(
+            resource.pattern_url,
+            json={"regex": resource.regex, "priority": 1, "permission": "READ"},
+        )
         assert resp.status_code == 201
 
-    def test_get(self, authenticated_client, mock_store):
-        """Test getting a specific user gateway secret regex permission."""
-        mock_store.get_gateway_secret_regex_permission.return_value = _make_regex_perm(1, "api-.*", 1, 5, "READ")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/secrets-patterns/1")
+    def test_get(self, authenticated_client, mock_store, resource):
+        """Test getting a specific user gateway resource regex permission."""
+        _store_method(mock_store, "get", resource, pattern=True).return_value = _make_regex_perm(1, resource.regex, 1, 5, "READ")
+        resp = authenticated_client.get(f"{resource.pattern_url}/1")
         assert resp.status_code == 200
 
-    def test_update(self, authenticated_client, mock_store):
-        """Test updating a user gateway secret regex permission."""
-        mock_store.update_gateway_secret_regex_permission.return_value = _make_regex_perm(1, "key-.*", 2, 5, "MANAGE")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.patch(
-                f"{USER_BASE}/user@example.com/gateways/secrets-patterns/1",
-                json={"regex": "key-.*", "priority": 2, "permission": "MANAGE"},
-            )
+    def test_update(self, authenticated_client, mock_store, resource):
+        """Test updating a user gateway resource regex permission."""
+        _store_method(mock_store, "update", resource, pattern=True).return_value = _make_regex_perm(1, "new-.*", 2, 5, "MANAGE")
+        resp = authenticated_client.patch(
+            f"{resource.pattern_url}/1",
+            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
+        )
         assert resp.status_code == 200
 
-    def test_delete(self, authenticated_client, mock_store):
-        """Test deleting a user gateway secret regex permission."""
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/gateways/secrets-patterns/1")
+    def test_delete(self, authenticated_client, mock_store, resource):
+        """Test deleting a user gateway resource regex permission."""
+        resp = authenticated_client.delete(f"{resource.pattern_url}/1")
         assert resp.status_code == 200
-        mock_store.delete_gateway_secret_regex_permission.assert_called_once()
+        _store_method(mock_store, "delete", resource, pattern=True).assert_called_once()
 
-    def test_get_not_found(self, authenticated_client, mock_store):
+    def test_get_not_found(self, authenticated_client, mock_store, monkeypatch, resource):
         """Test 404 for missing regex permission."""
-        mock_store.get_gateway_secret_regex_permission.side_effect = Exception("Not found")
-        with patch("mlflow_oidc_auth.routers.user_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/gateways/secrets-patterns/999")
+        monkeypatch.setattr(mock_store, _store_method_name("get", resource, pattern=True), _raises(Exception("Not found")))
+        resp = authenticated_client.get(f"{resource.pattern_url}/999")
         assert resp.status_code == 404
 
 
@@ -431,223 +260,76 @@ class TestUserGatewaySecretPatternPermissions:
 # ========================================================================================
 
 
-@pytest.mark.usefixtures("authenticated_session")
-class TestUserGatewayEndpointPermissionsList:
-    """Tests for listing gateway endpoint permissions with role-based filtering."""
-
-    def test_list_as_admin(self, admin_client):
-        """Admin sees all gateway endpoints with target user's effective permissions."""
-        endpoints = [{"name": "ep-1"}, {"name": "ep-2"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_endpoints", return_value=endpoints),
-            patch(
-                f"{_UP}.effective_gateway_endpoint_permission",
-                side_effect=[
-                    _make_perm_result("MANAGE", "user"),
-                    _make_perm_result("READ", "regex"),
-                ],
-            ),
-        ):
-            resp = admin_client.get(f"{USER_BASE}/user@example.com/gateways/endpoints")
-        assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 2
-        assert {"name": "ep-1", "permission": "MANAGE", "kind": "user"} in body
-        assert {"name": "ep-2", "permission": "READ", "kind": "regex"} in body
-
-    @pytest.mark.usefixtures("override_user_non_admin")
-    def test_list_same_user_filters_no_permissions(self, authenticated_client):
-        """Same user sees endpoints where permission != NO_PERMISSIONS."""
-        endpoints = [{"name": "ep-visible"}, {"name": "ep-hidden"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_endpoints", return_value=endpoints),
-            patch(
-                f"{_UP}.effective_gateway_endpoint_permission",
-                side_effect=[
-                    _make_perm_result("READ", "user"),
-                    _make_perm_result("NO_PERMISSIONS", "default"),
-                ],
-            ),
-        ):
-            resp = authenticated_client.get(f"{USER_BASE}/test@example.com/gateways/endpoints")
-        assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 1
-        assert body[0]["name"] == "ep-visible"
-
-    @pytest.mark.usefixtures("override_user_non_admin")
-    def test_list_other_user_shows_only_manageable(self, authenticated_client):
-        """Non-admin querying another user sees only endpoints they can manage."""
-        endpoints = [{"name": "ep-manage"}, {"name": "ep-readonly"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_endpoints", return_value=endpoints),
-            patch(
-                f"{_UP}.effective_gateway_endpoint_permission",
-                side_effect=[
-                    # target user's permission for ep-manage
-                    _make_perm_result("READ", "user"),
-                    # caller's permission for ep-manage (can_manage=True)
-                    _make_perm_result("MANAGE", "user"),
-                    # target user's permission for ep-readonly
-                    _make_perm_result("READ", "user"),
-                    # caller's permission for ep-readonly (can_manage=False)
-                    _make_perm_result("READ", "regex"),
-                ],
-            ),
-        ):
-            resp = authenticated_client.get(f"{USER_BASE}/other@example.com/gateways/endpoints")
-        assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 1
-        assert body[0]["name"] == "ep-manage"
-
-    def test_list_error(self, admin_client):
-        """Test error handling for list endpoint."""
-        with patch(f"{_UP}.fetch_all_gateway_endpoints", side_effect=Exception("DB error")):
-            resp = admin_client.get(f"{USER_BASE}/user@example.com/gateways/endpoints")
-        assert resp.status_code == 500
-
-
-@pytest.mark.usefixtures("authenticated_session")
-class TestUserGatewayModelDefinitionPermissionsList:
-    """Tests for listing gateway model definition permissions with role-based filtering."""
-
-    def test_list_as_admin(self, admin_client):
-        """Admin sees all gateway model definitions with target user's effective permissions."""
-        models = [{"name": "gpt-4"}, {"name": "claude-3"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_model_definitions", return_value=models),
-            patch(
-                f"{_UP}.effective_gateway_model_definition_permission",
-                side_effect=[
-                    _make_perm_result("MANAGE", "user"),
-                    _make_perm_result("READ", "regex"),
-                ],
-            ),
-        ):
-            resp = admin_client.get(f"{USER_BASE}/user@example.com/gateways/model-definitions")
-        assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 2
-        assert {"name": "gpt-4", "permission": "MANAGE", "kind": "user"} in body
-
-    @pytest.mark.usefixtures("override_user_non_admin")
-    def test_list_same_user_filters_no_permissions(self, authenticated_client):
-        """Same user sees model definitions where permission != NO_PERMISSIONS."""
-        models = [{"name": "gpt-4"}, {"name": "hidden-model"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_model_definitions", return_value=models),
-            patch(
-                f"{_UP}.effective_gateway_model_definition_permission",
-                side_effect=[
-                    _make_perm_result("READ", "user"),
-                    _make_perm_result("NO_PERMISSIONS", "default"),
-                ],
-            ),
-        ):
-            resp = authenticated_client.get(f"{USER_BASE}/test@example.com/gateways/model-definitions")
-        assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 1
-        assert body[0]["name"] == "gpt-4"
-
-    @pytest.mark.usefixtures("override_user_non_admin")
-    def test_list_other_user_shows_only_manageable(self, authenticated_client):
-        """Non-admin querying another user sees only model definitions they can manage."""
-        models = [{"name": "gpt-4"}, {"name": "claude-3"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_model_definitions", return_value=models),
-            patch(
-                f"{_UP}.effective_gateway_model_definition_permission",
-                side_effect=[
-                    _make_perm_result("READ", "user"),
-                    _make_perm_result("MANAGE", "user"),
-                    _make_perm_result("READ", "user"),
-                    _make_perm_result("READ", "regex"),
-                ],
-            ),
-        ):
-            resp = authenticated_client.get(f"{USER_BASE}/other@example.com/gateways/model-definitions")
-        assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 1
-        assert body[0]["name"] == "gpt-4"
+def _list_items(resource: GatewayResource, *names: str) -> list:
+    """Build the rows fetch_all_gateway_* returns for ``names``."""
+    return [{resource.item_key: name} for name in names]
 
-    def test_list_error(self, admin_client):
-        """Test error handling for list endpoint."""
-        with patch(f"{_UP}.fetch_all_gateway_model_definitions", side_effect=Exception("DB error")):
-            resp = admin_client.get(f"{USER_BASE}/user@example.com/gateways/model-definitions")
-        assert resp.status_code == 500
 
+class TestUserGatewayResourcePermissionsList:
+    """Tests for listing gateway resource permissions with role-based filtering."""
 
-@pytest.mark.usefixtures("authenticated_session")
-class TestUserGatewaySecretPermissionsList:
-    """Tests for listing gateway secret permissions with role-based filtering."""
-
-    def test_list_as_admin(self, admin_client):
-        """Admin sees all gateway secrets with target user's effective permissions."""
-        secrets = [{"secret_name": "api-key"}, {"secret_name": "db-pass"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_secrets", return_value=secrets),
-            patch(
-                f"{_UP}.effective_gateway_secret_permission",
-                side_effect=[
-                    _make_perm_result("MANAGE", "user"),
-                    _make_perm_result("READ", "regex"),
-                ],
+    def test_list_as_admin(self, admin_client, monkeypatch, resource):
+        """Admin sees all gateway resources with target user's effective permissions."""
+        items = _list_items(resource, "first", "second")
+        monkeypatch.setattr(f"{_UP}.{resource.fetch_all}", lambda *args, **kwargs: items)
+        monkeypatch.setattr(
+            f"{_UP}.{resource.effective}",
+            _in_order(
+                PERM_MANAGE_USER,
+                PERM_READ_REGEX,
             ),
-        ):
-            resp = admin_client.get(f"{USER_BASE}/user@example.com/gateways/secrets")
+        )
+        resp = admin_client.get(resource.url)
         assert resp.status_code == 200
         body = resp.json()
         assert len(body) == 2
-        assert {"name": "api-key", "permission": "MANAGE", "kind": "user"} in body
-        assert {"name": "db-pass", "permission": "READ", "kind": "regex"} in body
+        assert {"name": "first", "permission": "MANAGE", "kind": "user"} in body
+        assert {"name": "second", "permission": "READ", "kind": "regex"} in body
 
     @pytest.mark.usefixtures("override_user_non_admin")
-    def test_list_same_user_filters_no_permissions(self, authenticated_client):
-        """Same user sees secrets where permission != NO_PERMISSIONS."""
-        secrets = [{"secret_name": "visible-key"}, {"secret_name": "hidden-key"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_secrets", return_value=secrets),
-            patch(
-                f"{_UP}.effective_gateway_secret_permission",
-                side_effect=[
-                    _make_perm_result("READ", "user"),
-                    _make_perm_result("NO_PERMISSIONS", "default"),
-                ],
+    def test_list_same_user_filters_no_permissions(self, authenticated_client, monkeypatch, resource):
+        """Same user sees resources where permission != NO_PERMISSIONS."""
+        items = _list_items(resource, "visible", "hidden")
+        monkeypatch.setattr(f"{_UP}.{resource.fetch_all}", lambda *args, **kwargs: items)
+        monkeypatch.setattr(
+            f"{_UP}.{resource.effective}",
+            _in_order(
+                PERM_READ_USER,
+                PERM_NO_PERMISSIONS_DEFAULT,
             ),
-        ):
-            resp = authenticated_client.get(f"{USER_BASE}/test@example.com/gateways/secrets")
+        )
+        resp = authenticated_client.get(f"{USER_BASE}/test@example.com/gateways/{resource.path}")
         assert resp.status_code == 200
         body = resp.json()
         assert len(body) == 1
-        assert body[0]["name"] == "visible-key"
+        assert body[0]["name"] == "visible"
 
     @pytest.mark.usefixtures("override_user_non_admin")
-    def test_list_other_user_shows_only_manageable(self, authenticated_client):
-        """Non-admin querying another user sees only secrets they can manage."""
-        secrets = [{"secret_name": "manageable"}, {"secret_name": "readonly"}]
-        with (
-            patch(f"{_UP}.fetch_all_gateway_secrets", return_value=secrets),
-            patch(
-                f"{_UP}.effective_gateway_secret_permission",
-                side_effect=[
-                    _make_perm_result("READ", "user"),
-                    _make_perm_result("MANAGE", "user"),
-                    _make_perm_result("READ", "user"),
-                    _make_perm_result("READ", "regex"),
-                ],
+    def test_list_other_user_shows_only_manageable(self, authenticated_client, monkeypatch, resource):
+        """Non-admin querying another user sees only resources they can manage."""
+        items = _list_items(resource, "manageable", "readonly")
+        monkeypatch.setattr(f"{_UP}.{resource.fetch_all}", lambda *args, **kwargs: items)
+        monkeypatch.setattr(
+            f"{_UP}.{resource.effective}",
+            _in_order(
+                # target user's permission for "manageable"
+                PERM_READ_USER,
+                # caller's permission for "manageable" (can_manage=True)
+                PERM_MANAGE_USER,
+                # target user's permission for "readonly"
+                PERM_READ_USER,
+                # caller's permission for "readonly" (can_manage=False)
+                PERM_READ_REGEX,
             ),
-        ):
-            resp = authenticated_client.get(f"{USER_BASE}/other@example.com/gateways/secrets")
+        )
+        resp = authenticated_client.get(f"{USER_BASE}/other@example.com/gateways/{resource.path}")
         assert resp.status_code == 200
         body = resp.json()
         assert len(body) == 1
         assert body[0]["name"] == "manageable"
 
-    def test_list_error(self, admin_client):
+    def test_list_error(self, admin_client, monkeypatch, resource):
         """Test error handling for list endpoint."""
-        with patch(f"{_UP}.fetch_all_gateway_secrets", side_effect=Exception("DB error")):
-            resp = admin_client.get(f"{USER_BASE}/user@example.com/gateways/secrets")
+        monkeypatch.setattr(f"{_UP}.{resource.fetch_all}", _raises(Exception("DB error")))
+        resp = admin_client.get(resource.url)
         assert resp.status_code == 500
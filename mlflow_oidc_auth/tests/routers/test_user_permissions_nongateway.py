@@ -4,7 +4,8 @@ Covers experiments, registered models, prompts, scorers (direct + pattern varian
 Scorer and prompt tests in test_user_permissions.py are not duplicated here.
 """
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -26,41 +27,74 @@ USER_BASE = "/api/2.0/mlflow/permissions/users"
 # Module path for patching imports at the router module level
 _UP = "mlflow_oidc_auth.routers.user_permissions"
 
+# Routes for user@example.com, the target user of every CRUD test below.
+EXPERIMENT_URL = f"{USER_BASE}/user@example.com/experiments/exp-1"
+EXPERIMENT_PATTERNS_URL = f"{USER_BASE}/user@example.com/experiment-patterns"
+REGISTERED_MODEL_URL = f"{USER_BASE}/user@example.com/registered-models/my-model"
+REGISTERED_MODEL_PATTERNS_URL = f"{USER_BASE}/user@example.com/registered-models-patterns"
+PROMPT_URL = f"{USER_BASE}/user@example.com/prompts/my-prompt"
+PROMPT_PATTERNS_URL = f"{USER_BASE}/user@example.com/prompts-patterns"
+SCORER_URL = f"{USER_BASE}/user@example.com/scorers/1/s1"
+SCORER_PATTERNS_URL = f"{USER_BASE}/user@example.com/scorer-patterns"
+
+# Store results for the pattern tests; the router only reads them.
+REGISTERED_MODEL_PATTERN = RegisteredModelRegexPermissionEntity(id_=1, regex="model-.*", priority=1, user_id=2, permission="READ")
+REGISTERED_MODEL_PATTERN_UPDATED = RegisteredModelRegexPermissionEntity(id_=1, regex="new-.*", priority=2, user_id=2, permission="MANAGE")
+PROMPT_PATTERN = RegisteredModelRegexPermissionEntity(id_=1, regex="prompt-.*", priority=1, user_id=2, permission="READ", prompt=True)
+PROMPT_PATTERN_UPDATED = RegisteredModelRegexPermissionEntity(id_=1, regex="new-.*", priority=2, user_id=2, permission="MANAGE", prompt=True)
+
+
+# Read-only stand-ins for the admin list endpoints.
+_ADMIN_LIST_TRACKING_STORE = SimpleNamespace(search_experiments=lambda *args, **kwargs: [SimpleNamespace(experiment_id="123", name="Test Exp")])
+_ADMIN_EXPERIMENT_PERMS = {"123": SimpleNamespace(permission=SimpleNamespace(name="MANAGE"), kind="user")}
+_ADMIN_LIST_MODEL = SimpleNamespace(name="my-model")
+_ADMIN_MODEL_PERMS = {"my-model": SimpleNamespace(permission=SimpleNamespace(name="READ"), kind="user")}
+
+
+def _json_entity(**fields) -> SimpleNamespace:
+    """Create a stand-in store entity whose to_json() returns ``fields``."""
+    return SimpleNamespace(to_json=lambda: dict(fields))
+
+
+# Scorer store results; to_json() hands the router a fresh dict each call.
+SCORER_PERMISSION = _json_entity(experiment_id="1", scorer_name="s1", user_id=2, permission="READ")
+SCORER_PATTERN = _json_entity(id=1, regex=".*", priority=1, user_id=2, permission="READ")
+SCORER_PATTERN_UPDATED = _json_entity(id=1, regex="new-.*", priority=2, user_id=2, permission="MANAGE")
+
+
+def _ok_or_db_error(status_code: int):
+    """Run a test once with the store call succeeding and once with it raising a DB error."""
+    return pytest.mark.parametrize(
+        ("side_effect", "expected_status"),
+        [(None, status_code), (Exception("DB error"), 500)],
+        ids=["ok", "db_error"],
+    )
+
+
+# Shared override for the permission-check dependencies. test_app clears the
+# overrides on teardown, so the fixtures below never pop them.
+
+
+async def _always_admin():
+    return "admin@example.com"
+
 
 @pytest.fixture
 def override_admin(test_app):
     """Override admin permission check to always pass."""
-
-    async def always_admin():
-        return "admin@example.com"
-
-    test_app.dependency_overrides[check_admin_permission] = always_admin
-    yield
-    test_app.dependency_overrides.pop(check_admin_permission, None)
+    test_app.dependency_overrides[check_admin_permission] = _always_admin
 
 
 @pytest.fixture
 def override_experiment_manage(test_app):
     """Override experiment manage permission check."""
-
-    async def always_manage():
-        return "admin@example.com"
-
-    test_app.dependency_overrides[check_experiment_manage_permission] = always_manage
-    yield
-    test_app.dependency_overrides.pop(check_experiment_manage_permission, None)
+    test_app.dependency_overrides[check_experiment_manage_permission] = _always_admin
 
 
 @pytest.fixture
 def override_model_manage(test_app):
     """Override registered model manage permission check."""
-
-    async def always_manage():
-        return "admin@example.com"
-
-    test_app.dependency_overrides[check_registered_model_manage_permission] = always_manage
-    yield
-    test_app.dependency_overrides.pop(check_registered_model_manage_permission, None)
+    test_app.dependency_overrides[check_registered_model_manage_permission] = _always_admin
 
 
 # ========================================================================================
@@ -72,26 +106,11 @@ def override_model_manage(test_app):
 class TestUserExperimentList:
     """Tests for get_user_experiment_permissions (list) endpoint."""
 
-    def test_list_experiments_as_admin(self, admin_client, mock_store):
+    def test_list_experiments_as_admin(self, admin_client, mock_store, monkeypatch):
         """Admin sees all experiments with permissions."""
-        mock_exp = MagicMock()
-        mock_exp.experiment_id = "123"
-        mock_exp.name = "Test Exp"
-
-        perm_result = MagicMock()
-        perm_result.permission.name = "MANAGE"
-        perm_result.kind = "user"
-        mock_permissions_map = {"123": perm_result}
-
-        with (
-            patch(f"{_UP}._get_tracking_store") as mock_ts,
-            patch(
-                f"{_UP}.batch_resolve_experiment_permissions",
-                return_value=mock_permissions_map,
-            ),
-        ):
-            mock_ts.return_value.search_experiments.return_value = [mock_exp]
-            resp = admin_client.get(f"{USER_BASE}/user@example.com/experiments")
+        monkeypatch.setattr(f"{_UP}._get_tracking_store", lambda: _ADMIN_LIST_TRACKING_STORE)
+        monkeypatch.setattr(f"{_UP}.batch_resolve_experiment_permissions", lambda *args, **kwargs: _ADMIN_EXPERIMENT_PERMS)
+        resp = admin_client.get(f"{USER_BASE}/user@example.com/experiments")
         assert resp.status_code == 200
         body = resp.json()
         assert len(body) == 1
@@ -106,7 +125,7 @@ class TestUserExperimentCRUD:
     def test_create(self, authenticated_client, mock_store):
         """Test creating experiment permission for a user."""
         resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/experiments/exp-1",
+            EXPERIMENT_URL,
             json={"permission": "READ"},
         )
         assert resp.status_code == 200
@@ -116,14 +135,14 @@ class TestUserExperimentCRUD:
         """Test getting experiment permission for a user."""
         ep = ExperimentPermissionEntity(experiment_id="exp-1", permission="READ", user_id=2)
         mock_store.get_experiment_permission.return_value = ep
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/experiments/exp-1")
+        resp = authenticated_client.get(EXPERIMENT_URL)
         assert resp.status_code == 200
         assert resp.json()["experiment_permission"]["experiment_id"] == "exp-1"
 
     def test_update(self, authenticated_client, mock_store):
         """Test updating experiment permission for a user."""
         resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/experiments/exp-1",
+            EXPERIMENT_URL,
             json={"permission": "EDIT"},
         )
         assert resp.status_code == 200
@@ -131,7 +150,7 @@ class TestUserExperimentCRUD:
 
     def test_delete(self, authenticated_client, mock_store):
         """Test deleting experiment permission for a user."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/experiments/exp-1")
+        resp = authenticated_client.delete(EXPERIMENT_URL)
         assert resp.status_code == 200
         mock_store.delete_experiment_permission.assert_called_once()
 
@@ -153,7 +172,7 @@ class TestUserExperimentPatterns:
         perm.priority = 1
         perm.permission = "READ"
         mock_store.list_experiment_regex_permissions.return_value = [perm]
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/experiment-patterns")
+        resp = authenticated_client.get(EXPERIMENT_PATTERNS_URL)
         assert resp.status_code == 200
         body = resp.json()
         assert len(body) == 1
@@ -162,27 +181,20 @@ class TestUserExperimentPatterns:
     def test_list_error(self, authenticated_client, mock_store):
         """Test error handling for list."""
         mock_store.list_experiment_regex_permissions.side_effect = Exception("DB error")
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/experiment-patterns")
+        resp = authenticated_client.get(EXPERIMENT_PATTERNS_URL)
         assert resp.status_code == 500
 
-    def test_create(self, authenticated_client, mock_store):
+    @_ok_or_db_error(201)
+    def test_create(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test creating experiment regex permission."""
+        mock_store.create_experiment_regex_permission.side_effect = side_effect
         resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/experiment-patterns",
+            EXPERIMENT_PATTERNS_URL,
             json={"regex": "exp-.*", "priority": 1, "permission": "READ"},
         )
-        assert resp.status_code == 201
+        assert resp.status_code == expected_status
         mock_store.create_experiment_regex_permission.assert_called_once()
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_experiment_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/experiment-patterns",
-            json={"regex": "exp-.*", "priority": 1, "permission": "READ"},
-        )
-        assert resp.status_code == 500
-
     def test_get(self, authenticated_client, mock_store):
         """Test getting a specific experiment regex permission."""
         perm = MagicMock()
@@ -191,63 +203,34 @@ class TestUserExperimentPatterns:
         perm.priority = 1
         perm.permission = "READ"
         mock_store.get_experiment_regex_permission.return_value = perm
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/experiment-patterns/1")
+        resp = authenticated_client.get(f"{EXPERIMENT_PATTERNS_URL}/1")
         assert resp.status_code == 200
 
-    def test_get_invalid_id(self, authenticated_client, mock_store):
-        """Test getting with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/experiment-patterns/abc")
-        assert resp.status_code == 400
-
     def test_get_not_found(self, authenticated_client, mock_store):
         """Test getting non-existent pattern."""
         mock_store.get_experiment_regex_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/experiment-patterns/1")
+        resp = authenticated_client.get(f"{EXPERIMENT_PATTERNS_URL}/1")
         assert resp.status_code == 404
 
-    def test_update(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_update(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test updating experiment regex permission."""
+        mock_store.update_experiment_regex_permission.side_effect = side_effect
         resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/experiment-patterns/1",
+            f"{EXPERIMENT_PATTERNS_URL}/1",
             json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
         )
-        assert resp.status_code == 200
+        assert resp.status_code == expected_status
         mock_store.update_experiment_regex_permission.assert_called_once()
 
-    def test_update_invalid_id(self, authenticated_client, mock_store):
-        """Test updating with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/experiment-patterns/abc",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 400
-
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_experiment_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/experiment-patterns/1",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 500
-
-    def test_delete(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_delete(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test deleting experiment regex permission."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/experiment-patterns/1")
-        assert resp.status_code == 200
+        mock_store.delete_experiment_regex_permission.side_effect = side_effect
+        resp = authenticated_client.delete(f"{EXPERIMENT_PATTERNS_URL}/1")
+        assert resp.status_code == expected_status
         mock_store.delete_experiment_regex_permission.assert_called_once()
 
-    def test_delete_invalid_id(self, authenticated_client, mock_store):
-        """Test deleting with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/experiment-patterns/abc")
-        assert resp.status_code == 400
-
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_experiment_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/experiment-patterns/1")
-        assert resp.status_code == 500
-
 
 # ========================================================================================
 # USER REGISTERED MODEL PERMISSIONS
@@ -258,24 +241,11 @@ class TestUserExperimentPatterns:
 class TestUserRegisteredModelList:
     """Tests for get_user_registered_models (list) endpoint."""
 
-    def test_list_models_as_admin(self, admin_client, mock_store):
+    def test_list_models_as_admin(self, admin_client, mock_store, monkeypatch):
         """Admin sees all registered models with permissions."""
-        mock_model = MagicMock()
-        mock_model.name = "my-model"
-
-        perm_result = MagicMock()
-        perm_result.permission.name = "READ"
-        perm_result.kind = "user"
-        mock_permissions_map = {"my-model": perm_result}
-
-        with (
-            patch(f"{_UP}.fetch_all_registered_models", return_value=[mock_model]),
-            patch(
-                f"{_UP}.batch_resolve_model_permissions",
-                return_value=mock_permissions_map,
-            ),
-        ):
-            resp = admin_client.get(f"{USER_BASE}/user@example.com/registered-models")
+        monkeypatch.setattr(f"{_UP}.fetch_all_registered_models", lambda *args, **kwargs: [_ADMIN_LIST_MODEL])
+        monkeypatch.setattr(f"{_UP}.batch_resolve_model_permissions", lambda *args, **kwargs: _ADMIN_MODEL_PERMS)
+        resp = admin_client.get(f"{USER_BASE}/user@example.com/registered-models")
         assert resp.status_code == 200
         body = resp.json()
         assert len(body) == 1
@@ -287,68 +257,50 @@ class TestUserRegisteredModelList:
 class TestUserRegisteredModelCRUD:
     """Tests for create/get/update/delete user registered model permissions."""
 
-    def test_create(self, authenticated_client, mock_store):
+    @_ok_or_db_error(201)
+    def test_create(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test creating registered model permission for a user."""
+        mock_store.create_registered_model_permission.side_effect = side_effect
         resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/registered-models/my-model",
+            REGISTERED_MODEL_URL,
             json={"permission": "READ"},
         )
-        assert resp.status_code == 201
+        assert resp.status_code == expected_status
         mock_store.create_registered_model_permission.assert_called_once()
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_registered_model_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/registered-models/my-model",
-            json={"permission": "READ"},
-        )
-        assert resp.status_code == 500
-
     def test_get(self, authenticated_client, mock_store):
         """Test getting registered model permission for a user."""
         rmp = RegisteredModelPermissionEntity(name="my-model", permission="READ", user_id=2)
         mock_store.get_registered_model_permission.return_value = rmp
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/registered-models/my-model")
+        resp = authenticated_client.get(REGISTERED_MODEL_URL)
         assert resp.status_code == 200
         assert resp.json()["registered_model_permission"]["name"] == "my-model"
 
     def test_get_not_found(self, authenticated_client, mock_store):
         """Test getting non-existent permission."""
         mock_store.get_registered_model_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/registered-models/my-model")
+        resp = authenticated_client.get(REGISTERED_MODEL_URL)
         assert resp.status_code == 404
 
-    def test_update(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_update(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test updating registered model permission for a user."""
+        mock_store.update_registered_model_permission.side_effect = side_effect
         resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/registered-models/my-model",
+            REGISTERED_MODEL_URL,
             json={"permission": "EDIT"},
         )
-        assert resp.status_code == 200
+        assert resp.status_code == expected_status
         mock_store.update_registered_model_permission.assert_called_once()
 
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_registered_model_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/registered-models/my-model",
-            json={"permission": "EDIT"},
-        )
-        assert resp.status_code == 500
-
-    def test_delete(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_delete(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test deleting registered model permission for a user."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/registered-models/my-model")
-        assert resp.status_code == 200
+        mock_store.delete_registered_model_permission.side_effect = side_effect
+        resp = authenticated_client.delete(REGISTERED_MODEL_URL)
+        assert resp.status_code == expected_status
         mock_store.delete_registered_model_permission.assert_called_once()
 
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_registered_model_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/registered-models/my-model")
-        assert resp.status_code == 500
-
 
 # ========================================================================================
 # USER REGISTERED MODEL PATTERN PERMISSIONS
@@ -361,9 +313,8 @@ class TestUserRegisteredModelPatterns:
 
     def test_list(self, authenticated_client, mock_store):
         """Test listing registered model regex permissions."""
-        rmp = RegisteredModelRegexPermissionEntity(id_=1, regex="model-.*", priority=1, user_id=2, permission="READ")
-        mock_store.list_registered_model_regex_permissions.return_value = [rmp]
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/registered-models-patterns")
+        mock_store.list_registered_model_regex_permissions.return_value = [REGISTERED_MODEL_PATTERN]
+        resp = authenticated_client.get(REGISTERED_MODEL_PATTERNS_URL)
         assert resp.status_code == 200
         body = resp.json()
         assert len(body) == 1
@@ -372,87 +323,49 @@ class TestUserRegisteredModelPatterns:
     def test_list_error(self, authenticated_client, mock_store):
         """Test error handling for list."""
         mock_store.list_registered_model_regex_permissions.side_effect = Exception("DB error")
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/registered-models-patterns")
+        resp = authenticated_client.get(REGISTERED_MODEL_PATTERNS_URL)
         assert resp.status_code == 500
 
-    def test_create(self, authenticated_client, mock_store):
+    @_ok_or_db_error(201)
+    def test_create(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test creating registered model regex permission."""
+        mock_store.create_registered_model_regex_permission.side_effect = side_effect
         resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/registered-models-patterns",
+            REGISTERED_MODEL_PATTERNS_URL,
             json={"regex": "model-.*", "priority": 1, "permission": "READ"},
         )
-        assert resp.status_code == 201
+        assert resp.status_code == expected_status
         mock_store.create_registered_model_regex_permission.assert_called_once()
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_registered_model_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/registered-models-patterns",
-            json={"regex": "model-.*", "priority": 1, "permission": "READ"},
-        )
-        assert resp.status_code == 500
-
     def test_get(self, authenticated_client, mock_store):
         """Test getting a specific registered model regex permission."""
-        rmp = RegisteredModelRegexPermissionEntity(id_=1, regex="model-.*", priority=1, user_id=2, permission="READ")
-        mock_store.get_registered_model_regex_permission.return_value = rmp
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/registered-models-patterns/1")
+        mock_store.get_registered_model_regex_permission.return_value = REGISTERED_MODEL_PATTERN
+        resp = authenticated_client.get(f"{REGISTERED_MODEL_PATTERNS_URL}/1")
         assert resp.status_code == 200
 
-    def test_get_invalid_id(self, authenticated_client, mock_store):
-        """Test getting with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/registered-models-patterns/abc")
-        assert resp.status_code == 400
-
     def test_get_not_found(self, authenticated_client, mock_store):
         """Test getting non-existent pattern."""
         mock_store.get_registered_model_regex_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/registered-models-patterns/1")
+        resp = authenticated_client.get(f"{REGISTERED_MODEL_PATTERNS_URL}/1")
         assert resp.status_code == 404
 
-    def test_update(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_update(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test updating registered model regex permission."""
-        rmp = RegisteredModelRegexPermissionEntity(id_=1, regex="new-.*", priority=2, user_id=2, permission="MANAGE")
-        mock_store.update_registered_model_regex_permission.return_value = rmp
+        mock_store.update_registered_model_regex_permission.return_value = REGISTERED_MODEL_PATTERN_UPDATED
+        mock_store.update_registered_model_regex_permission.side_effect = side_effect
         resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/registered-models-patterns/1",
+            f"{REGISTERED_MODEL_PATTERNS_URL}/1",
             json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
         )
-        assert resp.status_code == 200
+        assert resp.status_code == expected_status
 
-    def test_update_invalid_id(self, authenticated_client, mock_store):
-        """Test updating with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/registered-models-patterns/abc",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 400
-
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_registered_model_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/registered-models-patterns/1",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 500
-
-    def test_delete(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_delete(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test deleting registered model regex permission."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/registered-models-patterns/1")
-        assert resp.status_code == 200
-
-    def test_delete_invalid_id(self, authenticated_client, mock_store):
-        """Test deleting with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/registered-models-patterns/abc")
-        assert resp.status_code == 400
-
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_registered_model_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/registered-models-patterns/1")
-        assert resp.status_code == 500
+        mock_store.delete_registered_model_regex_permission.side_effect = side_effect
+        resp = authenticated_client.delete(f"{REGISTERED_MODEL_PATTERNS_URL}/1")
+        assert resp.status_code == expected_status
 
 
 # ========================================================================================
@@ -464,42 +377,31 @@ class TestUserRegisteredModelPatterns:
 class TestUserPromptCRUD:
     """Tests for create/update/delete user prompt permissions."""
 
-    def test_create(self, authenticated_client, mock_store):
+    @_ok_or_db_error(201)
+    def test_create(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test creating prompt permission for a user."""
+        mock_store.create_registered_model_permission.side_effect = side_effect
         resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/prompts/my-prompt",
+            PROMPT_URL,
             json={"permission": "READ"},
         )
-        assert resp.status_code == 201
+        assert resp.status_code == expected_status
         mock_store.create_registered_model_permission.assert_called_once()
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_registered_model_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/prompts/my-prompt",
-            json={"permission": "READ"},
-        )
-        assert resp.status_code == 500
-
     def test_update(self, authenticated_client, mock_store):
         """Test updating prompt permission for a user."""
         resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/prompts/my-prompt",
+            PROMPT_URL,
             json={"permission": "EDIT"},
         )
         assert resp.status_code == 200
 
-    def test_delete(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_delete(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test deleting prompt permission for a user."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/prompts/my-prompt")
-        assert resp.status_code == 200
-
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_registered_model_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/prompts/my-prompt")
-        assert resp.status_code == 500
+        mock_store.delete_registered_model_permission.side_effect = side_effect
+        resp = authenticated_client.delete(PROMPT_URL)
+        assert resp.status_code == expected_status
 
 
 # ========================================================================================
@@ -511,98 +413,46 @@ class TestUserPromptCRUD:
 class TestUserPromptPatterns:
     """Tests for user prompt regex/pattern permission CRUD."""
 
-    def test_create(self, authenticated_client, mock_store):
+    @_ok_or_db_error(201)
+    def test_create(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test creating prompt regex permission."""
+        mock_store.create_prompt_regex_permission.side_effect = side_effect
         resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/prompts-patterns",
+            PROMPT_PATTERNS_URL,
             json={"regex": "prompt-.*", "priority": 1, "permission": "READ"},
         )
-        assert resp.status_code == 201
+        assert resp.status_code == expected_status
         mock_store.create_prompt_regex_permission.assert_called_once()
 
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_prompt_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/prompts-patterns",
-            json={"regex": "prompt-.*", "priority": 1, "permission": "READ"},
-        )
-        assert resp.status_code == 500
-
     def test_get(self, authenticated_client, mock_store):
         """Test getting a specific prompt regex permission."""
-        rmp = RegisteredModelRegexPermissionEntity(
-            id_=1,
-            regex="prompt-.*",
-            priority=1,
-            user_id=2,
-            permission="READ",
-            prompt=True,
-        )
-        mock_store.get_prompt_regex_permission.return_value = rmp
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/prompts-patterns/1")
+        mock_store.get_prompt_regex_permission.return_value = PROMPT_PATTERN
+        resp = authenticated_client.get(f"{PROMPT_PATTERNS_URL}/1")
         assert resp.status_code == 200
 
-    def test_get_invalid_id(self, authenticated_client, mock_store):
-        """Test getting with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/prompts-patterns/abc")
-        assert resp.status_code == 400
-
     def test_get_not_found(self, authenticated_client, mock_store):
         """Test getting non-existent pattern."""
         mock_store.get_prompt_regex_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/prompts-patterns/1")
+        resp = authenticated_client.get(f"{PROMPT_PATTERNS_URL}/1")
         assert resp.status_code == 404
 
-    def test_update(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_update(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test updating prompt regex permission."""
-        rmp = RegisteredModelRegexPermissionEntity(
-            id_=1,
-            regex="new-.*",
-            priority=2,
-            user_id=2,
-            permission="MANAGE",
-            prompt=True,
-        )
-        mock_store.update_prompt_regex_permission.return_value = rmp
+        mock_store.update_prompt_regex_permission.return_value = PROMPT_PATTERN_UPDATED
+        mock_store.update_prompt_regex_permission.side_effect = side_effect
         resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/prompts-patterns/1",
+            f"{PROMPT_PATTERNS_URL}/1",
             json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
         )
-        assert resp.status_code == 200
+        assert resp.status_code == expected_status
 
-    def test_update_invalid_id(self, authenticated_client, mock_store):
-        """Test updating with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/prompts-patterns/abc",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 400
-
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_prompt_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/prompts-patterns/1",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 500
-
-    def test_delete(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_delete(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test deleting prompt regex permission."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/prompts-patterns/1")
-        assert resp.status_code == 200
-
-    def test_delete_invalid_id(self, authenticated_client, mock_store):
-        """Test deleting with invalid (non-integer) pattern ID."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/prompts-patterns/abc")
-        assert resp.status_code == 400
-
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_prompt_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/prompts-patterns/1")
-        assert resp.status_code == 500
+        mock_store.delete_prompt_regex_permission.side_effect = side_effect
+        resp = authenticated_client.delete(f"{PROMPT_PATTERNS_URL}/1")
+        assert resp.status_code == expected_status
 
 
 # ========================================================================================
@@ -614,67 +464,41 @@ class TestUserPromptPatterns:
 class TestUserScorerCRUD:
     """Tests for create/get/update/delete user scorer permissions."""
 
-    def test_create(self, authenticated_client, mock_store):
+    @_ok_or_db_error(201)
+    def test_create(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test creating scorer permission for a user."""
-        sp = MagicMock()
-        sp.to_json.return_value = {
-            "experiment_id": "1",
-            "scorer_name": "s1",
-            "user_id": 2,
-            "permission": "READ",
-        }
-        mock_store.create_scorer_permission.return_value = sp
-        resp = authenticated_client.post(f"{USER_BASE}/user@example.com/scorers/1/s1", json={"permission": "READ"})
-        assert resp.status_code == 201
-
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_scorer_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(f"{USER_BASE}/user@example.com/scorers/1/s1", json={"permission": "READ"})
-        assert resp.status_code == 500
+        mock_store.create_scorer_permission.return_value = SCORER_PERMISSION
+        mock_store.create_scorer_permission.side_effect = side_effect
+        resp = authenticated_client.post(SCORER_URL, json={"permission": "READ"})
+        assert resp.status_code == expected_status
 
     def test_get(self, authenticated_client, mock_store):
         """Test getting scorer permission for a user."""
-        sp = MagicMock()
-        sp.to_json.return_value = {
-            "experiment_id": "1",
-            "scorer_name": "s1",
-            "user_id": 2,
-            "permission": "READ",
-        }
-        mock_store.get_scorer_permission.return_value = sp
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/scorers/1/s1")
+        mock_store.get_scorer_permission.return_value = SCORER_PERMISSION
+        resp = authenticated_client.get(SCORER_URL)
         assert resp.status_code == 200
 
     def test_get_not_found(self, authenticated_client, mock_store):
         """Test getting non-existent scorer permission."""
         mock_store.get_scorer_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/scorers/1/s1")
+        resp = authenticated_client.get(SCORER_URL)
         assert resp.status_code == 404
 
-    def test_update(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_update(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test updating scorer permission for a user."""
-        resp = authenticated_client.patch(f"{USER_BASE}/user@example.com/scorers/1/s1", json={"permission": "EDIT"})
-        assert resp.status_code == 200
-
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_scorer_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(f"{USER_BASE}/user@example.com/scorers/1/s1", json={"permission": "EDIT"})
-        assert resp.status_code == 500
+        mock_store.update_scorer_permission.side_effect = side_effect
+        resp = authenticated_client.patch(SCORER_URL, json={"permission": "EDIT"})
+        assert resp.status_code == expected_status
 
-    def test_delete(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_delete(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test deleting scorer permission for a user."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/scorers/1/s1")
-        assert resp.status_code == 200
+        mock_store.delete_scorer_permission.side_effect = side_effect
+        resp = authenticated_client.delete(SCORER_URL)
+        assert resp.status_code == expected_status
         mock_store.delete_scorer_permission.assert_called_once()
 
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_scorer_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/scorers/1/s1")
-        assert resp.status_code == 500
-
 
 # ========================================================================================
 # USER SCORER PATTERN PERMISSIONS
@@ -685,86 +509,63 @@ class TestUserScorerCRUD:
 class TestUserScorerPatterns:
     """Tests for user scorer regex/pattern permission CRUD."""
 
-    def test_create(self, authenticated_client, mock_store):
+    @_ok_or_db_error(201)
+    def test_create(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test creating scorer regex permission."""
-        sp = MagicMock()
-        sp.to_json.return_value = {
-            "id": 1,
-            "regex": ".*",
-            "priority": 1,
-            "user_id": 2,
-            "permission": "READ",
-        }
-        mock_store.create_scorer_regex_permission.return_value = sp
+        mock_store.create_scorer_regex_permission.return_value = SCORER_PATTERN
+        mock_store.create_scorer_regex_permission.side_effect = side_effect
         resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/scorer-patterns",
+            SCORER_PATTERNS_URL,
             json={"regex": ".*", "priority": 1, "permission": "READ"},
         )
-        assert resp.status_code == 201
-
-    def test_create_error(self, authenticated_client, mock_store):
-        """Test error handling for create."""
-        mock_store.create_scorer_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.post(
-            f"{USER_BASE}/user@example.com/scorer-patterns",
-            json={"regex": ".*", "priority": 1, "permission": "READ"},
-        )
-        assert resp.status_code == 500
+        assert resp.status_code == expected_status
 
     def test_get(self, authenticated_client, mock_store):
         """Test getting a specific scorer regex permission."""
-        sp = MagicMock()
-        sp.to_json.return_value = {
-            "id": 1,
-            "regex": ".*",
-            "priority": 1,
-            "user_id": 2,
-            "permission": "READ",
-        }
-        mock_store.get_scorer_regex_permission.return_value = sp
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/scorer-patterns/1")
+        mock_store.get_scorer_regex_permission.return_value = SCORER_PATTERN
+        resp = authenticated_client.get(f"{SCORER_PATTERNS_URL}/1")
         assert resp.status_code == 200
 
     def test_get_not_found(self, authenticated_client, mock_store):
         """Test getting non-existent pattern."""
         mock_store.get_scorer_regex_permission.side_effect = Exception("Not found")
-        resp = authenticated_client.get(f"{USER_BASE}/user@example.com/scorer-patterns/1")
+        resp = authenticated_client.get(f"{SCORER_PATTERNS_URL}/1")
         assert resp.status_code == 404
 
-    def test_update(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_update(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test updating scorer regex permission."""
-        sp = MagicMock()
-        sp.to_json.return_value = {
-            "id": 1,
-            "regex": "new-.*",
-            "priority": 2,
-            "user_id": 2,
-            "permission": "MANAGE",
-        }
-        mock_store.update_scorer_regex_permission.return_value = sp
+        mock_store.update_scorer_regex_permission.return_value = SCORER_PATTERN_UPDATED
+        mock_store.update_scorer_regex_permission.side_effect = side_effect
         resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/scorer-patterns/1",
+            f"{SCORER_PATTERNS_URL}/1",
             json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
         )
-        assert resp.status_code == 200
+        assert resp.status_code == expected_status
 
-    def test_update_error(self, authenticated_client, mock_store):
-        """Test error handling for update."""
-        mock_store.update_scorer_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.patch(
-            f"{USER_BASE}/user@example.com/scorer-patterns/1",
-            json={"regex": "new-.*", "priority": 2, "permission": "MANAGE"},
-        )
-        assert resp.status_code == 500
-
-    def test_delete(self, authenticated_client, mock_store):
+    @_ok_or_db_error(200)
+    def test_delete(self, authenticated_client, mock_store, side_effect, expected_status):
         """Test deleting scorer regex permission."""
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/scorer-patterns/1")
-        assert resp.status_code == 200
+        mock_store.delete_scorer_regex_permission.side_effect = side_effect
+        resp = authenticated_client.delete(f"{SCORER_PATTERNS_URL}/1")
+        assert resp.status_code == expected_status
         mock_store.delete_scorer_regex_permission.assert_called_once()
 
-    def test_delete_error(self, authenticated_client, mock_store):
-        """Test error handling for delete."""
-        mock_store.delete_scorer_regex_permission.side_effect = Exception("DB error")
-        resp = authenticated_client.delete(f"{USER_BASE}/user@example.com/scorer-patterns/1")
-        assert resp.status_code == 500
+
+# ========================================================================================
+# INVALID PATTERN IDS
+# ========================================================================================
+
+
+@pytest.mark.usefixtures("authenticated_session", "override_admin")
+@pytest.mark.parametrize(
+    "patterns_url",
+    [EXPERIMENT_PATTERNS_URL, REGISTERED_MODEL_PATTERNS_URL, PROMPT_PATTERNS_URL],
+    ids=["experiment", "registered_model", "prompt"],
+)
+@pytest.mark.parametrize("method", ["GET", "PATCH", "DELETE"])
+def test_invalid_pattern_id_returns_400(authenticated_client, patterns_url, method):
+    """A non-integer pattern ID is rejected on get, update and delete."""
+    body = {"regex": "new-.*", "priority": 2, "permission": "MANAGE"} if method == "PATCH" else None
+    resp = authenticated_client.request(method, f"{patterns_url}/abc", json=body)
+    assert resp.status_code == 400
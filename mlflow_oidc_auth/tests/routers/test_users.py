@@ -88,7 +88,7 @@ class TestListUsersEndpoint:
         with patch("mlflow_oidc_auth.store.store", mock_store):
             result = await list_users(username="test@example.com")
 
-        assert isinstance(result.body, bytes)
+        assert result == ["alice@example.com", "bob@example.com"]
         # Verify store was called with correct parameters
         mock_store.list_usernames.assert_called_once_with(is_service_account=False)
 
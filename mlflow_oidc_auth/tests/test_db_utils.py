@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 from tempfile import mkstemp
@@ -17,6 +18,44 @@ from mlflow_oidc_auth.db.utils import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _restore_logging():
+    """Undo the logging changes a real migration makes.
+
+    The migration env calls fileConfig(), which disables every logger that already
+    exists and replaces the root handlers; later tests rely on caplog and logger mocks.
+    """
+    loggers = [logging.getLogger(), *(logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger))]
+    saved = [(logger, logger.disabled, logger.level, list(logger.handlers)) for logger in loggers]
+    yield
+    for logger, disabled, level, handlers in saved:
+        logger.disabled = disabled
+        logger.setLevel(level)
+        logger.handlers[:] = handlers
+
+
+@pytest.fixture
+def fresh_config_module():
+    """Make the migration env import mlflow_oidc_auth.config anew, then drop that copy.
+
+    The original module is put back if one was loaded; otherwise the re-imported one is
+    removed so later tests import config with their own environment.
+    """
+    import mlflow_oidc_auth
+
+    original_config = sys.modules.pop("mlflow_oidc_auth.config", None)
+    original_attr = getattr(mlflow_oidc_auth, "config", None)
+    yield
+    if original_config is not None:
+        sys.modules["mlflow_oidc_auth.config"] = original_config
+    else:
+        sys.modules.pop("mlflow_oidc_auth.config", None)
+    if original_attr is not None:
+        mlflow_oidc_auth.config = original_attr
+    elif hasattr(mlflow_oidc_auth, "config"):
+        del mlflow_oidc_auth.config
+
+
 class TestPrivateFunctions:
     """Test private utility functions."""
 
@@ -223,13 +262,10 @@ class TestMigrate:
         assert args[1] == target_revision
 
 
+@pytest.mark.usefixtures("fresh_config_module")
 class TestModifiedVersionTable:
     @patch.dict(os.environ, {"OIDC_ALEMBIC_VERSION_TABLE": "alembic_modified_version"})
     def test_different_alembic_version_table(self):
-        # Force reload of the config module
-        if "mlflow_oidc_auth.config" in sys.modules:
-            del sys.modules["mlflow_oidc_auth.config"]
-
         # Create temporary file
         _, db_file = mkstemp()
 
@@ -255,12 +291,9 @@ class TestModifiedVersionTable:
         assert "alembic_version" not in tables
 
 
+@pytest.mark.usefixtures("fresh_config_module")
 class TestDefaultVersionTable:
     def test_default_alembic_table(self):
-        # Force reload of the config module
-        if "mlflow_oidc_auth.config" in sys.modules:
-            del sys.modules["mlflow_oidc_auth.config"]
-
         # Create temporary file
         _, db_file = mkstemp()
 
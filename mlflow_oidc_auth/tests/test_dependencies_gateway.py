@@ -1,10 +1,9 @@
 """Tests for FastAPI dependency functions — gateway permission checks."""
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 from fastapi import FastAPI
 
+import mlflow_oidc_auth.utils.permissions as permissions
 from mlflow_oidc_auth.dependencies import (
     check_gateway_endpoint_manage_permission,
     check_gateway_model_definition_manage_permission,
@@ -35,6 +34,20 @@ def _build_test_app() -> FastAPI:
     return app
 
 
+@pytest.fixture
+def can_manage(monkeypatch):
+    """Return a setter that fixes a ``can_manage_gateway_*`` check to a constant answer.
+
+    The dependencies import the check from ``mlflow_oidc_auth.utils.permissions`` at call
+    time, so a plain attribute swap on that module is enough; no mock is needed.
+    """
+
+    def _set(check_name: str, allowed: bool) -> None:
+        monkeypatch.setattr(permissions, check_name, lambda *args, **kwargs: allowed)
+
+    return _set
+
+
 # ---------------------------------------------------------------------------
 # check_gateway_endpoint_manage_permission
 # ---------------------------------------------------------------------------
@@ -44,60 +57,44 @@ class TestCheckGatewayEndpointManagePermission:
     """Tests for check_gateway_endpoint_manage_permission dependency."""
 
     @pytest.mark.anyio
-    async def test_allows_admin(self) -> None:
+    async def test_allows_admin(self, can_manage) -> None:
         """Admin should be allowed regardless of can_manage result."""
-        with patch(
-            "mlflow_oidc_auth.dependencies.get_username",
-            new_callable=AsyncMock,
-            return_value="admin@example.com",
-        ):
-            with patch(
-                "mlflow_oidc_auth.dependencies.get_is_admin",
-                new_callable=AsyncMock,
-                return_value=True,
-            ):
-                with patch(
-                    "mlflow_oidc_auth.utils.permissions.can_manage_gateway_endpoint",
-                    return_value=False,
-                ):
-                    result = await check_gateway_endpoint_manage_permission(
-                        name="ep-1",
-                        current_username="admin@example.com",
-                        is_admin=True,
-                    )
+        can_manage("can_manage_gateway_endpoint", False)
+
+        result = await check_gateway_endpoint_manage_permission(
+            name="ep-1",
+            current_username="admin@example.com",
+            is_admin=True,
+        )
 
         assert result is None
 
     @pytest.mark.anyio
-    async def test_allows_user_with_manage_permission(self) -> None:
+    async def test_allows_user_with_manage_permission(self, can_manage) -> None:
         """Non-admin with manage permission should be allowed."""
-        with patch(
-            "mlflow_oidc_auth.utils.permissions.can_manage_gateway_endpoint",
-            return_value=True,
-        ):
-            result = await check_gateway_endpoint_manage_permission(
-                name="ep-1",
-                current_username="user@example.com",
-                is_admin=False,
-            )
+        can_manage("can_manage_gateway_endpoint", True)
+
+        result = await check_gateway_endpoint_manage_permission(
+            name="ep-1",
+            current_username="user@example.com",
+            is_admin=False,
+        )
 
         assert result is None
 
     @pytest.mark.anyio
-    async def test_denies_user_without_manage_permission(self) -> None:
+    async def test_denies_user_without_manage_permission(self, can_manage) -> None:
         """Non-admin without manage permission should be denied."""
         from fastapi import HTTPException
 
-        with patch(
-            "mlflow_oidc_auth.utils.permissions.can_manage_gateway_endpoint",
-            return_value=False,
-        ):
-            with pytest.raises(HTTPException) as exc_info:
-                await check_gateway_endpoint_manage_permission(
-                    name="ep-1",
-                    current_username="user@example.com",
-                    is_admin=False,
-                )
+        can_manage("can_manage_gateway_endpoint", False)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await check_gateway_endpoint_manage_permission(
+                name="ep-1",
+                current_username="user@example.com",
+                is_admin=False,
+            )
 
         assert exc_info.value.status_code == 403
         assert "endpoint" in exc_info.value.detail.lower()
@@ -122,35 +119,31 @@ class TestCheckGatewaySecretManagePermission:
         assert result is None
 
     @pytest.mark.anyio
-    async def test_allows_user_with_manage_permission(self) -> None:
+    async def test_allows_user_with_manage_permission(self, can_manage) -> None:
         """Non-admin with manage permission should be allowed."""
-        with patch(
-            "mlflow_oidc_auth.utils.permissions.can_manage_gateway_secret",
-            return_value=True,
-        ):
-            result = await check_gateway_secret_manage_permission(
-                name="secret-1",
-                current_username="user@example.com",
-                is_admin=False,
-            )
+        can_manage("can_manage_gateway_secret", True)
+
+        result = await check_gateway_secret_manage_permission(
+            name="secret-1",
+            current_username="user@example.com",
+            is_admin=False,
+        )
 
         assert result is None
 
     @pytest.mark.anyio
-    async def test_denies_user_without_manage_permission(self) -> None:
+    async def test_denies_user_without_manage_permission(self, can_manage) -> None:
         """Non-admin without manage permission should be denied."""
         from fastapi import HTTPException
 
-        with patch(
-            "mlflow_oidc_auth.utils.permissions.can_manage_gateway_secret",
-            return_value=False,
-        ):
-            with pytest.raises(HTTPException) as exc_info:
-                await check_gateway_secret_manage_permission(
-                    name="secret-1",
-                    current_username="user@example.com",
-                    is_admin=False,
-                )
+        can_manage("can_manage_gateway_secret", False)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await check_gateway_secret_manage_permission(
+                name="secret-1",
+                current_username="user@example.com",
+                is_admin=False,
+            )
 
         assert exc_info.value.status_code == 403
         assert "secret" in exc_info.value.detail.lower()
@@ -175,35 +168,31 @@ class TestCheckGatewayModelDefinitionManagePermission:
         assert result is None
 
     @pytest.mark.anyio
-    async def test_allows_user_with_manage_permission(self) -> None:
+    async def test_allows_user_with_manage_permission(self, can_manage) -> None:
         """Non-admin with manage permission should be allowed."""
-        with patch(
-            "mlflow_oidc_auth.utils.permissions.can_manage_gateway_model_definition",
-            return_value=True,
-        ):
-            result = await check_gateway_model_definition_manage_permission(
-                name="model-1",
-                current_username="user@example.com",
-                is_admin=False,
-            )
+        can_manage("can_manage_gateway_model_definition", True)
+
+        result = await check_gateway_model_definition_manage_permission(
+            name="model-1",
+            current_username="user@example.com",
+            is_admin=False,
+        )
 
         assert result is None
 
     @pytest.mark.anyio
-    async def test_denies_user_without_manage_permission(self) -> None:
+    async def test_denies_user_without_manage_permission(self, can_manage) -> None:
         """Non-admin without manage permission should be denied."""
         from fastapi import HTTPException
 
-        with patch(
-            "mlflow_oidc_auth.utils.permissions.can_manage_gateway_model_definition",
-            return_value=False,
-        ):
-            with pytest.raises(HTTPException) as exc_info:
-                await check_gateway_model_definition_manage_permission(
-                    name="model-1",
-                    current_username="user@example.com",
-                    is_admin=False,
-                )
+        can_manage("can_manage_gateway_model_definition", False)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await check_gateway_model_definition_manage_permission(
+                name="model-1",
+                current_username="user@example.com",
+                is_admin=False,
+            )
 
         assert exc_info.value.status_code == 403
         assert "model definition" in exc_info.value.detail.lower()
@@ -10,6 +10,25 @@ import sys
 import unittest
 from unittest.mock import patch
 
+import mlflow_oidc_auth
+
+_RELOADED_MODULES = ("mlflow_oidc_auth.config", "mlflow_oidc_auth.oauth")
+_saved_modules = {}
+
+
+def setUpModule():
+    """Remember the modules these tests evict so later test files see the originals."""
+    for name in _RELOADED_MODULES:
+        __import__(name)
+        _saved_modules[name] = sys.modules[name]
+
+
+def tearDownModule():
+    """Put back the modules and package attributes replaced by re-imports."""
+    for name, module in _saved_modules.items():
+        sys.modules[name] = module
+        setattr(mlflow_oidc_auth, name.rsplit(".", 1)[1], module)
+
 
 class TestOAuthModule(unittest.TestCase):
     """Test the OAuth module functionality."""
@@ -161,6 +161,11 @@ class TestScorerGroupPermissions:
         store_with_mocked_repos.get_user_groups_scorer_permission("exp-1", "accuracy", "alice")
         store_with_mocked_repos.scorer_group_repo.get_group_permission_for_user_scorer.assert_called_once_with("exp-1", "accuracy", "alice")
 
+    def test_list_user_groups(self, store_with_mocked_repos: SqlAlchemyStore) -> None:
+        """Should delegate to scorer_group_repo.list_permissions_for_user_groups."""
+        store_with_mocked_repos.list_user_groups_scorer_permissions("alice")
+        store_with_mocked_repos.scorer_group_repo.list_permissions_for_user_groups.assert_called_once_with("alice")
+
 
 # ---------------------------------------------------------------------------
 # Scorer Regex (User-Scoped) CRUD
@@ -21,6 +21,7 @@ from mlflow_oidc_auth.utils.batch_permissions import (
     filter_manageable_experiments,
     filter_manageable_models,
     filter_manageable_prompts,
+    filter_manageable_scorers,
     _find_regex_permission,
     _resolve_permission_from_context,
 )
@@ -856,6 +857,79 @@ class TestFilterManageableFunctions:
         assert result == []
 
 
+class TestFilterManageableScorers:
+    """Tests for filter_manageable_scorers."""
+
+    @pytest.fixture
+    def scorer_store(self):
+        with (
+            patch("mlflow_oidc_auth.utils.batch_permissions.store") as mock_store,
+            patch("mlflow_oidc_auth.utils.batch_permissions.config") as mock_config,
+        ):
+            mock_config.PERMISSION_SOURCE_ORDER = ["user", "group", "regex", "group-regex"]
+            mock_config.DEFAULT_MLFLOW_PERMISSION = "READ"
+            mock_config.MLFLOW_ENABLE_WORKSPACES = False
+            mock_store.list_scorer_permissions.return_value = []
+            mock_store.list_user_groups_scorer_permissions.return_value = []
+            mock_store.list_scorer_regex_permissions.return_value = []
+            mock_store.get_groups_ids_for_user.return_value = []
+            yield mock_store
+
+    @staticmethod
+    def _scorers(*names):
+        return [MagicMock(scorer_name=name) for name in names]
+
+    @staticmethod
+    def _perm(experiment_id, scorer_name, permission):
+        return MagicMock(experiment_id=experiment_id, scorer_name=scorer_name, permission=permission)
+
+    def test_filters_by_user_permission_in_experiment(self, scorer_store):
+        """Should keep scorers with a MANAGE grant for the requested experiment only."""
+        alpha, beta, gamma = self._scorers("alpha", "beta", "gamma")
+        scorer_store.list_scorer_permissions.return_value = [
+            self._perm("exp-1", "alpha", "MANAGE"),
+            self._perm("exp-1", "beta", "READ"),
+            self._perm("exp-2", "gamma", "MANAGE"),
+        ]
+
+        result = filter_manageable_scorers("testuser", "exp-1", [alpha, beta, gamma])
+
+        assert result == [alpha]
+        scorer_store.list_scorer_permissions.assert_called_once_with("testuser")
+
+    def test_highest_group_permission_wins(self, scorer_store):
+        """Should use the strongest grant when several groups cover the same scorer."""
+        (alpha,) = self._scorers("alpha")
+        scorer_store.list_user_groups_scorer_permissions.return_value = [
+            self._perm("exp-1", "alpha", "MANAGE"),
+            self._perm("exp-1", "alpha", "READ"),
+        ]
+
+        assert filter_manageable_scorers("testuser", "exp-1", [alpha]) == [alpha]
+
+    def test_regex_permissions(self, scorer_store):
+        """Should resolve user and group regex permissions by scorer name."""
+        alpha, beta, other = self._scorers("alpha", "beta", "other")
+        scorer_store.list_scorer_regex_permissions.return_value = [MagicMock(regex="^alpha$", permission="MANAGE")]
+        scorer_store.get_groups_ids_for_user.return_value = [1]
+        scorer_store.list_group_scorer_regex_permissions_for_groups_ids.return_value = [MagicMock(regex="^be", permission="MANAGE")]
+
+        result = filter_manageable_scorers("testuser", "exp-1", [alpha, beta, other])
+
+        assert result == [alpha, beta]
+        scorer_store.list_group_scorer_regex_permissions_for_groups_ids.assert_called_once_with([1])
+
+    def test_queries_are_independent_of_scorer_count(self, scorer_store):
+        """Should fetch permissions once per source regardless of scorer count."""
+        scorers = self._scorers(*[f"s{i}" for i in range(20)])
+
+        assert filter_manageable_scorers("testuser", "exp-1", scorers) == []
+        scorer_store.list_scorer_permissions.assert_called_once()
+        scorer_store.list_user_groups_scorer_permissions.assert_called_once()
+        scorer_store.list_scorer_regex_permissions.assert_called_once()
+        scorer_store.list_group_scorer_regex_permissions_for_groups_ids.assert_not_called()
+
+
 class TestApplyWorkspaceFallback:
     """Tests for the _apply_workspace_fallback helper function."""
 
@@ -1,7 +1,7 @@
 """Batch permission resolution utilities for efficient bulk permission lookups.
 
 This module provides optimized functions for resolving permissions across multiple
-resources (experiments, models, prompts) in a single operation, minimizing database
+resources (experiments, models, prompts, scorers) in a single operation, minimizing database
 queries compared to per-item permission lookups.
 """
 
@@ -22,7 +22,7 @@ from mlflow_oidc_auth.entities import (
 )
 from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.models import PermissionResult
-from mlflow_oidc_auth.permissions import NO_PERMISSIONS, get_permission
+from mlflow_oidc_auth.permissions import NO_PERMISSIONS, compare_permissions, get_permission
 from mlflow_oidc_auth.store import store
 
 logger = get_logger()
@@ -413,6 +413,50 @@ def filter_manageable_prompts(username: str, prompts: List) -> List:
     return [prompt for prompt in prompts if permissions[prompt.name].permission.can_manage]
 
 
+def filter_manageable_scorers(username: str, experiment_id: str, scorers: List) -> List:
+    """Filter an experiment's scorers to only those the user can manage.
+
+    The user's scorer permissions are fetched once per source instead of
+    resolving each scorer separately. When several groups grant a permission
+    on the same scorer the highest one wins, as in per-scorer resolution.
+
+    Parameters:
+        username: The user to check permissions for.
+        experiment_id: The experiment owning the scorers.
+        scorers: List of scorer objects with .scorer_name attribute.
+
+    Returns:
+        List of scorers the user can manage.
+    """
+    user_direct = {p.scorer_name: p.permission for p in store.list_scorer_permissions(username) if p.experiment_id == experiment_id}
+
+    group_direct: Dict[str, str] = {}
+    for p in store.list_user_groups_scorer_permissions(username):
+        if p.experiment_id != experiment_id:
+            continue
+        best = group_direct.get(p.scorer_name)
+        if best is None or compare_permissions(best, p.permission):
+            group_direct[p.scorer_name] = p.permission
+
+    user_regexes = store.list_scorer_regex_permissions(username)
+    group_ids = store.get_groups_ids_for_user(username)
+    group_regexes = store.list_group_scorer_regex_permissions_for_groups_ids(group_ids) if group_ids else []
+
+    manageable = []
+    for scorer in scorers:
+        name = scorer.scorer_name
+        result = _resolve_permission_from_context(
+            config.PERMISSION_SOURCE_ORDER,
+            user_direct.get(name),
+            group_direct.get(name),
+            _find_regex_permission(user_regexes, name),
+            _find_regex_permission(group_regexes, name),
+        )
+        if _apply_workspace_fallback(result, username).permission.can_manage:
+            manageable.append(scorer)
+    return manageable
+
+
 def filter_manageable_gateway_endpoints(username: str, endpoints: List) -> List:
     """Filter gateway endpoints to only those the user can manage.
 